@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from asyncio import timeout
+from asyncio import Semaphore, gather, timeout
 from http import HTTPStatus
 import json
 import logging
@@ -24,6 +24,7 @@ from homeassistant.core import (
 )
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.significant_change import create_checker
+from homeassistant.helpers.state_reporter import StateReport, StateReporter
 import homeassistant.util.dt as dt_util
 from homeassistant.util.json import JsonObjectType, json_loads_object
 
@@ -49,9 +50,18 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 10
+# Maximum number of ChangeReport events sent at the same time
+MAX_PARALLEL_CHANGEREPORTS = 5
 
 TO_REDACT = {"correlationToken", "token"}
 
+type AlexaReportData = tuple[AlexaEntity, list[dict[str, Any]]]
+
+
+def _property_key(prop: dict[str, Any]) -> tuple[Any, Any, Any]:
+    """Return the key identifying a reported property."""
+    return (prop.get("namespace"), prop.get("instance"), prop.get("name"))
+
 
 class AlexaDirective:
     """An incoming Alexa directive."""
@@ -271,6 +281,44 @@ async def async_enable_proactive_mode(
 
     checker = await create_checker(hass, DOMAIN, extra_significant_check)
 
+    parallel_changereports = Semaphore(MAX_PARALLEL_CHANGEREPORTS)
+
+    async def _async_send_changereport(report: StateReport[AlexaReportData]) -> bool:
+        """Send a ChangeReport for an entity, return if Alexa accepted it."""
+        alexa_entity, alexa_properties = report.data
+        changed_properties: list[dict[str, Any]] = []
+        context_properties: list[dict[str, Any]] = []
+        for prop in alexa_properties:
+            if _property_key(prop) in report.changed:
+                changed_properties.append(prop)
+            else:
+                context_properties.append(prop)
+        async with parallel_changereports:
+            return await async_send_changereport_message(
+                hass,
+                smart_home_config,
+                alexa_entity,
+                changed_properties,
+                context_properties=context_properties,
+            )
+
+    async def _async_send_changereports(
+        batch: dict[str, StateReport[AlexaReportData]],
+    ) -> set[str]:
+        """Send a ChangeReport per entity, return the entities not delivered."""
+        delivered = await gather(
+            *(_async_send_changereport(report) for report in batch.values())
+        )
+        return {
+            entity_id
+            for entity_id, accepted in zip(batch, delivered, strict=True)
+            if not accepted
+        }
+
+    reporter: StateReporter[AlexaReportData] = StateReporter(
+        hass, _LOGGER, name="Alexa", window=0, send=_async_send_changereports
+    )
+
     @callback
     def _async_entity_state_filter(data: EventStateChangedData) -> bool:
         if not hass.is_running:
@@ -334,16 +382,28 @@ async def async_enable_proactive_mode(
         ):
             return
 
-        await async_send_changereport_message(
-            hass, smart_home_config, alexa_changed_entity, alexa_properties
+        # Only the properties which changed since the last report are sent
+        # as changed, the others are sent as context
+        reporter.async_report(
+            new_state.entity_id,
+            (alexa_changed_entity, alexa_properties),
+            {_property_key(prop): prop.get("value") for prop in alexa_properties},
         )
 
-    return hass.bus.async_listen(
+    unsub = hass.bus.async_listen(
         EVENT_STATE_CHANGED,
         _async_entity_state_listener,
         event_filter=_async_entity_state_filter,
     )
 
+    @callback
+    def _async_unsub() -> None:
+        """Stop reporting states."""
+        unsub()
+        reporter.async_shutdown()
+
+    return _async_unsub
+
 
 async def async_send_changereport_message(
     hass: HomeAssistant,
@@ -351,10 +411,13 @@ async def async_send_changereport_message(
     alexa_entity: AlexaEntity,
     alexa_properties: list[dict[str, Any]],
     *,
+    context_properties: list[dict[str, Any]] | None = None,
     invalidate_access_token: bool = True,
-) -> None:
+) -> bool:
     """Send a ChangeReport message for an Alexa entity.
 
+    Returns True if Alexa accepted the report.
+
     https://developer.amazon.com/docs/smarthome/state-reporting-for-a-smart-home-skill.html#report-state-with-changereport-events
     """
     try:
@@ -364,7 +427,7 @@ async def async_send_changereport_message(
         _LOGGER.error(
             "Error when sending ChangeReport to Alexa, could not get access token"
         )
-        return
+        return False
 
     headers: dict[str, Any] = {"Authorization": f"Bearer {token}"}
 
@@ -379,6 +442,8 @@ async def async_send_changereport_message(
 
     message = AlexaResponse(name="ChangeReport", namespace="Alexa", payload=payload)
     message.set_endpoint_full(token, endpoint)
+    for prop in context_properties or ():
+        message.add_context_property(prop)
 
     message_serialized = message.serialize()
     session = async_get_clientsession(hass)
@@ -395,7 +460,7 @@ async def async_send_changereport_message(
 
     except (TimeoutError, aiohttp.ClientError):
         _LOGGER.error("Timeout sending report to Alexa for %s", alexa_entity.entity_id)
-        return
+        return False
 
     response_text = await response.text()
 
@@ -406,7 +471,18 @@ async def async_send_changereport_message(
         _LOGGER.debug("Received (%s): %s", response.status, response_text)
 
     if response.status == HTTPStatus.ACCEPTED:
-        return
+        return True
+
+    if (
+        response.status == HTTPStatus.TOO_MANY_REQUESTS
+        or response.status >= HTTPStatus.INTERNAL_SERVER_ERROR
+    ):
+        _LOGGER.error(
+            "Error when sending ChangeReport for %s to Alexa: %s",
+            alexa_entity.entity_id,
+            response.status,
+        )
+        return False
 
     response_json = json_loads_object(response_text)
     response_payload = cast(JsonObjectType, response_json["payload"])
@@ -415,14 +491,14 @@ async def async_send_changereport_message(
         if invalidate_access_token:
             # Invalidate the access token and try again
             config.async_invalidate_access_token()
-            await async_send_changereport_message(
+            return await async_send_changereport_message(
                 hass,
                 config,
                 alexa_entity,
                 alexa_properties,
+                context_properties=context_properties,
                 invalidate_access_token=False,
             )
-            return
         await config.set_authorized(False)
 
     _LOGGER.error(
@@ -431,6 +507,7 @@ async def async_send_changereport_message(
         response_payload["code"],
         response_payload["description"],
     )
+    return False
 
 
 async def async_send_add_or_update_message(
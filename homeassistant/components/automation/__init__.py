@@ -14,6 +14,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.blueprint import CONF_USE_BLUEPRINT
+from homeassistant.components.trace import CONF_STORED_TRACES
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -57,6 +58,7 @@ from homeassistant.helpers.issue_registry import (
     async_create_issue,
     async_delete_issue,
 )
+from homeassistant.helpers.reference_index import ReferenceIndex
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -76,6 +78,7 @@ from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_set,
     trace_append_element,
+    trace_cv,
     trace_get,
     trace_path,
 )
@@ -100,6 +103,9 @@ from .helpers import async_get_blueprints
 from .trace import trace_automation
 
 DATA_COMPONENT: HassKey[EntityComponent[BaseAutomationEntity]] = HassKey(DOMAIN)
+DATA_REFERENCES: HassKey[ReferenceIndex[BaseAutomationEntity]] = HassKey(
+    f"{DOMAIN}_references"
+)
 ENTITY_ID_FORMAT = DOMAIN + ".{}"
 
 
@@ -138,13 +144,14 @@ def _automations_with_x(
     hass: HomeAssistant, referenced_id: str, property_name: str
 ) -> list[str]:
     """Return all automations that reference the x."""
-    if DATA_COMPONENT not in hass.data:
+    if DATA_REFERENCES not in hass.data:
         return []
 
     return [
         automation_entity.entity_id
-        for automation_entity in hass.data[DATA_COMPONENT].entities
-        if referenced_id in getattr(automation_entity, property_name)
+        for automation_entity in hass.data[DATA_REFERENCES].async_get(
+            property_name, referenced_id
+        )
     ]
 
 
@@ -224,14 +231,7 @@ def labels_in_automation(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def automations_with_blueprint(hass: HomeAssistant, blueprint_path: str) -> list[str]:
     """Return all automations that reference the blueprint."""
-    if DOMAIN not in hass.data:
-        return []
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in hass.data[DATA_COMPONENT].entities
-        if automation_entity.referenced_blueprint == blueprint_path
-    ]
+    return _automations_with_x(hass, blueprint_path, "referenced_blueprint")
 
 
 @callback
@@ -251,6 +251,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data[DATA_COMPONENT] = component = EntityComponent[BaseAutomationEntity](
         LOGGER, DOMAIN, hass
     )
+    hass.data[DATA_REFERENCES] = ReferenceIndex()
 
     # Register automation as valid domain for Blueprint
     async_get_blueprints(hass)
@@ -377,6 +378,26 @@ class BaseAutomationEntity(ToggleEntity, ABC):
     ) -> ScriptRunResult | None:
         """Trigger automation."""
 
+    async def async_added_to_hass(self) -> None:
+        """Index the items referenced by the automation."""
+        await super().async_added_to_hass()
+        self.hass.data[DATA_REFERENCES].async_add(
+            self,
+            {
+                "referenced_labels": self.referenced_labels,
+                "referenced_floors": self.referenced_floors,
+                "referenced_areas": self.referenced_areas,
+                "referenced_blueprint": (self.referenced_blueprint,),
+                "referenced_devices": self.referenced_devices,
+                "referenced_entities": self.referenced_entities,
+            },
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Remove the automation from the reference index."""
+        await super().async_will_remove_from_hass()
+        self.hass.data[DATA_REFERENCES].async_remove(self)
+
 
 class UnavailableAutomationEntity(BaseAutomationEntity):
     """A non-functional automation entity with its state set to unavailable.
@@ -501,6 +522,10 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
         self._blueprint_inputs = blueprint_inputs
         self._trace_config = trace_config
         self._attr_unique_id = automation_id
+        # Traces of automations without an id can not be looked up
+        self._traces_stored = (
+            automation_id is not None and trace_config[CONF_STORED_TRACES] > 0
+        )
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -683,7 +708,7 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
             if (
                 not skip_condition
                 and self._cond_func is not None
-                and not self._cond_func(variables)
+                and not self._async_check_conditions(self._cond_func, variables)
             ):
                 self._logger.debug(
                     "Conditions not met, aborting automation. Condition summary: %s",
@@ -748,6 +773,23 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
 
             return None
 
+    @callback
+    def _async_check_conditions(
+        self, cond_func: IfAction, variables: dict[str, Any]
+    ) -> bool:
+        """Check the conditions of the automation.
+
+        The conditions are only traced when the trace can be looked up or the
+        condition summary is logged.
+        """
+        if self._traces_stored or self._logger.isEnabledFor(logging.DEBUG):
+            return cond_func(variables)
+        token = trace_cv.set(None)
+        try:
+            return cond_func(variables)
+        finally:
+            trace_cv.reset(token)
+
     async def async_will_remove_from_hass(self) -> None:
         """Remove listeners when removing automation from Home Assistant."""
         await super().async_will_remove_from_hass()
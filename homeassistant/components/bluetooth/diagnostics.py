@@ -11,6 +11,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from .api import _get_manager
+from .passive_update_processor import PASSIVE_UPDATE_PROCESSOR
 
 
 async def async_get_config_entry_diagnostics(
@@ -23,6 +24,10 @@ async def async_get_config_entry_diagnostics(
     diagnostics = {
         "manager": manager_diagnostics,
         "adapters": adapters,
+        "passive_update_processor": {
+            coordinator.address: coordinator.async_diagnostics()
+            for coordinator in hass.data[PASSIVE_UPDATE_PROCESSOR].coordinators
+        },
     }
     if platform.system() == "Linux":
         diagnostics["dbus"] = await get_dbus_managed_objects()
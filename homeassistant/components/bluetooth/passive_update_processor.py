@@ -8,6 +8,7 @@ from functools import cache
 import logging
 from typing import TYPE_CHECKING, Any, Self, TypedDict, cast
 
+from bluetooth_data_tools import monotonic_time_coarse
 from habluetooth import BluetoothScanningMode
 
 from homeassistant import config_entries
@@ -42,6 +43,9 @@ STORAGE_KEY = "bluetooth.passive_update_processor"
 STORAGE_VERSION = 1
 STORAGE_SAVE_INTERVAL = timedelta(minutes=15)
 PASSIVE_UPDATE_PROCESSOR = "passive_update_processor"
+# Advertisements with an unchanged payload are still processed at this
+# interval so entities derived from the RSSI keep updating
+DEDUP_REFRESH_INTERVAL = 60.0
 
 
 @dataclasses.dataclass(slots=True, frozen=True)
@@ -282,6 +286,15 @@ class PassiveBluetoothProcessorCoordinator[_DataT](BasePassiveBluetoothCoordinat
     The update_method should return the data that is dispatched to each processor.
     This is normally a parsed form of the data, but you can just forward the
     BluetoothServiceInfoBleak if needed.
+
+    With deduplicate=True, advertisements with the same name, manufacturer
+    data, service data and service uuids as the previous one are skipped
+    without calling the update_method, unless the device was unavailable or
+    the previous one was processed more than DEDUP_REFRESH_INTERVAL seconds
+    ago. Skipped advertisements still mark the device as seen, but their RSSI
+    is not passed on, so only enable it when the update_method does not report
+    the RSSI, for example as a signal strength sensor. It is disabled by
+    default and the integrations in this repository leave it disabled.
     """
 
     def __init__(
@@ -292,11 +305,17 @@ class PassiveBluetoothProcessorCoordinator[_DataT](BasePassiveBluetoothCoordinat
         mode: BluetoothScanningMode,
         update_method: Callable[[BluetoothServiceInfoBleak], _DataT],
         connectable: bool = False,
+        deduplicate: bool = False,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(hass, logger, address, mode, connectable)
         self._processors: list[PassiveBluetoothDataProcessor[Any, _DataT]] = []
         self._update_method = update_method
+        self._deduplicate = deduplicate
+        self._last_payload: tuple[Any, ...] | None = None
+        self._last_processed_time = 0.0
+        self.processed_advertisements = 0
+        self.skipped_advertisements = 0
         self.last_update_success = True
         self.restore_data: dict[str, RestoredPassiveBluetoothDataUpdate] = {}
         self.restore_key = None
@@ -332,6 +351,8 @@ class PassiveBluetoothProcessorCoordinator[_DataT](BasePassiveBluetoothCoordinat
         # in the future, but is optional for now to allow
         # for a transition period.
         processor.async_register_coordinator(self, entity_description_class)
+        # Make sure the new processor gets the next advertisement
+        self._last_payload = None
 
         @callback
         def remove_processor() -> None:
@@ -355,6 +376,14 @@ class PassiveBluetoothProcessorCoordinator[_DataT](BasePassiveBluetoothCoordinat
         for processor in self._processors:
             processor.async_handle_unavailable()
 
+    @callback
+    def async_diagnostics(self) -> dict[str, Any]:
+        """Return the advertisement statistics."""
+        return {
+            "processed_advertisements": self.processed_advertisements,
+            "skipped_advertisements": self.skipped_advertisements,
+        }
+
     @callback
     def _async_handle_bluetooth_event(
         self,
@@ -367,6 +396,27 @@ class PassiveBluetoothProcessorCoordinator[_DataT](BasePassiveBluetoothCoordinat
         if self.hass.is_stopping:
             return
 
+        payload = (
+            service_info.name,
+            service_info.manufacturer_data,
+            service_info.service_data,
+            service_info.service_uuids,
+        )
+        now = monotonic_time_coarse()
+        if (
+            self._deduplicate
+            and was_available
+            and payload == self._last_payload
+            and now - self._last_processed_time < DEDUP_REFRESH_INTERVAL
+            and self.last_update_success
+            and all(processor.last_update_success for processor in self._processors)
+        ):
+            self.skipped_advertisements += 1
+            return
+        self._last_payload = payload
+        self._last_processed_time = now
+        self.processed_advertisements += 1
+
         try:
             update = self._update_method(service_info)
         except Exception:
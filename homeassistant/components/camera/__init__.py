@@ -77,6 +77,7 @@ from .const import (
     DOMAIN,
     PREF_ORIENTATION,
     PREF_PRELOAD_STREAM,
+    PREF_SNAPSHOT_MAX_AGE,
     SERVICE_RECORD,
     CameraState,
     StreamType,
@@ -84,6 +85,7 @@ from .const import (
 from .helper import get_camera_from_entity_id
 from .img_util import scale_jpeg_camera_image
 from .prefs import CameraPreferences, DynamicStreamSettings  # noqa: F401
+from .snapshot import SnapshotCache
 from .webrtc import (
     DATA_ICE_SERVERS,
     CameraWebRTCLegacyProvider,
@@ -140,6 +142,7 @@ TOKEN_CHANGE_INTERVAL: Final = timedelta(minutes=5)
 _RND: Final = SystemRandom()
 
 MIN_STREAM_INTERVAL: Final = 0.5  # seconds
+DEFAULT_SNAPSHOT_MAX_AGE: Final = 0.0  # seconds
 
 CAMERA_SERVICE_SNAPSHOT: VolDictType = {vol.Required(ATTR_FILENAME): cv.template}
 
@@ -194,7 +197,43 @@ async def _async_get_image(
     Not all cameras can scale images or return jpegs
     that we can scale, however the majority of cases
     are handled.
+
+    Concurrent requests share a single fetch and images
+    are reused for up to the snapshot max age of the camera.
+    """
+    return await camera.snapshot_cache.async_get(
+        camera.hass,
+        partial(_async_fetch_image, camera, timeout, width, height),
+        width,
+        height,
+        _get_snapshot_max_age(camera),
+    )
+
+
+@callback
+def _get_snapshot_max_age(camera: Camera) -> float:
+    """Return the snapshot max age of a camera.
+
+    The snapshot_max_age entity option overrides the one of the integration.
     """
+    if (
+        (registry_entry := camera.registry_entry)
+        and (camera_options := registry_entry.options.get(DOMAIN))
+        and isinstance(
+            max_age := camera_options.get(PREF_SNAPSHOT_MAX_AGE), int | float
+        )
+    ):
+        return max_age
+    return camera.snapshot_max_age
+
+
+async def _async_fetch_image(
+    camera: Camera,
+    timeout: int,
+    width: int | None,
+    height: int | None,
+) -> Image:
+    """Fetch and scale a snapshot image from a camera."""
     with suppress(asyncio.CancelledError, TimeoutError):
         async with asyncio.timeout(timeout):
             image_bytes = (
@@ -442,6 +481,7 @@ CACHED_PROPERTIES_WITH_ATTR_ = {
     "is_streaming",
     "model",
     "motion_detection_enabled",
+    "snapshot_max_age",
     "supported_features",
 }
 
@@ -464,6 +504,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     _attr_model: str | None = None
     _attr_motion_detection_enabled: bool = False
     _attr_should_poll: bool = False  # No need to poll cameras
+    _attr_snapshot_max_age: float = DEFAULT_SNAPSHOT_MAX_AGE
     _attr_state: None = None  # State is determined by is_on
     _attr_supported_features: CameraEntityFeature = CameraEntityFeature(0)
 
@@ -476,6 +517,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         self.stream_options: dict[str, str | bool | float] = {}
         self.content_type: str = DEFAULT_CONTENT_TYPE
         self.access_tokens: collections.deque = collections.deque([], 2)
+        self.snapshot_cache = SnapshotCache()
         self._warned_old_signature = False
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
@@ -511,6 +553,15 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         """Whether or not to use stream to generate stills."""
         return False
 
+    @cached_property
+    def snapshot_max_age(self) -> float:
+        """Return the number of seconds a snapshot may be reused.
+
+        Stills are fetched from the camera for every request if 0. Users can
+        override it with the snapshot_max_age entity option.
+        """
+        return self._attr_snapshot_max_age
+
     @cached_property
     def supported_features(self) -> CameraEntityFeature:
         """Flag supported features."""
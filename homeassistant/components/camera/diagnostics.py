@@ -25,7 +25,8 @@ async def async_get_config_entry_diagnostics(
             camera = get_camera_from_entity_id(hass, entity.entity_id)
         except HomeAssistantError:
             continue
-        diagnostics[entity.entity_id] = (
-            camera.stream.get_diagnostics() if camera.stream else {}
-        )
+        diagnostics[entity.entity_id] = {
+            **(camera.stream.get_diagnostics() if camera.stream else {}),
+            "snapshot_cache": camera.snapshot_cache.as_dict(),
+        }
     return diagnostics
@@ -0,0 +1,136 @@
+"""Snapshot cache for camera stills."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant
+
+if TYPE_CHECKING:
+    from . import Image
+
+# Maximum number of image sizes cached per camera
+MAX_CACHED_SIZES = 8
+
+type _SizeKey = tuple[int | None, int | None]
+
+
+@dataclass(slots=True)
+class _CachedImage:
+    """An image and the monotonic time it was fetched."""
+
+    image: Image
+    fetched_at: float
+
+
+def _retrieve_exception(task: asyncio.Task[Image]) -> None:
+    """Retrieve the exception of a fetch.
+
+    All the requests waiting for a fetch may have been cancelled, in which
+    case nobody retrieves its exception. The requests still waiting get the
+    exception raised through the shield.
+    """
+    if not task.cancelled():
+        task.exception()
+
+
+class SnapshotCache:
+    """Cache the latest stills of a camera.
+
+    Concurrent requests for the same size share a single fetch, and the
+    result is reused by later requests for up to the max age of the camera.
+    Scaled images are cached separately for each requested size.
+    """
+
+    __slots__ = (
+        "_images",
+        "_pending",
+        "coalesced",
+        "fetch_time",
+        "fetches",
+        "hits",
+        "last_fetch_time",
+        "misses",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._images: dict[_SizeKey, _CachedImage] = {}
+        self._pending: dict[_SizeKey, asyncio.Task[Image]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.fetches = 0
+        self.fetch_time = 0.0
+        self.last_fetch_time: float | None = None
+
+    async def async_get(
+        self,
+        hass: HomeAssistant,
+        fetch: Callable[[], Coroutine[Any, Any, Image]],
+        width: int | None,
+        height: int | None,
+        max_age: float,
+    ) -> Image:
+        """Return a cached image or fetch a new one."""
+        key = (width, height)
+        if (
+            max_age > 0
+            and (cached := self._images.get(key)) is not None
+            and time.monotonic() - cached.fetched_at < max_age
+        ):
+            self.hits += 1
+            return cached.image
+
+        if (task := self._pending.get(key)) is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = self._pending[key] = hass.async_create_background_task(
+                self._async_fetch(key, fetch, max_age),
+                f"camera snapshot {width}x{height}",
+                eager_start=False,
+            )
+            task.add_done_callback(_retrieve_exception)
+        # Shield the fetch so a cancelled request does
+        # not cancel it for the other requests
+        return await asyncio.shield(task)
+
+    async def _async_fetch(
+        self,
+        key: _SizeKey,
+        fetch: Callable[[], Coroutine[Any, Any, Image]],
+        max_age: float,
+    ) -> Image:
+        """Fetch an image and store it in the cache."""
+        start = time.monotonic()
+        try:
+            image = await fetch()
+        finally:
+            del self._pending[key]
+            self.fetches += 1
+            self.last_fetch_time = time.monotonic() - start
+            self.fetch_time += self.last_fetch_time
+        if max_age > 0:
+            if key not in self._images and len(self._images) >= MAX_CACHED_SIZES:
+                oldest = min(self._images, key=lambda k: self._images[k].fetched_at)
+                del self._images[oldest]
+            self._images[key] = _CachedImage(image, time.monotonic())
+        return image
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cache statistics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "cached_sizes": len(self._images),
+            "last_fetch_time": self.last_fetch_time,
+            "average_fetch_time": self.fetch_time / self.fetches
+            if self.fetches
+            else None,
+        }
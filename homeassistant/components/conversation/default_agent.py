@@ -29,7 +29,7 @@ from hassil.recognize import (
     recognize_best,
 )
 from hassil.string_matcher import UnmatchedRangeEntity, UnmatchedTextEntity
-from hassil.trie import Trie
+from hassil.trie import Trie, TrieNode
 from hassil.util import merge_dict
 from home_assistant_intents import ErrorKey, get_intents, get_languages
 import yaml
@@ -181,6 +181,59 @@ class IntentCache:
         """Clear the cache."""
         self.cache.clear()
 
+    def invalidate(self, names: Iterable[str]) -> int:
+        """Remove the results for texts containing any of the lower case names.
+
+        Names are only matched when they appear in the text, so other results
+        can not depend on them. Returns the number of removed results.
+        """
+        names = [name for name in names if name]
+        if not names:
+            return 0
+        stale = [
+            key
+            for key in list(self.cache)
+            if any(name in key.text.lower() for name in names)
+        ]
+        for key in stale:
+            self.cache.pop(key, None)
+        return len(stale)
+
+
+@dataclass(slots=True)
+class EntityNames:
+    """Names of an entity in the slot lists."""
+
+    exposed: bool
+    name_tuples: list[tuple[str, str, dict[str, Any]]]
+    values: list[TextSlotValue]
+
+    @property
+    def trie_names(self) -> list[str]:
+        """Return the lower case names the values are stored under in a trie."""
+        names = []
+        for value in self.values:
+            assert isinstance(value.text_in, TextChunk)
+            names.append(value.text_in.text.strip().lower())
+        return names
+
+
+def _trie_remove(trie: Trie, text: str, value: Any) -> None:
+    """Remove a value inserted for a text from a trie."""
+    node: TrieNode | None = None
+    children: dict[str, TrieNode] | None = trie.roots
+    for char in text:
+        if children is None or (node := children.get(char)) is None:
+            return
+        children = node.children
+    if node is None or node.values is None:
+        return
+    node.values = [node_value for node_value in node.values if node_value is not value]
+    if not node.values:
+        # The node only remains as a prefix of longer names
+        node.values = None
+        node.text = None
+
 
 def _get_language_variations(language: str) -> Iterable[str]:
     """Generate language codes with and without region."""
@@ -241,6 +294,9 @@ class DefaultAgent(ConversationEntity):
         self._config_intents: dict[str, Any] = config_intents
         self._slot_lists: dict[str, SlotList] | None = None
 
+        # entity_id -> names in the slot lists, patched on changes
+        self._entity_names: dict[str, EntityNames] = {}
+
         # Used to filter slot lists before intent matching
         self._exposed_names_trie: Trie | None = None
         self._unexposed_names_trie: Trie | None = None
@@ -248,7 +304,7 @@ class DefaultAgent(ConversationEntity):
         # Sentences that will trigger a callback (skipping intent recognition)
         self.trigger_sentences: list[TriggerData] = []
         self._trigger_intents: Intents | None = None
-        self._unsub_clear_slot_list: list[Callable[[], None]] | None = None
+        self._unsub_slot_list_listeners: list[Callable[[], None]] | None = None
         self._load_intents_lock = asyncio.Lock()
 
         # LRU cache to avoid unnecessary intent matching
@@ -270,34 +326,44 @@ class DefaultAgent(ConversationEntity):
 
     @core.callback
     def _filter_state_changes(self, event_data: core.EventStateChangedData) -> bool:
-        """Filter state changed events."""
-        return not event_data["old_state"] or not event_data["new_state"]
+        """Filter state changed events.
+
+        Entity registry updates are seen before the entity writes its new state,
+        so a changed name is picked up from the state change.
+        """
+        return (
+            not (old_state := event_data["old_state"])
+            or not (new_state := event_data["new_state"])
+            or old_state.name != new_state.name
+        )
 
     @core.callback
-    def _listen_clear_slot_list(self) -> None:
-        """Listen for changes that can invalidate slot list."""
-        assert self._unsub_clear_slot_list is None
+    def _listen_slot_list_changes(self) -> None:
+        """Listen for changes that need the slot lists to be patched."""
+        assert self._unsub_slot_list_listeners is None
 
-        self._unsub_clear_slot_list = [
+        self._unsub_slot_list_listeners = [
             self.hass.bus.async_listen(
                 ar.EVENT_AREA_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_update_area_slot_lists,
             ),
             self.hass.bus.async_listen(
                 fr.EVENT_FLOOR_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_update_area_slot_lists,
             ),
             self.hass.bus.async_listen(
                 er.EVENT_ENTITY_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_entity_registry_updated,
                 event_filter=self._filter_entity_registry_changes,
             ),
             self.hass.bus.async_listen(
                 EVENT_STATE_CHANGED,
-                self._async_clear_slot_list,
+                self._async_state_names_changed,
                 event_filter=self._filter_state_changes,
             ),
-            async_listen_entity_updates(self.hass, DOMAIN, self._async_clear_slot_list),
+            async_listen_entity_updates(
+                self.hass, DOMAIN, self._async_exposure_updated
+            ),
         ]
 
     async def async_recognize_intent(
@@ -315,15 +381,16 @@ class DefaultAgent(ConversationEntity):
         slot_lists = self._make_slot_lists()
         intent_context = self._make_intent_context(user_input)
 
-        if self._exposed_names_trie is not None:
-            # Filter by input string
-            text_lower = user_input.text.strip().lower()
-            slot_lists["name"] = TextSlotList(
-                name="name",
-                values=[
-                    result[2] for result in self._exposed_names_trie.find(text_lower)
-                ],
-            )
+        # Filter by input string. The tries are patched in the event loop so
+        # they must not be used from the executor.
+        text_lower = user_input.text.strip().lower()
+        assert self._exposed_names_trie is not None
+        assert self._unexposed_names_trie is not None
+        slot_lists = {
+            **slot_lists,
+            "name": _filter_names(self._exposed_names_trie, text_lower),
+        }
+        unexposed_names = _filter_names(self._unexposed_names_trie, text_lower)
 
         start = time.monotonic()
 
@@ -332,6 +399,7 @@ class DefaultAgent(ConversationEntity):
             user_input,
             lang_intents,
             slot_lists,
+            unexposed_names,
             intent_context,
             language,
             strict_intents_only,
@@ -509,6 +577,7 @@ class DefaultAgent(ConversationEntity):
         user_input: ConversationInput,
         lang_intents: LanguageIntents,
         slot_lists: dict[str, SlotList],
+        unexposed_names: TextSlotList,
         intent_context: dict[str, Any] | None,
         language: str,
         strict_intents_only: bool,
@@ -575,7 +644,7 @@ class DefaultAgent(ConversationEntity):
         if not skip_unexposed_entities_match:
             unexposed_entities_slot_lists = {
                 **slot_lists,
-                "name": self._get_unexposed_entity_names(user_input.text),
+                "name": unexposed_names,
             }
 
             start_time = time.monotonic()
@@ -703,63 +772,52 @@ class DefaultAgent(ConversationEntity):
 
         return maybe_result
 
-    def _get_unexposed_entity_names(self, text: str) -> TextSlotList:
-        """Get filtered slot list with unexposed entity names in Home Assistant."""
-        if self._unexposed_names_trie is None:
-            # Build trie
-            self._unexposed_names_trie = Trie()
-            for name_tuple in self._get_entity_name_tuples(exposed=False):
-                self._unexposed_names_trie.insert(
-                    name_tuple[0].lower(),
-                    TextSlotValue.from_tuple(name_tuple, allow_template=False),
-                )
-
-        # Build filtered slot list
-        text_lower = text.strip().lower()
-        return TextSlotList(
-            name="name",
-            values=[
-                result[2] for result in self._unexposed_names_trie.find(text_lower)
-            ],
-        )
-
     def _get_entity_name_tuples(
-        self, exposed: bool
-    ) -> Iterable[tuple[str, str, dict[str, Any]]]:
-        """Yield (input name, output name, context) tuples for entities."""
-        entity_registry = er.async_get(self.hass)
+        self, state: core.State, entity_registry: er.EntityRegistry
+    ) -> list[tuple[str, str, dict[str, Any]]]:
+        """Return (input name, output name, context) tuples for an entity."""
+        # Checked against "requires_context" and "excludes_context" in hassil
+        context = {"domain": state.domain}
+        if state.attributes:
+            # Include some attributes
+            for attr in DEFAULT_EXPOSED_ATTRIBUTES:
+                if attr not in state.attributes:
+                    continue
+                context[attr] = state.attributes[attr]
 
-        for state in self.hass.states.async_all():
-            entity_exposed = async_should_expose(self.hass, DOMAIN, state.entity_id)
-            if exposed and (not entity_exposed):
-                # Required exposed, entity is not
-                continue
+        name_tuples = []
+        if (entity := entity_registry.async_get(state.entity_id)) and entity.aliases:
+            for alias in entity.aliases:
+                alias = alias.strip()
+                if not alias:
+                    continue
 
-            if (not exposed) and entity_exposed:
-                # Required not exposed, entity is
-                continue
+                name_tuples.append((alias, alias, context))
 
-            # Checked against "requires_context" and "excludes_context" in hassil
-            context = {"domain": state.domain}
-            if state.attributes:
-                # Include some attributes
-                for attr in DEFAULT_EXPOSED_ATTRIBUTES:
-                    if attr not in state.attributes:
-                        continue
-                    context[attr] = state.attributes[attr]
-
-            if (
-                entity := entity_registry.async_get(state.entity_id)
-            ) and entity.aliases:
-                for alias in entity.aliases:
-                    alias = alias.strip()
-                    if not alias:
-                        continue
+        # Default name
+        name_tuples.append((state.name, state.name, context))
+        return name_tuples
 
-                    yield (alias, alias, context)
+    @core.callback
+    def _make_entity_names(
+        self, state: core.State, entity_registry: er.EntityRegistry
+    ) -> EntityNames:
+        """Create the slot list values for the names of an entity."""
+        name_tuples = self._get_entity_name_tuples(state, entity_registry)
+        return EntityNames(
+            exposed=async_should_expose(self.hass, DOMAIN, state.entity_id),
+            name_tuples=name_tuples,
+            values=[
+                TextSlotValue.from_tuple(name_tuple, allow_template=False)
+                for name_tuple in name_tuples
+            ],
+        )
 
-            # Default name
-            yield (state.name, state.name, context)
+    def _get_names_trie(self, exposed: bool) -> Trie:
+        """Return the trie with the names of exposed or unexposed entities."""
+        trie = self._exposed_names_trie if exposed else self._unexposed_names_trie
+        assert trie is not None
+        return trie
 
     def _recognize_strict(
         self,
@@ -1029,6 +1087,7 @@ class DefaultAgent(ConversationEntity):
             return None
 
         intents = Intents.from_dict(intents_dict)
+        _compile_intents(intents)
 
         # Load responses
         responses_dict = intents_dict.get("responses", {})
@@ -1044,40 +1103,118 @@ class DefaultAgent(ConversationEntity):
         )
 
     @core.callback
-    def _async_clear_slot_list(self, event: core.Event[Any] | None = None) -> None:
-        """Clear slot lists when a registry has changed."""
-        # Two subscribers can be scheduled at same time
-        _LOGGER.debug("Clearing slot lists")
-        if self._unsub_clear_slot_list is None:
-            return
-        self._slot_lists = None
-        self._exposed_names_trie = None
-        self._unexposed_names_trie = None
-        for unsub in self._unsub_clear_slot_list:
-            unsub()
-        self._unsub_clear_slot_list = None
-
-        # Slot lists have changed, so we must clear the cache
-        self._intent_cache.clear()
+    def _async_state_names_changed(
+        self, event: core.Event[core.EventStateChangedData]
+    ) -> None:
+        """Patch the slot lists when an entity is added, removed or renamed."""
+        self._async_update_entity_names([event.data["entity_id"]])
 
     @core.callback
-    def _make_slot_lists(self) -> dict[str, SlotList]:
-        """Create slot lists with areas and entity names/aliases."""
-        if self._slot_lists is not None:
-            return self._slot_lists
+    def _async_entity_registry_updated(
+        self, event: core.Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Patch the slot lists when the name or aliases of an entity change."""
+        self._async_update_entity_names([event.data["entity_id"]])
+
+    @core.callback
+    def _async_exposure_updated(self) -> None:
+        """Patch the slot lists for the entities which were exposed or unexposed."""
+        self._async_update_entity_names(
+            [
+                entity_id
+                for entity_id, names in self._entity_names.items()
+                if names.exposed != async_should_expose(self.hass, DOMAIN, entity_id)
+            ]
+        )
+
+    @core.callback
+    def _async_update_entity_names(self, entity_ids: Iterable[str]) -> None:
+        """Patch the names of entities in the slot lists and name tries.
+
+        Only the cached intent results for texts containing one of the
+        changed names are dropped.
+        """
+        if self._slot_lists is None:
+            return
 
         start = time.monotonic()
+        entity_registry = er.async_get(self.hass)
+        changed_names: set[str] = set()
+        exposed_changed = False
+        for entity_id in entity_ids:
+            old_names = self._entity_names.get(entity_id)
+            new_names = None
+            if (state := self.hass.states.get(entity_id)) is not None:
+                new_names = self._make_entity_names(state, entity_registry)
+                if old_names is not None and (
+                    old_names.exposed == new_names.exposed
+                    and old_names.name_tuples == new_names.name_tuples
+                ):
+                    continue
 
-        # Gather entity names, keeping track of exposed names.
-        # We try intent recognition with only exposed names first, then all names.
-        #
-        # NOTE: We do not pass entity ids in here because multiple entities may
-        # have the same name. The intent matcher doesn't gather all matching
-        # values for a list, just the first. So we will need to match by name no
-        # matter what.
-        exposed_entity_names = list(self._get_entity_name_tuples(exposed=True))
-        _LOGGER.debug("Exposed entities: %s", exposed_entity_names)
+            if old_names is not None:
+                del self._entity_names[entity_id]
+                trie = self._get_names_trie(old_names.exposed)
+                for name, value in zip(
+                    old_names.trie_names, old_names.values, strict=True
+                ):
+                    _trie_remove(trie, name, value)
+                    changed_names.add(name)
+                exposed_changed |= old_names.exposed
+
+            if new_names is not None:
+                self._entity_names[entity_id] = new_names
+                trie = self._get_names_trie(new_names.exposed)
+                for name, value in zip(
+                    new_names.trie_names, new_names.values, strict=True
+                ):
+                    trie.insert(name, value)
+                    changed_names.add(name)
+                exposed_changed |= new_names.exposed
+
+        if not changed_names:
+            return
+
+        if exposed_changed:
+            self._slot_lists["name"] = self._make_exposed_names_list()
+
+        invalidated = self._intent_cache.invalidate(changed_names)
+        _LOGGER.debug(
+            "Patched slot lists with %s name(s) in %.4f seconds, "
+            "dropped %s cached result(s)",
+            len(changed_names),
+            time.monotonic() - start,
+            invalidated,
+        )
+
+    @core.callback
+    def _async_update_area_slot_lists(self, event: core.Event[Any]) -> None:
+        """Rebuild the area and floor slot lists when a registry has changed."""
+        if self._slot_lists is None:
+            return
 
+        self._slot_lists.update(self._make_area_slot_lists())
+
+        # The area of the device is part of the intent context, which is not
+        # in the cache key
+        self._intent_cache.clear()
+
+    @core.callback
+    def _make_exposed_names_list(self) -> TextSlotList:
+        """Create the slot list with the names of exposed entities."""
+        return TextSlotList(
+            name=None,
+            values=[
+                value
+                for names in self._entity_names.values()
+                if names.exposed
+                for value in names.values
+            ],
+        )
+
+    @core.callback
+    def _make_area_slot_lists(self) -> dict[str, SlotList]:
+        """Create the area and floor slot lists."""
         # Expose all areas.
         areas = ar.async_get(self.hass)
         area_names = []
@@ -1108,21 +1245,50 @@ class DefaultAgent(ConversationEntity):
 
                 floor_names.append((alias, floor.name))
 
-        # Build trie
+        return {
+            "area": TextSlotList.from_tuples(area_names, allow_template=False),
+            "floor": TextSlotList.from_tuples(floor_names, allow_template=False),
+        }
+
+    @core.callback
+    def _make_slot_lists(self) -> dict[str, SlotList]:
+        """Create slot lists with areas and entity names/aliases.
+
+        The slot lists are created once and patched afterwards when entities,
+        areas or floors change.
+        """
+        if self._slot_lists is not None:
+            return self._slot_lists
+
+        start = time.monotonic()
+
+        # Gather entity names, keeping track of exposed names.
+        # We try intent recognition with only exposed names first, then all names.
+        #
+        # NOTE: We do not pass entity ids in here because multiple entities may
+        # have the same name. The intent matcher doesn't gather all matching
+        # values for a list, just the first. So we will need to match by name no
+        # matter what.
+        entity_registry = er.async_get(self.hass)
+        self._entity_names = {
+            state.entity_id: self._make_entity_names(state, entity_registry)
+            for state in self.hass.states.async_all()
+        }
+
+        # Build tries
         self._exposed_names_trie = Trie()
-        name_list = TextSlotList.from_tuples(exposed_entity_names, allow_template=False)
-        for name_value in name_list.values:
-            assert isinstance(name_value.text_in, TextChunk)
-            name_text = name_value.text_in.text.strip().lower()
-            self._exposed_names_trie.insert(name_text, name_value)
+        self._unexposed_names_trie = Trie()
+        for names in self._entity_names.values():
+            trie = self._get_names_trie(names.exposed)
+            for name, value in zip(names.trie_names, names.values, strict=True):
+                trie.insert(name, value)
 
         self._slot_lists = {
-            "area": TextSlotList.from_tuples(area_names, allow_template=False),
-            "name": name_list,
-            "floor": TextSlotList.from_tuples(floor_names, allow_template=False),
+            **self._make_area_slot_lists(),
+            "name": self._make_exposed_names_list(),
         }
 
-        self._listen_clear_slot_list()
+        self._listen_slot_list_changes()
 
         _LOGGER.debug(
             "Created slot lists in %.2f seconds",
@@ -1352,6 +1518,46 @@ class DefaultAgent(ConversationEntity):
         return conversation_result.response
 
 
+def _compile_intents(intents: Intents) -> None:
+    """Parse and compile the sentence templates of intents (run inside executor).
+
+    hassil parses the templates and compiles the regular expressions used to
+    filter them on first use, which made the first recognition of a language
+    slow. Compiled expressions can not be persisted, so this is done while
+    the intents are loaded instead.
+    """
+    start = time.monotonic()
+    num_sentences = 0
+    for lang_intent in intents.intents.values():
+        for intent_data in lang_intent.data:
+            sentences = intent_data.sentences
+            num_sentences += len(sentences)
+            if not (
+                intents.settings.filter_with_regex
+                and intent_data.settings.filter_with_regex
+            ):
+                continue
+
+            expansion_rules = {
+                **intents.expansion_rules,
+                **intent_data.expansion_rules,
+            }
+            for sentence in sentences:
+                sentence.compile(expansion_rules)
+
+    _LOGGER.debug(
+        "Compiled %s sentence templates for language=%s in %.2f seconds",
+        num_sentences,
+        intents.language,
+        time.monotonic() - start,
+    )
+
+
+def _filter_names(trie: Trie, text: str) -> TextSlotList:
+    """Return the slot list with the names found in the text."""
+    return TextSlotList(name="name", values=[result[2] for result in trie.find(text)])
+
+
 def _make_error_result(
     language: str,
     error_code: intent.IntentResponseErrorCode,
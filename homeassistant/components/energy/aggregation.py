@@ -0,0 +1,335 @@
+"""Incremental aggregation of the energy dashboard statistics.
+
+The energy dashboard needs the change of every configured source for each
+period of the range it shows. Instead of querying the recorder for every
+source and period on each view change, the aggregator loads the hourly and
+daily changes once and keeps them up to date when the recorder compiles new
+hourly statistics. Weeks, months and years are reduced from the daily totals.
+Statistics imported or adjusted by the recorder drop the totals so they are
+loaded again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any, Literal
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder import EVENT_RECORDER_HOURLY_STATISTICS_GENERATED
+from homeassistant.components.recorder.const import EVENT_RECORDER_STATISTICS_UPDATED
+from homeassistant.components.recorder.statistics import (
+    StatisticsRow,
+    reduce_day_ts_factory,
+    reduce_month_ts_factory,
+    reduce_week_ts_factory,
+)
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .data import EnergyManager, async_get_manager
+
+type AggregationPeriod = Literal["hour", "day", "week", "month", "year"]
+
+# Number of days before the current day hourly changes are kept for
+HOURLY_RETENTION_DAYS = 7
+
+
+@singleton(f"{DOMAIN}_aggregator")
+async def async_get_aggregator(hass: HomeAssistant) -> EnergyAggregator:
+    """Return the energy aggregator."""
+    aggregator = EnergyAggregator(hass, await async_get_manager(hass))
+    aggregator.async_setup()
+    return aggregator
+
+
+def _year_start_end_ts(time: float) -> tuple[float, float]:
+    """Return the start and end of the year time is within."""
+    start_local = dt_util.as_local(dt_util.utc_from_timestamp(time)).replace(
+        month=1, day=1, hour=0, minute=0, second=0, microsecond=0
+    )
+    return (
+        start_local.timestamp(),
+        start_local.replace(year=start_local.year + 1).timestamp(),
+    )
+
+
+def _period_start_end_factory(
+    period: AggregationPeriod,
+) -> Callable[[float], tuple[float, float]]:
+    """Return a function to find the start and end of the period of a time."""
+    if period == "day":
+        return reduce_day_ts_factory()[1]
+    if period == "week":
+        return reduce_week_ts_factory()[1]
+    if period == "month":
+        return reduce_month_ts_factory()[1]
+    return _year_start_end_ts
+
+
+def _add_changes(
+    totals: dict[str, dict[float, float]], stats: dict[str, list[StatisticsRow]]
+) -> None:
+    """Add the changes of the periods of the statistics to the totals."""
+    for statistic_id, rows in stats.items():
+        changes = totals.setdefault(statistic_id, {})
+        for row in rows:
+            if (change := row.get("change")) is not None:
+                changes[row["start"]] = change
+
+
+def _period_row(start: float, end: float, change: float) -> dict[str, Any]:
+    """Return a period with the timestamps in milliseconds like the recorder API."""
+    return {"start": int(start * 1000), "end": int(end * 1000), "change": change}
+
+
+class EnergyAggregator:
+    """Keep running totals of the changes of the energy statistics."""
+
+    def __init__(self, hass: HomeAssistant, manager: EnergyManager) -> None:
+        """Initialize the aggregator."""
+        self._hass = hass
+        self._manager = manager
+        self._lock = asyncio.Lock()
+        self._statistic_ids: set[str] = set()
+        # Statistic id to the change of each hour or local day keyed by its start
+        self._hourly: dict[str, dict[float, float]] = {}
+        self._daily: dict[str, dict[float, float]] = {}
+        # Start of the first hour and day loaded
+        self._hourly_from: float | None = None
+        self._daily_from: float | None = None
+        # Start of the first day whose daily totals are summed up from the
+        # hours, the current day when the totals were loaded
+        self._summed_from: float | None = None
+        # Statistic id to the end of the last hour added
+        self._next_hour: dict[str, float] = {}
+        self.queries = 0
+
+    @callback
+    def async_setup(self) -> None:
+        """Follow the preferences and the compiled statistics."""
+        self._manager.async_listen_updates(self._async_preferences_updated)
+        self._hass.bus.async_listen(
+            EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
+            self._async_statistics_generated,
+        )
+        self._hass.bus.async_listen(
+            EVENT_RECORDER_STATISTICS_UPDATED, self._async_statistics_updated
+        )
+
+    async def _async_preferences_updated(self) -> None:
+        """Drop the totals when the sources change."""
+        async with self._lock:
+            self._async_reset()
+
+    @callback
+    def _async_reset(self) -> None:
+        """Drop all the totals."""
+        self._statistic_ids = set()
+        self._hourly = {}
+        self._daily = {}
+        self._hourly_from = self._daily_from = self._summed_from = None
+        self._next_hour = {}
+
+    @callback
+    def _async_get_statistic_ids(self) -> set[str]:
+        """Return the statistics of the configured sources and their costs."""
+        if (prefs := self._manager.data) is None:
+            return set()
+        statistic_ids: set[str] = set()
+        for source in prefs["energy_sources"]:
+            if source["type"] == "grid":
+                for flow_from in source["flow_from"]:
+                    statistic_ids.add(flow_from["stat_energy_from"])
+                    if stat_cost := flow_from.get("stat_cost"):
+                        statistic_ids.add(stat_cost)
+                for flow_to in source["flow_to"]:
+                    statistic_ids.add(flow_to["stat_energy_to"])
+                    if stat_compensation := flow_to.get("stat_compensation"):
+                        statistic_ids.add(stat_compensation)
+                continue
+            statistic_ids.add(source["stat_energy_from"])
+            if source["type"] == "battery":
+                statistic_ids.add(source["stat_energy_to"])
+            elif source["type"] == "gas" or source["type"] == "water":
+                if stat_cost := source.get("stat_cost"):
+                    statistic_ids.add(stat_cost)
+        for device in prefs["device_consumption"]:
+            statistic_ids.add(device["stat_consumption"])
+        # Cost sensors created by the energy integration itself
+        statistic_ids.update(self._hass.data[DOMAIN]["cost_sensors"].values())
+        return statistic_ids
+
+    async def _async_fetch_changes(
+        self, start: float, end: float | None, period: Literal["hour", "day"]
+    ) -> dict[str, list[StatisticsRow]]:
+        """Fetch the changes of the tracked statistics from the recorder."""
+        self.queries += 1
+        return await recorder.get_instance(self._hass).async_add_executor_job(
+            recorder.statistics.statistics_during_period,
+            self._hass,
+            dt_util.utc_from_timestamp(start),
+            None if end is None else dt_util.utc_from_timestamp(end),
+            self._statistic_ids,
+            period,
+            None,
+            {"change"},
+        )
+
+    def _add_hours(self, stats: dict[str, list[StatisticsRow]]) -> None:
+        """Add or replace hourly changes and sum up the days they are part of."""
+        day_start_end = reduce_day_ts_factory()[1]
+        for statistic_id, rows in stats.items():
+            hourly = self._hourly.setdefault(statistic_id, {})
+            daily = self._daily.setdefault(statistic_id, {})
+            days: set[tuple[float, float]] = set()
+            next_hour = self._next_hour.get(statistic_id)
+            for row in rows:
+                if (change := row.get("change")) is None:
+                    continue
+                hourly[row["start"]] = change
+                days.add(day_start_end(row["start"]))
+                if next_hour is None or row["end"] > next_hour:
+                    next_hour = row["end"]
+            # Hours fetched again replace their change so the days are summed
+            # up again instead of adding the change of an hour twice
+            for day_start, day_end in days:
+                daily[day_start] = sum(
+                    change
+                    for hour, change in hourly.items()
+                    if day_start <= hour < day_end
+                )
+            if next_hour is not None:
+                self._next_hour[statistic_id] = next_hour
+
+    async def _async_load(self, start: float, hourly: bool) -> None:
+        """Make sure the hourly or daily totals are loaded from start.
+
+        Daily totals must be loaded from the start of a local day.
+        """
+        statistic_ids = self._async_get_statistic_ids()
+        if statistic_ids != self._statistic_ids:
+            self._async_reset()
+            self._statistic_ids = statistic_ids
+        if not statistic_ids:
+            return
+
+        if self._summed_from is None:
+            today_start = dt_util.start_of_local_day().timestamp()
+            self._add_hours(await self._async_fetch_changes(today_start, None, "hour"))
+            self._hourly_from = self._daily_from = self._summed_from = today_start
+
+        assert self._hourly_from is not None and self._daily_from is not None
+        if hourly and start < self._hourly_from:
+            _add_changes(
+                self._hourly,
+                await self._async_fetch_changes(start, self._hourly_from, "hour"),
+            )
+            self._hourly_from = start
+
+        if not hourly and start < self._daily_from:
+            _add_changes(
+                self._daily,
+                await self._async_fetch_changes(start, self._daily_from, "day"),
+            )
+            self._daily_from = start
+
+    async def _async_statistics_generated(self, event: Event) -> None:
+        """Add the hours compiled by the recorder."""
+        async with self._lock:
+            if self._summed_from is None or not self._statistic_ids:
+                return
+            # Fetch from the statistic lagging the most behind so late hours
+            # are added, but not before the hours kept to sum up the days
+            start = max(
+                min(
+                    self._next_hour.get(statistic_id, self._summed_from)
+                    for statistic_id in self._statistic_ids
+                ),
+                self._summed_from,
+                self._hourly_cutoff(),
+            )
+            self._add_hours(await self._async_fetch_changes(start, None, "hour"))
+            self._async_prune_hours()
+
+    async def _async_statistics_updated(self, event: Event) -> None:
+        """Drop the totals when statistics were imported or adjusted."""
+        async with self._lock:
+            if event.data["statistic_id"] in self._statistic_ids:
+                self._async_reset()
+
+    def _hourly_cutoff(self) -> float:
+        """Return the start of the oldest hour kept."""
+        return (
+            dt_util.start_of_local_day() - timedelta(days=HOURLY_RETENTION_DAYS)
+        ).timestamp()
+
+    @callback
+    def _async_prune_hours(self) -> None:
+        """Drop the hourly changes older than the retention."""
+        assert self._hourly_from is not None
+        cutoff = self._hourly_cutoff()
+        if self._hourly_from >= cutoff:
+            return
+        for hourly in self._hourly.values():
+            for hour_start in [hour for hour in hourly if hour < cutoff]:
+                del hourly[hour_start]
+        self._hourly_from = cutoff
+
+    async def async_get_changes(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        period: AggregationPeriod,
+        statistic_ids: set[str] | None = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Return the change of the statistics per period between start and end."""
+        start = start_time.timestamp()
+        end = end_time.timestamp()
+        async with self._lock:
+            if period == "hour":
+                await self._async_load(start, True)
+                return {
+                    statistic_id: rows
+                    for statistic_id in self._async_filter_ids(statistic_ids)
+                    if (
+                        rows := [
+                            _period_row(hour, hour + 3600, change)
+                            for hour, change in sorted(
+                                self._hourly.get(statistic_id, {}).items()
+                            )
+                            if start <= hour < end
+                        ]
+                    )
+                }
+
+            # Like the recorder, the range is extended to whole periods
+            period_start_end = _period_start_end_factory(period)
+            first = period_start_end(start)[0]
+            last = period_start_end(end)[1]
+            await self._async_load(first, False)
+            result: dict[str, list[dict[str, Any]]] = {}
+            for statistic_id in self._async_filter_ids(statistic_ids):
+                totals: dict[tuple[float, float], float] = {}
+                daily = self._daily.get(statistic_id, {})
+                for day in sorted(daily):
+                    if not first <= day < last:
+                        continue
+                    bounds = period_start_end(day)
+                    totals[bounds] = totals.get(bounds, 0.0) + daily[day]
+                if totals:
+                    result[statistic_id] = [
+                        _period_row(period_start, period_end, change)
+                        for (period_start, period_end), change in totals.items()
+                    ]
+            return result
+
+    @callback
+    def _async_filter_ids(self, statistic_ids: set[str] | None) -> set[str]:
+        """Return the requested statistics which are tracked."""
+        if statistic_ids is None:
+            return self._statistic_ids
+        return statistic_ids & self._statistic_ids
@@ -22,6 +22,7 @@ from homeassistant.helpers.integration_platform import (
 from homeassistant.helpers.singleton import singleton
 from homeassistant.util import dt as dt_util
 
+from .aggregation import async_get_aggregator
 from .const import DOMAIN
 from .data import (
     DEVICE_CONSUMPTION_SCHEMA,
@@ -52,6 +53,7 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_validate)
     websocket_api.async_register_command(hass, ws_solar_forecast)
     websocket_api.async_register_command(hass, ws_get_fossil_energy_consumption)
+    websocket_api.async_register_command(hass, ws_get_aggregated_statistics)
 
 
 @singleton("energy_platforms")
@@ -379,3 +381,44 @@ async def ws_get_fossil_energy_consumption(
 
     result = {period["start"]: period["delta"] for period in reduced_fossil_energy}
     connection.send_result(msg["id"], result)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "energy/aggregated_statistics",
+        vol.Required("start_time"): str,
+        vol.Required("end_time"): str,
+        vol.Required("period"): vol.Any("hour", "day", "week", "month", "year"),
+        vol.Optional("statistic_ids"): [str],
+    }
+)
+@websocket_api.async_response
+async def ws_get_aggregated_statistics(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the change of the energy statistics per period."""
+    if start_time := dt_util.parse_datetime(msg["start_time"]):
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    if end_time := dt_util.parse_datetime(msg["end_time"]):
+        end_time = dt_util.as_utc(end_time)
+    else:
+        connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+        return
+
+    aggregator = await async_get_aggregator(hass)
+    statistic_ids = msg.get("statistic_ids")
+    connection.send_result(
+        msg["id"],
+        await aggregator.async_get_changes(
+            start_time,
+            end_time,
+            msg["period"],
+            None if statistic_ids is None else set(statistic_ids),
+        ),
+    )
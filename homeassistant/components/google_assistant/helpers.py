@@ -200,13 +200,15 @@ class AbstractConfig(ABC):
     ) -> HTTPStatus | None:
         """Send a state report to Google."""
 
-    async def async_report_state_all(self, message):
+    async def async_report_state_all(
+        self, message: dict[str, Any]
+    ) -> list[HTTPStatus | None]:
         """Send a state report to Google for all previously synced users."""
         jobs = [
             self.async_report_state(message, agent_user_id)
             for agent_user_id in self.async_get_agent_users()
         ]
-        await gather(*jobs)
+        return await gather(*jobs)
 
     @callback
     def async_enable_report_state(self) -> None:
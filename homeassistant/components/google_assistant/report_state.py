@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections import deque
+from http import HTTPStatus
 import logging
 from typing import TYPE_CHECKING, Any
 from uuid import uuid4
@@ -18,6 +18,7 @@ from homeassistant.core import (
 )
 from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.significant_change import create_checker
+from homeassistant.helpers.state_reporter import StateReport, StateReporter
 
 from .const import DOMAIN
 from .error import SmartHomeError
@@ -43,31 +44,38 @@ def async_enable_report_state(
 ) -> CALLBACK_TYPE:
     """Enable state and notification reporting."""
     checker = None
-    unsub_pending: CALLBACK_TYPE | None = None
-    pending: deque[dict[str, Any]] = deque([{}])
 
-    async def report_states(now=None):
-        """Report the states."""
-        nonlocal pending
-        nonlocal unsub_pending
-
-        pending.append({})
-
-        # We will report all batches except last one because those are finalized.
-        while len(pending) > 1:
-            await google_config.async_report_state_all(
-                {"devices": {"states": pending.popleft()}}
-            )
-
-        # If things got queued up in last batch while we were reporting, schedule ourselves again
-        if pending[0]:
-            unsub_pending = async_call_later(
-                hass, REPORT_STATE_WINDOW, report_states_job
-            )
-        else:
-            unsub_pending = None
-
-    report_states_job = HassJob(report_states)
+    async def report_states(
+        batch: dict[str, StateReport[dict[str, Any]]],
+    ) -> set[str]:
+        """Report the changed states, return the entities which were not delivered."""
+        states = {
+            entity_id: {
+                key: value
+                for key, value in report.data.items()
+                if key in report.changed
+            }
+            for entity_id, report in batch.items()
+        }
+        results = await google_config.async_report_state_all(
+            {"devices": {"states": states}}
+        )
+        # The states of all entities are sent in one request per agent user
+        if any(
+            result == HTTPStatus.TOO_MANY_REQUESTS
+            or (result is not None and result >= HTTPStatus.INTERNAL_SERVER_ERROR)
+            for result in results
+        ):
+            return set(batch)
+        return set()
+
+    reporter: StateReporter[dict[str, Any]] = StateReporter(
+        hass,
+        _LOGGER,
+        name="Google Assistant",
+        window=REPORT_STATE_WINDOW,
+        send=report_states,
+    )
 
     @callback
     def _async_entity_state_filter(data: EventStateChangedData) -> bool:
@@ -82,7 +90,6 @@ def async_enable_report_state(
 
     async def _async_entity_state_listener(event: Event[EventStateChangedData]) -> None:
         """Handle state changes."""
-        nonlocal unsub_pending, checker
         data = event.data
         new_state = data["new_state"]
         if TYPE_CHECKING:
@@ -97,11 +104,13 @@ def async_enable_report_state(
         # This is mainly designed for our event entity types
         # We need to synchronize notifications using a `SYNC` response,
         # together with other state changes.
+        notified = False
         if (
             (old_state := data["old_state"])
             and old_state.state != new_state.state
             and (notifications := entity.notifications_serialize()) is not None
         ):
+            notified = True
             event_id = uuid4().hex
             payload = {
                 "devices": {"notifications": {entity.state.entity_id: notifications}}
@@ -129,18 +138,13 @@ def async_enable_report_state(
         if not checker.async_is_significant_change(new_state, extra_arg=entity_data):
             return
 
-        _LOGGER.debug("Scheduling report state for %s: %s", changed_entity, entity_data)
-
-        # If a significant change is already scheduled and we have another significant one,
-        # let's create a new batch of changes
-        if changed_entity in pending[-1]:
-            pending.append({})
-
-        pending[-1][changed_entity] = entity_data
-
-        if unsub_pending is None:
-            unsub_pending = async_call_later(
-                hass, REPORT_STATE_WINDOW, report_states_job
+        # Notifications are synchronized with the state of the entity
+        # so it is reported in full even if it did not change
+        if reporter.async_report(
+            changed_entity, entity_data, entity_data, force=notified
+        ):
+            _LOGGER.debug(
+                "Scheduling report state for %s: %s", changed_entity, entity_data
             )
 
     @callback
@@ -180,6 +184,7 @@ def async_enable_report_state(
                 continue
 
             entities[entity.entity_id] = entity_data
+            reporter.async_set_reported(entity.entity_id, entity_data)
 
         if not entities:
             return
@@ -199,7 +204,6 @@ def async_enable_report_state(
     @callback
     def unsub_all():
         unsub()
-        if unsub_pending:
-            unsub_pending()
+        reporter.async_shutdown()
 
     return unsub_all
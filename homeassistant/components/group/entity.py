@@ -57,6 +57,8 @@ class GroupEntity(Entity):
             event: Event[EventStateChangedData] | None,
         ) -> None:
             """Handle child updates."""
+            if event:
+                self.async_update_member_state(event.data["entity_id"])
             self.async_update_group_state()
             if event:
                 self.async_update_supported_features(
@@ -83,6 +85,7 @@ class GroupEntity(Entity):
         ) -> None:
             """Handle child updates."""
             self.async_set_context(event.context)
+            self.async_update_member_state(event.data["entity_id"])
             self.async_update_supported_features(
                 event.data["entity_id"], event.data["new_state"]
             )
@@ -115,6 +118,15 @@ class GroupEntity(Entity):
     def async_update_group_state(self) -> None:
         """Abstract method to update the entity."""
 
+    @callback
+    def async_update_member_state(self, entity_id: str) -> None:
+        """Handle the state of a member changing.
+
+        Called before the group state is updated, groups which aggregate the
+        member states incrementally override this to only process the members
+        which changed.
+        """
+
     @callback
     def async_update_supported_features(
         self,
@@ -158,6 +170,9 @@ class Group(Entity):
         self._on_off: dict[str, bool] = {}
         self._assumed: dict[str, bool] = {}
         self._on_states: set[str] = set()
+        # Number of members which are on or have an assumed state
+        self._num_on = 0
+        self._num_assumed = 0
         self.created_by_service = created_by_service
         self.mode = any
         if mode:
@@ -398,6 +413,8 @@ class Group(Entity):
         self._on_off = {}
         self._assumed = {}
         self._on_states = set()
+        self._num_on = 0
+        self._num_assumed = 0
 
         for entity_id in self.trackable:
             if (state := self.hass.states.get(entity_id)) is not None:
@@ -409,7 +426,9 @@ class Group(Entity):
         domain = new_state.domain
         state = new_state.state
         registry = self._registry
-        self._assumed[entity_id] = bool(new_state.attributes.get(ATTR_ASSUMED_STATE))
+        assumed = bool(new_state.attributes.get(ATTR_ASSUMED_STATE))
+        self._num_assumed += assumed - self._assumed.get(entity_id, False)
+        self._assumed[entity_id] = assumed
 
         if domain not in registry.on_states_by_domain:
             # Handle the group of a group case
@@ -417,12 +436,20 @@ class Group(Entity):
                 self._on_states.add(state)
             elif state in registry.off_on_mapping:
                 self._on_states.add(registry.off_on_mapping[state])
-            self._on_off[entity_id] = state in registry.on_off_mapping
+            is_on = state in registry.on_off_mapping
         else:
             entity_on_state = registry.on_states_by_domain[domain]
             if domain in registry.on_states_by_domain:
                 self._on_states.update(entity_on_state)
-            self._on_off[entity_id] = state in entity_on_state
+            is_on = state in entity_on_state
+        self._num_on += is_on - self._on_off.get(entity_id, False)
+        self._on_off[entity_id] = is_on
+
+    def _mode_of_count(self, count: int) -> bool:
+        """Return the mode of the members given how many of them are true."""
+        if self.mode is all:
+            return count == len(self._on_off)
+        return count > 0
 
     @callback
     def _async_update_group_state(self, tr_state: State | None = None) -> None:
@@ -445,7 +472,7 @@ class Group(Entity):
             or self._assumed_state
             and not tr_state.attributes.get(ATTR_ASSUMED_STATE)
         ):
-            self._assumed_state = self.mode(self._assumed.values())
+            self._assumed_state = self._mode_of_count(self._num_assumed)
 
         elif tr_state.attributes.get(ATTR_ASSUMED_STATE):
             self._assumed_state = True
@@ -467,7 +494,7 @@ class Group(Entity):
         # on state, we use STATE_ON/STATE_OFF
         else:
             on_state = STATE_ON
-        group_is_on = self.mode(self._on_off.values())
+        group_is_on = self._mode_of_count(self._num_on)
         if group_is_on:
             self._state = on_state
         elif self.single_state_type_key:
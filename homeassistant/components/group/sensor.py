@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from datetime import datetime
 import logging
 import statistics
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 import voluptuous as vol
 
@@ -50,7 +50,7 @@ from homeassistant.helpers.issue_registry import (
     async_create_issue,
     async_delete_issue,
 )
-from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, StateType
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from .const import CONF_IGNORE_NON_NUMERIC, DOMAIN as GROUP_DOMAIN
 from .entity import GroupEntity
@@ -172,17 +172,31 @@ def async_create_preview_sensor(
     )
 
 
-def _has_numeric_state(hass: HomeAssistant, entity_id: str) -> bool:
-    """Test if state is numeric."""
-    if not (state := hass.states.get(entity_id)):
-        return False
+class _Member(NamedTuple):
+    """State of a group member."""
+
+    state: State
+    known: bool
+    # Numeric state in the unit of the group or None if not usable
+    value: float | None
+
+
+def _is_numeric(state: str) -> bool:
+    """Test if a state is numeric."""
     try:
-        float(state.state)
+        float(state)
     except ValueError:
         return False
     return True
 
 
+def _has_numeric_state(hass: HomeAssistant, entity_id: str) -> bool:
+    """Test if state is numeric."""
+    if not (state := hass.states.get(entity_id)):
+        return False
+    return _is_numeric(state.state)
+
+
 def calc_min(
     sensor_values: list[tuple[str, float, State]],
 ) -> tuple[dict[str, str | None], float | None]:
@@ -353,6 +367,15 @@ class SensorGroup(GroupEntity, SensorEntity):
         ] = CALC_TYPES[self._sensor_type]
         self._state_incorrect: set[str] = set()
         self._extra_state_attribute: dict[str, Any] = {}
+        # The members are processed incrementally, only the members which
+        # changed since the last update are read and converted again.
+        # None until all members were processed.
+        self._changed_members: set[str] | None = None
+        self._members: dict[str, _Member | None] = {}
+        # Number of members with a state, a known state and a numeric value
+        self._num_states = 0
+        self._num_known = 0
+        self._num_valid = 0
 
     def calculate_state_attributes(self, valid_state_entities: list[str]) -> None:
         """Calculate state attributes."""
@@ -367,89 +390,151 @@ class SensorGroup(GroupEntity, SensorEntity):
         )
         self._valid_units = self._get_valid_units()
 
+    @callback
+    def async_update_member_state(self, entity_id: str) -> None:
+        """Mark a member to be processed on the next update."""
+        if self._changed_members is not None:
+            self._changed_members.add(entity_id)
+
     @callback
     def async_update_group_state(self) -> None:
-        """Query all members and determine the sensor group state."""
-        self.calculate_state_attributes(self._get_valid_entities())
-        states: list[StateType] = []
-        valid_units = self._valid_units
-        valid_states: list[bool] = []
-        sensor_values: list[tuple[str, float, State]] = []
-        for entity_id in self._entity_ids:
-            if (state := self.hass.states.get(entity_id)) is not None:
-                states.append(state.state)
-                try:
-                    numeric_state = float(state.state)
-                    uom = state.attributes.get("unit_of_measurement")
-
-                    # Convert the state to the native unit of measurement when we have valid units
-                    # and a correct device class
-                    if valid_units and uom in valid_units and self._can_convert is True:
-                        numeric_state = UNIT_CONVERTERS[self.device_class].convert(
-                            numeric_state, uom, self.native_unit_of_measurement
-                        )
-
-                    # If we have valid units and the entity's unit does not match
-                    # we raise which skips the state and log a warning once
-                    if valid_units and uom not in valid_units:
-                        raise HomeAssistantError("Not a valid unit")  # noqa: TRY301
-
-                    sensor_values.append((entity_id, numeric_state, state))
-                    if entity_id in self._state_incorrect:
-                        self._state_incorrect.remove(entity_id)
-                    valid_states.append(True)
-                except ValueError:
-                    valid_states.append(False)
-                    # Log invalid states unless ignoring non numeric values
-                    if (
-                        not self._ignore_non_numeric
-                        and entity_id not in self._state_incorrect
-                    ):
-                        self._state_incorrect.add(entity_id)
-                        _LOGGER.warning(
-                            "Unable to use state. Only numerical states are supported,"
-                            " entity %s with value %s excluded from calculation in %s",
-                            entity_id,
-                            state.state,
-                            self.entity_id,
-                        )
-                    continue
-                except (KeyError, HomeAssistantError):
-                    # This exception handling can be simplified
-                    # once sensor entity doesn't allow incorrect unit of measurement
-                    # with a device class, implementation see PR #107639
-                    valid_states.append(False)
-                    if entity_id not in self._state_incorrect:
-                        self._state_incorrect.add(entity_id)
-                        _LOGGER.warning(
-                            "Unable to use state. Only entities with correct unit of measurement"
-                            " is supported,"
-                            " entity %s, value %s with device class %s"
-                            " and unit of measurement %s excluded from calculation in %s",
-                            entity_id,
-                            state.state,
-                            self.device_class,
-                            state.attributes.get("unit_of_measurement"),
-                            self.entity_id,
-                        )
+        """Determine the sensor group state from the changed members."""
+        changed_members: Iterable[str] | None = self._changed_members
+        self._changed_members = set()
+        attributes_changed = changed_members is None
+        if changed_members is None:
+            self._members = dict.fromkeys(self._entity_ids)
+            self._num_states = self._num_known = self._num_valid = 0
+            changed_members = self._entity_ids
+        states: dict[str, State | None] = {}
+        for entity_id in changed_members:
+            state = states[entity_id] = self.hass.states.get(entity_id)
+            if (member := self._members[entity_id]) is None or state is None:
+                attributes_changed |= (member is None) != (state is None)
+            elif member.state.attributes is not state.attributes or _is_numeric(
+                member.state.state
+            ) != _is_numeric(state.state):
+                attributes_changed = True
+
+        if attributes_changed:
+            units = (
+                self._valid_units,
+                self._can_convert,
+                self.native_unit_of_measurement,
+            )
+            self.calculate_state_attributes(self._get_valid_entities())
+            if units != (
+                self._valid_units,
+                self._can_convert,
+                self.native_unit_of_measurement,
+            ):
+                # The members are converted to another unit
+                states = {
+                    entity_id: self.hass.states.get(entity_id)
+                    for entity_id in self._entity_ids
+                }
+
+        for entity_id, state in states.items():
+            self._async_update_member(entity_id, state)
 
         # Set group as unavailable if all members do not have numeric values
-        self._attr_available = any(numeric_state for numeric_state in valid_states)
+        self._attr_available = self._num_valid > 0
 
-        valid_state = self.mode(
-            state not in (STATE_UNKNOWN, STATE_UNAVAILABLE) for state in states
-        )
-        valid_state_numeric = self.mode(numeric_state for numeric_state in valid_states)
-
-        if not valid_state or not valid_state_numeric:
+        if not self._mode_of_count(self._num_known) or not self._mode_of_count(
+            self._num_valid
+        ):
             self._attr_native_value = None
             return
 
         # Calculate values
+        sensor_values = [
+            (entity_id, member.value, member.state)
+            for entity_id, member in self._members.items()
+            if member is not None and member.value is not None
+        ]
         self._extra_state_attribute, self._attr_native_value = self._state_calc(
             sensor_values
         )
 
+    def _mode_of_count(self, count: int) -> bool:
+        """Return the mode of the member states given how many are true."""
+        if self.mode is all:
+            return count == self._num_states
+        return count > 0
+
+    @callback
+    def _async_update_member(self, entity_id: str, state: State | None) -> None:
+        """Convert the state of a member and update the member counts."""
+        if (old_member := self._members[entity_id]) is not None:
+            self._num_states -= 1
+            self._num_known -= old_member.known
+            self._num_valid -= old_member.value is not None
+        if state is None:
+            self._members[entity_id] = None
+            return
+
+        member = self._members[entity_id] = _Member(
+            state,
+            state.state not in (STATE_UNKNOWN, STATE_UNAVAILABLE),
+            self._convert_member_state(entity_id, state),
+        )
+        self._num_states += 1
+        self._num_known += member.known
+        self._num_valid += member.value is not None
+
+    def _convert_member_state(self, entity_id: str, state: State) -> float | None:
+        """Return the numeric state of a member in the group unit or None."""
+        valid_units = self._valid_units
+        try:
+            numeric_state = float(state.state)
+            uom = state.attributes.get("unit_of_measurement")
+
+            # Convert the state to the native unit of measurement when we have valid units
+            # and a correct device class
+            if valid_units and uom in valid_units and self._can_convert is True:
+                numeric_state = UNIT_CONVERTERS[self.device_class].convert(
+                    numeric_state, uom, self.native_unit_of_measurement
+                )
+
+            # If we have valid units and the entity's unit does not match
+            # we raise which skips the state and log a warning once
+            if valid_units and uom not in valid_units:
+                raise HomeAssistantError("Not a valid unit")  # noqa: TRY301
+
+            if entity_id in self._state_incorrect:
+                self._state_incorrect.remove(entity_id)
+        except ValueError:
+            # Log invalid states unless ignoring non numeric values
+            if not self._ignore_non_numeric and entity_id not in self._state_incorrect:
+                self._state_incorrect.add(entity_id)
+                _LOGGER.warning(
+                    "Unable to use state. Only numerical states are supported,"
+                    " entity %s with value %s excluded from calculation in %s",
+                    entity_id,
+                    state.state,
+                    self.entity_id,
+                )
+            return None
+        except (KeyError, HomeAssistantError):
+            # This exception handling can be simplified
+            # once sensor entity doesn't allow incorrect unit of measurement
+            # with a device class, implementation see PR #107639
+            if entity_id not in self._state_incorrect:
+                self._state_incorrect.add(entity_id)
+                _LOGGER.warning(
+                    "Unable to use state. Only entities with correct unit of measurement"
+                    " is supported,"
+                    " entity %s, value %s with device class %s"
+                    " and unit of measurement %s excluded from calculation in %s",
+                    entity_id,
+                    state.state,
+                    self.device_class,
+                    state.attributes.get("unit_of_measurement"),
+                    self.entity_id,
+                )
+            return None
+        return numeric_state
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes of the sensor."""
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping, ValuesView
+from collections.abc import Mapping
 import logging
 from typing import Any, NamedTuple, cast
 
@@ -27,6 +27,7 @@ from homeassistant.core import HomeAssistant, ServiceCall, State, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback, EntityPlatform
+from homeassistant.helpers.reference_index import ReferenceIndex
 from homeassistant.helpers.service import (
     async_extract_entity_ids,
     async_register_admin_service,
@@ -34,6 +35,7 @@ from homeassistant.helpers.service import (
 from homeassistant.helpers.state import async_reproduce_state
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.loader import async_get_integration
+from homeassistant.util.hass_dict import HassKey
 
 from .const import DOMAIN
 
@@ -82,6 +84,9 @@ def _ensure_no_intersection(value: dict[str, Any]) -> dict[str, Any]:
 CONF_SCENE_ID = "scene_id"
 CONF_SNAPSHOT = "snapshot_entities"
 DATA_PLATFORM = "homeassistant_scene"
+DATA_REFERENCES: HassKey[ReferenceIndex[HomeAssistantScene]] = HassKey(
+    "homeassistant_scene_references"
+)
 EVENT_SCENE_RELOADED = "scene_reloaded"
 STATES_SCHEMA = vol.All(dict, _convert_states)
 
@@ -138,16 +143,12 @@ class SceneConfig(NamedTuple):
 @callback
 def scenes_with_entity(hass: HomeAssistant, entity_id: str) -> list[str]:
     """Return all scenes that reference the entity."""
-    if DATA_PLATFORM not in hass.data:
+    if DATA_REFERENCES not in hass.data:
         return []
 
-    platform: EntityPlatform = hass.data[DATA_PLATFORM]
-
-    scene_entities = cast(ValuesView[HomeAssistantScene], platform.entities.values())
     return [
         scene_entity.entity_id
-        for scene_entity in scene_entities
-        if entity_id in scene_entity.scene_config.states
+        for scene_entity in hass.data[DATA_REFERENCES].async_get("entities", entity_id)
     ]
 
 
@@ -172,6 +173,7 @@ async def async_setup_platform(
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up Home Assistant scene entries."""
+    hass.data.setdefault(DATA_REFERENCES, ReferenceIndex())
     _process_scenes_config(hass, async_add_entities, config)
 
     # This platform can be loaded multiple times. Only first time register the service.
@@ -343,6 +345,18 @@ class HomeAssistantScene(Scene):
         """Return the name of the scene."""
         return self.scene_config.name
 
+    async def async_added_to_hass(self) -> None:
+        """Index the entities of the scene."""
+        await super().async_added_to_hass()
+        self.hass.data[DATA_REFERENCES].async_add(
+            self, {"entities": self.scene_config.states}
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Remove the scene from the reference index."""
+        await super().async_will_remove_from_hass()
+        self.hass.data[DATA_REFERENCES].async_remove(self)
+
     @property
     def icon(self) -> str | None:
         """Return the icon of the scene."""
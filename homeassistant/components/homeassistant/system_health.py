@@ -7,6 +7,8 @@ from typing import Any
 from homeassistant.components import system_health
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import system_info
+from homeassistant.helpers.polling import async_get_polling_stats
+from homeassistant.helpers.timer_wheel import async_get_pending_timers
 
 
 @callback
@@ -21,7 +23,7 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     info = await system_info.async_get_system_info(hass)
 
-    return {
+    health_info: dict[str, Any] = {
         "version": f"core-{info.get('version')}",
         "installation_type": info.get("installation_type"),
         "dev": info.get("dev"),
@@ -36,3 +38,22 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
         "timezone": info.get("timezone"),
         "config_dir": hass.config.config_dir,
     }
+    if (pending_timers := async_get_pending_timers(hass)) is not None:
+        health_info["pending_timers"] = ", ".join(
+            f"{integration}: {count}"
+            for integration, count in sorted(
+                pending_timers.items(), key=lambda item: item[1], reverse=True
+            )
+        )
+    if polling_stats := async_get_polling_stats(hass):
+        health_info["polled_platforms"] = len(polling_stats)
+        health_info["polling_overruns"] = sum(
+            stats["overruns"] for stats in polling_stats
+        )
+        health_info["slowest_polls"] = ", ".join(
+            f"{stats['platform']}: {stats['max_duration']:.2f}s"
+            for stats in sorted(
+                polling_stats, key=lambda stats: stats["max_duration"], reverse=True
+            )[:5]
+        )
+    return health_info
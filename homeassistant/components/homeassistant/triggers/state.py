@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
 from datetime import timedelta
+from itertools import count
 import logging
+from operator import attrgetter
+from typing import Any
 
 import voluptuous as vol
 
@@ -25,12 +27,13 @@ from homeassistant.helpers import (
     template,
 )
 from homeassistant.helpers.event import (
-    async_track_same_state,
+    async_call_later,
     async_track_state_change_event,
     process_state_match,
 )
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.hass_dict import HassKey
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,6 +43,10 @@ CONF_TO = "to"
 CONF_NOT_FROM = "not_from"
 CONF_NOT_TO = "not_to"
 
+DATA_STATE_TRIGGER_INDEX: HassKey[StateTriggerIndex] = HassKey(
+    "homeassistant_state_trigger_index"
+)
+
 BASE_SCHEMA = cv.TRIGGER_BASE_SCHEMA.extend(
     {
         vol.Required(CONF_PLATFORM): "state",
@@ -100,146 +107,361 @@ async def async_attach_trigger(
     platform_type: str = "state",
 ) -> CALLBACK_TYPE:
     """Listen for state changes based on configuration."""
+    trigger = _StateTrigger(hass, config, action, trigger_info, platform_type)
     entity_ids = config[CONF_ENTITY_ID]
-
-    if (from_state := config.get(CONF_FROM)) is not None:
-        match_from_state = process_state_match(from_state)
-    elif (not_from_state := config.get(CONF_NOT_FROM)) is not None:
-        match_from_state = process_state_match(not_from_state, invert=True)
-    else:
-        match_from_state = process_state_match(MATCH_ALL)
-
-    if (to_state := config.get(CONF_TO)) is not None:
-        match_to_state = process_state_match(to_state)
-    elif (not_to_state := config.get(CONF_NOT_TO)) is not None:
-        match_to_state = process_state_match(not_to_state, invert=True)
-    else:
-        match_to_state = process_state_match(MATCH_ALL)
-
-    time_delta = config.get(CONF_FOR)
-    # If neither CONF_FROM or CONF_TO are specified,
-    # fire on all changes to the state or an attribute
-    match_all = all(
-        item not in config for item in (CONF_FROM, CONF_NOT_FROM, CONF_NOT_TO, CONF_TO)
+    # Triggers of wait_for_trigger are not always validated with the schema
+    if isinstance(entity_ids, str):
+        entity_ids = [entity_ids]
+    return _async_get_index(hass).async_add(
+        trigger, [entity_id.lower() for entity_id in entity_ids]
     )
-    unsub_track_same: dict[str, Callable[[], None]] = {}
-    period: dict[str, timedelta] = {}
-    attribute = config.get(CONF_ATTRIBUTE)
-    job = HassJob(action, f"state trigger {trigger_info}")
 
-    trigger_data = trigger_info["trigger_data"]
-    _variables = trigger_info["variables"] or {}
 
-    @callback
-    def state_automation_listener(event: Event[EventStateChangedData]) -> None:
-        """Listen for state changes and calls action."""
-        entity = event.data["entity_id"]
-        from_s = event.data["old_state"]
-        to_s = event.data["new_state"]
+@callback
+def _async_get_index(hass: HomeAssistant) -> StateTriggerIndex:
+    """Return the shared state trigger index."""
+    if (index := hass.data.get(DATA_STATE_TRIGGER_INDEX)) is None:
+        index = hass.data[DATA_STATE_TRIGGER_INDEX] = StateTriggerIndex(hass)
+    return index
+
+
+def _get_value(state: State | None, attribute: str | None) -> Any:
+    """Return the value of the state or attribute a trigger watches."""
+    if state is None:
+        return None
+    if attribute is None:
+        return state.state
+    return state.attributes.get(attribute)
+
+
+class _StateTrigger:
+    """A state trigger compiled from its configuration."""
+
+    __slots__ = (
+        "_variables",
+        "attribute",
+        "config",
+        "from_only",
+        "hass",
+        "job",
+        "match_all",
+        "match_from_state",
+        "match_to_state",
+        "pending",
+        "platform_type",
+        "seq",
+        "time_delta",
+        "to_values",
+        "trigger_data",
+        "trigger_info",
+    )
 
-        if from_s is None:
-            old_value = None
-        elif attribute is None:
-            old_value = from_s.state
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config: ConfigType,
+        action: TriggerActionType,
+        trigger_info: TriggerInfo,
+        platform_type: str,
+    ) -> None:
+        """Compile the trigger configuration."""
+        self.hass = hass
+        self.config = config
+        self.platform_type = platform_type
+        self.trigger_info = trigger_info
+        self.trigger_data = trigger_info["trigger_data"]
+        self._variables = trigger_info["variables"] or {}
+        self.job = HassJob(action, f"state trigger {trigger_info}")
+        self.attribute: str | None = config.get(CONF_ATTRIBUTE)
+        self.time_delta = config.get(CONF_FOR)
+        self.seq = 0
+        self.pending: set[_PendingFor] = set()
+        # The exact state values this trigger can fire on, used to
+        # only visit the trigger for changes to one of those states
+        self.to_values: set[str] | None = None
+
+        if (from_state := config.get(CONF_FROM)) is not None:
+            self.match_from_state = process_state_match(from_state)
+        elif (not_from_state := config.get(CONF_NOT_FROM)) is not None:
+            self.match_from_state = process_state_match(not_from_state, invert=True)
         else:
-            old_value = from_s.attributes.get(attribute)
-
-        if to_s is None:
-            new_value = None
-        elif attribute is None:
-            new_value = to_s.state
+            self.match_from_state = process_state_match(MATCH_ALL)
+
+        if (to_state := config.get(CONF_TO)) is not None:
+            self.match_to_state = process_state_match(to_state)
+            if self.attribute is None and to_state != MATCH_ALL:
+                self.to_values = (
+                    {to_state}
+                    if isinstance(to_state, str) or not hasattr(to_state, "__iter__")
+                    else {*to_state}
+                )
+        elif (not_to_state := config.get(CONF_NOT_TO)) is not None:
+            self.match_to_state = process_state_match(not_to_state, invert=True)
         else:
-            new_value = to_s.attributes.get(attribute)
+            self.match_to_state = process_state_match(MATCH_ALL)
+
+        # If neither CONF_FROM or CONF_TO are specified,
+        # fire on all changes to the state or an attribute
+        self.match_all = all(
+            item not in config
+            for item in (CONF_FROM, CONF_NOT_FROM, CONF_NOT_TO, CONF_TO)
+        )
+        self.from_only = CONF_FROM in config and CONF_TO not in config
+
+    def __repr__(self) -> str:
+        """Return the representation."""
+        return f"<StateTrigger {self.trigger_info['name']}>"
 
+    @callback
+    def async_handle(
+        self,
+        event: Event[EventStateChangedData],
+        entry: _EntityTriggers,
+        old_value: Any,
+        new_value: Any,
+    ) -> None:
+        """Handle a state change of one of the watched entities."""
         # When we listen for state changes with `match_all`, we
         # will trigger even if just an attribute changes. When
         # we listen to just an attribute, we should ignore all
         # other attribute changes.
-        if attribute is not None and old_value == new_value:
+        if self.attribute is not None and old_value == new_value:
             return
 
         if (
-            not match_from_state(old_value)
-            or not match_to_state(new_value)
-            or (not match_all and old_value == new_value)
+            not self.match_from_state(old_value)
+            or not self.match_to_state(new_value)
+            or (not self.match_all and old_value == new_value)
         ):
             return
 
-        @callback
-        def call_action() -> None:
-            """Call action with right context."""
-            hass.async_run_hass_job(
-                job,
-                {
-                    "trigger": {
-                        **trigger_data,
-                        "platform": platform_type,
-                        "entity_id": entity,
-                        "from_state": from_s,
-                        "to_state": to_s,
-                        "for": time_delta if not time_delta else period[entity],
-                        "attribute": attribute,
-                        "description": f"state of {entity}",
-                    }
-                },
-                event.context,
-            )
-
-        if not time_delta:
-            call_action()
+        if not self.time_delta:
+            self.async_call_action(event, self.time_delta)
             return
 
-        data = {
+        data = event.data
+        variables = {
+            **self._variables,
             "trigger": {
                 "platform": "state",
-                "entity_id": entity,
-                "from_state": from_s,
-                "to_state": to_s,
-            }
+                "entity_id": data["entity_id"],
+                "from_state": data["old_state"],
+                "to_state": data["new_state"],
+            },
         }
-        variables = {**_variables, **data}
 
         try:
-            period[entity] = cv.positive_time_period(
-                template.render_complex(time_delta, variables)
+            period = cv.positive_time_period(
+                template.render_complex(self.time_delta, variables)
             )
         except (exceptions.TemplateError, vol.Invalid) as ex:
             _LOGGER.error(
-                "Error rendering '%s' for template: %s", trigger_info["name"], ex
+                "Error rendering '%s' for template: %s", self.trigger_info["name"], ex
             )
             return
 
-        def _check_same_state(_: str, _2: State | None, new_st: State | None) -> bool:
-            if new_st is None:
-                return False
+        pending = _PendingFor(self, entry, event, old_value, new_value, period)
+        pending.cancel_timer = async_call_later(self.hass, period, pending.async_fire)
+        self.pending.add(pending)
+        entry.pending.append(pending)
 
-            cur_value: str | None
-            if attribute is None:
-                cur_value = new_st.state
-            else:
-                cur_value = new_st.attributes.get(attribute)
+    @callback
+    def async_call_action(
+        self, event: Event[EventStateChangedData], period: timedelta | None
+    ) -> None:
+        """Call action with right context."""
+        entity = event.data["entity_id"]
+        self.hass.async_run_hass_job(
+            self.job,
+            {
+                "trigger": {
+                    **self.trigger_data,
+                    "platform": self.platform_type,
+                    "entity_id": entity,
+                    "from_state": event.data["old_state"],
+                    "to_state": event.data["new_state"],
+                    "for": period,
+                    "attribute": self.attribute,
+                    "description": f"state of {entity}",
+                }
+            },
+            event.context,
+        )
 
-            if CONF_FROM in config and CONF_TO not in config:
-                return cur_value != old_value
 
-            return cur_value == new_value
+class _PendingFor:
+    """A state trigger waiting for the state to stay the same for a period."""
 
-        unsub_track_same[entity] = async_track_same_state(
-            hass,
-            period[entity],
-            call_action,
-            _check_same_state,
-            entity_ids=entity,
-        )
+    __slots__ = (
+        "cancel_timer",
+        "entry",
+        "event",
+        "new_value",
+        "old_value",
+        "period",
+        "trigger",
+    )
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    def __init__(
+        self,
+        trigger: _StateTrigger,
+        entry: _EntityTriggers,
+        event: Event[EventStateChangedData],
+        old_value: Any,
+        new_value: Any,
+        period: timedelta,
+    ) -> None:
+        """Initialize the pending trigger."""
+        self.trigger = trigger
+        self.entry = entry
+        self.event = event
+        self.old_value = old_value
+        self.new_value = new_value
+        self.period = period
+        self.cancel_timer: CALLBACK_TYPE | None = None
+
+    def is_same(self, new_state: State | None) -> bool:
+        """Return if the state still matches the state that started the wait."""
+        if new_state is None:
+            return False
+        cur_value = _get_value(new_state, self.trigger.attribute)
+        if self.trigger.from_only:
+            return bool(cur_value != self.old_value)
+        return bool(cur_value == self.new_value)
 
     @callback
-    def async_remove() -> None:
-        """Remove state listeners async."""
-        unsub()
-        for async_remove in unsub_track_same.values():
-            async_remove()
-        unsub_track_same.clear()
-
-    return async_remove
+    def async_cancel(self) -> None:
+        """Stop waiting."""
+        if self.cancel_timer is not None:
+            self.cancel_timer()
+            self.cancel_timer = None
+        self.trigger.pending.discard(self)
+        self.entry.pending.remove(self)
+
+    @callback
+    def async_fire(self, _now: Any) -> None:
+        """Call the action once the state stayed the same for the period."""
+        self.cancel_timer = None
+        self.async_cancel()
+        self.trigger.async_call_action(self.event, self.period)
+
+
+class _EntityTriggers:
+    """The state triggers watching a single entity."""
+
+    __slots__ = ("by_to", "other", "pending", "unsub")
+
+    def __init__(self) -> None:
+        """Initialize the decision table."""
+        # Triggers that only fire for a known set of states, keyed by state
+        self.by_to: dict[str, list[_StateTrigger]] = {}
+        # Triggers that need to look at every change
+        self.other: list[_StateTrigger] = []
+        self.pending: list[_PendingFor] = []
+        self.unsub: CALLBACK_TYPE | None = None
+
+    @property
+    def empty(self) -> bool:
+        """Return if no triggers are left."""
+        return not self.by_to and not self.other
+
+
+class StateTriggerIndex:
+    """Match state changes against all state triggers.
+
+    Every watched entity has a single state change listener and a decision
+    table. Triggers that only fire for specific states are found with a dict
+    lookup on the new state, so a change only visits the triggers that can
+    fire for it. Waits for `for` are validated by the same listener instead
+    of a listener per pending trigger.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self._entities: dict[str, _EntityTriggers] = {}
+        self._seq = count()
+
+    @callback
+    def async_add(self, trigger: _StateTrigger, entity_ids: list[str]) -> CALLBACK_TYPE:
+        """Add a trigger for the entities and return a callback to remove it."""
+        trigger.seq = next(self._seq)
+        for entity_id in entity_ids:
+            if (entry := self._entities.get(entity_id)) is None:
+                entry = self._entities[entity_id] = _EntityTriggers()
+                entry.unsub = async_track_state_change_event(
+                    self.hass, entity_id, self._async_state_changed
+                )
+            if trigger.to_values is None:
+                entry.other.append(trigger)
+                continue
+            for to_value in trigger.to_values:
+                entry.by_to.setdefault(to_value, []).append(trigger)
+
+        @callback
+        def async_remove() -> None:
+            """Remove the trigger."""
+            self._async_remove(trigger, entity_ids)
+
+        return async_remove
+
+    @callback
+    def _async_remove(self, trigger: _StateTrigger, entity_ids: list[str]) -> None:
+        """Remove a trigger."""
+        for pending in list(trigger.pending):
+            pending.async_cancel()
+        for entity_id in entity_ids:
+            if (entry := self._entities.get(entity_id)) is None:
+                continue
+            if trigger.to_values is None:
+                if trigger in entry.other:
+                    entry.other.remove(trigger)
+            else:
+                for to_value in trigger.to_values:
+                    if (triggers := entry.by_to.get(to_value)) and trigger in triggers:
+                        triggers.remove(trigger)
+                        if not triggers:
+                            del entry.by_to[to_value]
+            if entry.empty:
+                del self._entities[entity_id]
+                if entry.unsub is not None:
+                    entry.unsub()
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Match a state change against the triggers of the entity."""
+        data = event.data
+        if (entry := self._entities.get(data["entity_id"])) is None:
+            return
+        from_s = data["old_state"]
+        to_s = data["new_state"]
+        # Waits started by this change must only be checked by the next one
+        pending = entry.pending.copy()
+
+        triggers: list[_StateTrigger] = entry.other
+        if to_s is not None and (matched := entry.by_to.get(to_s.state)):
+            triggers = (
+                sorted((*matched, *triggers), key=attrgetter("seq"))
+                if triggers
+                else matched
+            )
+
+        values: dict[str | None, tuple[Any, Any]] = {}
+        for trigger in triggers.copy():
+            if (attribute_values := values.get(trigger.attribute)) is None:
+                attribute_values = values[trigger.attribute] = (
+                    _get_value(from_s, trigger.attribute),
+                    _get_value(to_s, trigger.attribute),
+                )
+            try:
+                trigger.async_handle(event, entry, *attribute_values)
+            except Exception:
+                _LOGGER.exception(
+                    "Error while processing state change of %s for %s",
+                    data["entity_id"],
+                    trigger,
+                )
+
+        for pending_for in pending:
+            if pending_for.cancel_timer is not None and not pending_for.is_same(to_s):
+                pending_for.async_cancel()
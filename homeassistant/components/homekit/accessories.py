@@ -92,6 +92,7 @@ from .const import (
     TYPE_VALVE,
 )
 from .iidmanager import AccessoryIIDStorage
+from .notifications import NotificationPipeline
 from .util import (
     accessory_friendly_name,
     async_dismiss_setup_message,
@@ -308,7 +309,7 @@ class HomeAccessory(Accessory):  # type: ignore[misc]
             **kwargs,
         )
         self._reload_on_change_attrs = list(RELOAD_ON_CHANGE_ATTRS)
-        self.config = config or {}
+        self.config: dict[str, Any] = config or {}
         if device_id:
             self.device_id: str | None = device_id
             serial_number = device_id
@@ -633,11 +634,24 @@ class HomeAccessory(Accessory):  # type: ignore[misc]
             (self.entity_id,),
         )
 
+    def publish(
+        self,
+        value: Any,
+        sender: Characteristic,
+        sender_client_addr: tuple[str, int] | None = None,
+        immediate: bool = False,
+    ) -> None:
+        """Send a characteristic change through the notification pipeline."""
+        self.driver.notifications.publish(
+            self, value, sender, sender_client_addr, immediate
+        )
+
     @ha_callback
     def async_stop(self) -> None:
         """Cancel any subscriptions when the bridge is stopped."""
         while self._subscriptions:
             self._subscriptions.pop(0)()
+        self.driver.notifications.async_remove(self.aid)
 
     async def stop(self) -> None:
         """Stop the accessory.
@@ -700,6 +714,7 @@ class HomeDriver(AccessoryDriver):  # type: ignore[misc]
         self._bridge_name = bridge_name
         self._entry_title = entry_title
         self.iid_storage = iid_storage
+        self.notifications = NotificationPipeline(hass, self)
 
     @pyhap_callback  # type: ignore[misc]
     def pair(
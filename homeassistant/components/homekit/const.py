@@ -56,6 +56,7 @@ CONF_LOW_BATTERY_THRESHOLD = "low_battery_threshold"
 CONF_MAX_FPS = "max_fps"
 CONF_MAX_HEIGHT = "max_height"
 CONF_MAX_WIDTH = "max_width"
+CONF_NOTIFY_INTERVAL = "notify_interval"
 CONF_STREAM_ADDRESS = "stream_address"
 CONF_STREAM_SOURCE = "stream_source"
 CONF_SUPPORT_AUDIO = "support_audio"
@@ -77,6 +78,7 @@ DEFAULT_LOW_BATTERY_THRESHOLD = 20
 DEFAULT_MAX_FPS = 30
 DEFAULT_MAX_HEIGHT = 1080
 DEFAULT_MAX_WIDTH = 1920
+DEFAULT_NOTIFY_INTERVAL = 1.0
 DEFAULT_PORT = 21063
 DEFAULT_CONFIG_FLOW_PORT = 21064
 DEFAULT_VIDEO_CODEC = VIDEO_CODEC_LIBX264
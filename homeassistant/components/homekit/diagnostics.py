@@ -40,6 +40,7 @@ async def async_get_config_entry_diagnostics(
             data["bridge"] = _get_bridge_diagnostics(hass, driver.accessory)
         else:
             data["accessory"] = _get_accessory_diagnostics(hass, driver.accessory)
+    data["notifications"] = homekit.driver.notifications.async_diagnostics()
     data.update(driver.get_accessories())
     state: State = driver.state
     data.update(
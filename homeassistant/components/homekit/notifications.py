@@ -0,0 +1,163 @@
+"""Coalesce the characteristic notifications sent to HomeKit controllers."""
+
+from __future__ import annotations
+
+from asyncio import TimerHandle
+import threading
+from typing import TYPE_CHECKING, Any
+
+from pyhap.characteristic import (
+    HAP_FORMAT_NUMERICS,
+    PROP_FORMAT,
+    PROP_VALID_VALUES,
+    Characteristic,
+)
+from pyhap.const import HAP_REPR_AID, HAP_REPR_IID, HAP_REPR_VALUE
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import CONF_NOTIFY_INTERVAL, DEFAULT_NOTIFY_INTERVAL
+
+if TYPE_CHECKING:
+    from .accessories import HomeAccessory, HomeDriver
+
+
+def is_continuous(char: Characteristic) -> bool:
+    """Return if only the latest value of a characteristic matters.
+
+    Numeric characteristics without a list of valid values (brightness,
+    temperature, position, ...) are continuous. Intermediate values of
+    discrete characteristics like motion or contact states must not be
+    dropped.
+    """
+    properties = char.properties
+    return (
+        properties[PROP_FORMAT] in HAP_FORMAT_NUMERICS
+        and PROP_VALID_VALUES not in properties
+    )
+
+
+class _AccessoryNotifications:
+    """Notification state of an accessory."""
+
+    __slots__ = ("coalesced", "interval", "last_sent", "pending", "sent", "timer")
+
+    def __init__(self, interval: float) -> None:
+        """Initialize the state."""
+        self.interval = interval
+        self.last_sent = 0.0
+        # iid to the latest notification and the client that caused it
+        self.pending: dict[int, tuple[dict[str, Any], tuple[str, int] | None]] = {}
+        self.timer: TimerHandle | None = None
+        self.sent = 0
+        self.coalesced = 0
+
+
+class NotificationPipeline:
+    """Rate limit the notifications of the accessories of a bridge.
+
+    The first change of a continuous characteristic is sent right away, the
+    changes within the notification interval of the accessory afterwards are
+    coalesced and only the latest value of each characteristic is sent as a
+    batch at the end of the interval. Discrete and immediate characteristics
+    are never delayed.
+    """
+
+    def __init__(self, hass: HomeAssistant, driver: HomeDriver) -> None:
+        """Initialize the pipeline."""
+        self._hass = hass
+        self._driver = driver
+        self._accessories: dict[int, _AccessoryNotifications] = {}
+
+    def publish(
+        self,
+        accessory: HomeAccessory,
+        value: Any,
+        sender: Characteristic,
+        sender_client_addr: tuple[str, int] | None,
+        immediate: bool,
+    ) -> None:
+        """Publish a characteristic change."""
+        data = {
+            HAP_REPR_AID: accessory.aid,
+            HAP_REPR_IID: accessory.iid_manager.get_iid(sender),
+            HAP_REPR_VALUE: value,
+        }
+        if self._hass.loop_thread_id != threading.get_ident():
+            self._driver.publish(data, sender_client_addr, immediate)
+            return
+        aid: int = accessory.aid
+        if (notifications := self._accessories.get(aid)) is None:
+            notifications = self._accessories[aid] = _AccessoryNotifications(
+                accessory.config.get(CONF_NOTIFY_INTERVAL, DEFAULT_NOTIFY_INTERVAL)
+            )
+        if immediate or not is_continuous(sender):
+            notifications.sent += 1
+            self._driver.publish(data, sender_client_addr, immediate)
+            return
+        self._async_publish_continuous(notifications, data, sender_client_addr)
+
+    @callback
+    def _async_publish_continuous(
+        self,
+        notifications: _AccessoryNotifications,
+        data: dict[str, Any],
+        sender_client_addr: tuple[str, int] | None,
+    ) -> None:
+        """Send or coalesce a change of a continuous characteristic."""
+        now = self._hass.loop.time()
+        if notifications.timer is None and (
+            now - notifications.last_sent >= notifications.interval
+        ):
+            notifications.last_sent = now
+            notifications.sent += 1
+            self._driver.publish(data, sender_client_addr)
+            return
+        iid: int = data[HAP_REPR_IID]
+        if iid in notifications.pending:
+            notifications.coalesced += 1
+        notifications.pending[iid] = (data, sender_client_addr)
+        if notifications.timer is None:
+            notifications.timer = self._hass.loop.call_at(
+                notifications.last_sent + notifications.interval,
+                self._async_flush,
+                notifications,
+            )
+
+    @callback
+    def _async_flush(self, notifications: _AccessoryNotifications) -> None:
+        """Send the latest values coalesced for an accessory."""
+        notifications.timer = None
+        notifications.last_sent = self._hass.loop.time()
+        pending = notifications.pending
+        notifications.pending = {}
+        notifications.sent += len(pending)
+        for data, sender_client_addr in pending.values():
+            self._driver.publish(data, sender_client_addr)
+
+    @callback
+    def async_remove(self, aid: int) -> None:
+        """Drop the pending notifications of a stopped accessory."""
+        if (notifications := self._accessories.pop(aid, None)) is None:
+            return
+        if notifications.timer is not None:
+            notifications.timer.cancel()
+            notifications.timer = None
+
+    @callback
+    def async_diagnostics(self) -> dict[str, Any]:
+        """Return the notification counters."""
+        accessories = {
+            aid: {
+                "interval": notifications.interval,
+                "sent": notifications.sent,
+                "coalesced": notifications.coalesced,
+                "pending": len(notifications.pending),
+            }
+            for aid, notifications in self._accessories.items()
+        }
+        return {
+            "sent": sum(acc["sent"] for acc in accessories.values()),
+            "coalesced": sum(acc["coalesced"] for acc in accessories.values()),
+            "accessories": accessories,
+        }
@@ -69,6 +69,7 @@ from .const import (
     CONF_MAX_FPS,
     CONF_MAX_HEIGHT,
     CONF_MAX_WIDTH,
+    CONF_NOTIFY_INTERVAL,
     CONF_STREAM_ADDRESS,
     CONF_STREAM_COUNT,
     CONF_STREAM_SOURCE,
@@ -137,6 +138,7 @@ BASIC_INFO_SCHEMA = vol.Schema(
         vol.Optional(
             CONF_LOW_BATTERY_THRESHOLD, default=DEFAULT_LOW_BATTERY_THRESHOLD
         ): cv.positive_int,
+        vol.Optional(CONF_NOTIFY_INTERVAL): cv.positive_float,
     }
 )
 
@@ -175,7 +175,13 @@ def apply_states_filters(sel: Select, start_day: float, end_day: float) -> Selec
         sel.filter(
             (States.last_updated_ts > start_day) & (States.last_updated_ts < end_day)
         )
-        .outerjoin(OLD_STATE, (States.old_state_id == OLD_STATE.state_id))
+        # The old state is always older than the new state, bounding it lets
+        # partitioned databases skip the partitions newer than end_day
+        .outerjoin(
+            OLD_STATE,
+            (States.old_state_id == OLD_STATE.state_id)
+            & (OLD_STATE.last_updated_ts < end_day),
+        )
         .where(_missing_state_matcher())
         .where(_not_continuous_entity_matcher())
         .where(
@@ -25,6 +25,9 @@ MYSQLDB_URL_PREFIX = "mysql://"
 MYSQLDB_PYMYSQL_URL_PREFIX = "mysql+pymysql://"
 DOMAIN = "recorder"
 
+# Fired with the statistic_id when statistics were imported or adjusted
+EVENT_RECORDER_STATISTICS_UPDATED = "recorder_statistics_updated"
+
 CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 
 MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
@@ -79,7 +79,13 @@ from .db_schema import (
 )
 from .executor import DBInterruptibleThreadPoolExecutor
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
+from .partition import (
+    PartitionInterval,
+    create_upcoming_partitions,
+    partitioning_supported,
+)
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeScheduler
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -97,6 +103,7 @@ from .tasks import (
     DatabaseLockTask,
     ImportStatisticsTask,
     KeepAliveTask,
+    PartitionMaintenanceTask,
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
@@ -164,6 +171,7 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        partition_interval: PartitionInterval | None = None,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -174,6 +182,8 @@ class Recorder(threading.Thread):
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
         self.keep_days = keep_days
+        self.partition_interval = partition_interval
+        self.partitioned_tables: set[str] = set()
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
@@ -211,6 +221,7 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.purge_scheduler = PurgeScheduler()
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -509,6 +520,8 @@ class Recorder(threading.Thread):
     @callback
     def async_nightly_tasks(self, now: datetime) -> None:
         """Trigger the purge."""
+        if self.partitioned_tables:
+            self.queue_task(PartitionMaintenanceTask())
         if self.auto_purge:
             # Purge will schedule the periodic cleanups
             # after it completes to ensure it does not happen
@@ -779,6 +792,9 @@ class Recorder(threading.Thread):
             self._dismiss_migration_in_progress()
             self._setup_run()
 
+        if self.partition_interval is not None:
+            self._setup_partitions()
+
         # Catch up with missed statistics
         self._schedule_compile_missing_statistics()
         _LOGGER.debug("Recorder processing the queue")
@@ -985,6 +1001,23 @@ class Recorder(threading.Thread):
         else:
             return (True, new_schema_status)
 
+    def _setup_partitions(self) -> None:
+        """Convert the tables to partitioned tables and create upcoming partitions."""
+        assert self.partition_interval is not None
+        if not partitioning_supported(self.dialect_name):
+            _LOGGER.warning(
+                "Partitioned tables are only supported with PostgreSQL, "
+                "the database will not be partitioned"
+            )
+            return
+        try:
+            self.partitioned_tables = migration.migrate_to_partitioned_tables(
+                self, self.get_session, self.partition_interval
+            )
+            create_upcoming_partitions(self)
+        except SQLAlchemyError:
+            _LOGGER.exception("Error while setting up the partitioned tables")
+
     def _lock_database(self, task: DatabaseLockTask) -> None:
         @callback
         def _async_set_database_locked(task: DatabaseLockTask) -> None:
@@ -650,10 +650,15 @@ class StateAttributes(Base):
                 exclude_attrs -= _MATCH_ALL_KEEP
         else:
             exclude_attrs = ALL_DOMAIN_EXCLUDE_ATTRS
-        encoder = json_bytes_strip_null if dialect == PSQL_DIALECT else json_bytes
-        bytes_result = encoder(
-            {k: v for k, v in state.attributes.items() if k not in exclude_attrs}
-        )
+        if dialect != PSQL_DIALECT and exclude_attrs.isdisjoint(state.attributes):
+            # Reuse the JSON string of the attributes already encoded for the
+            # websocket API or carried over from the previous state
+            bytes_result = state.attributes_json
+        else:
+            encoder = json_bytes_strip_null if dialect == PSQL_DIALECT else json_bytes
+            bytes_result = encoder(
+                {k: v for k, v in state.attributes.items() if k not in exclude_attrs}
+            )
         if len(bytes_result) > MAX_STATE_ATTRS_BYTES:
             _LOGGER.warning(
                 "State attributes for %s exceed maximum size of %s bytes. "
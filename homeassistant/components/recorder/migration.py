@@ -30,6 +30,7 @@ from sqlalchemy.sql.expression import true
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.ulid import ulid_at_time, ulid_to_bytes
 
@@ -82,6 +83,12 @@ from .db_schema import (
 )
 from .models import process_timestamp
 from .models.time import datetime_to_timestamp_or_none
+from .partition import (
+    PARTITIONED_TABLES,
+    PartitionInterval,
+    convert_to_partitioned_table,
+    get_partitioned_tables,
+)
 from .queries import (
     batch_cleanup_entity_ids,
     delete_duplicate_short_term_statistics_row,
@@ -2343,6 +2350,33 @@ def post_migrate_entity_ids(instance: Recorder) -> bool:
     return is_done
 
 
+def migrate_to_partitioned_tables(
+    instance: Recorder,
+    session_maker: Callable[[], Session],
+    interval: PartitionInterval,
+) -> set[str]:
+    """Convert the tables that support partitioning to partitioned tables.
+
+    Returns the names of the partitioned tables.
+    """
+    now = dt_util.utcnow()
+    with session_scope(session=session_maker(), read_only=True) as session:
+        partitioned_tables = get_partitioned_tables(session)
+    for table in PARTITIONED_TABLES:
+        if table in partitioned_tables:
+            continue
+        _LOGGER.warning(
+            "Converting the %s table to a table partitioned by %s. %s",
+            table,
+            interval,
+            MIGRATION_NOTE_MINUTES,
+        )
+        with session_scope(session=session_maker()) as session:
+            convert_to_partitioned_table(session, table, interval, now)
+        partitioned_tables.add(table)
+    return partitioned_tables
+
+
 def _initialize_database(session: Session) -> bool:
     """Initialize a new database.
 
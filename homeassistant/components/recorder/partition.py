@@ -0,0 +1,342 @@
+"""Time based range partitioning of the states, events and short term statistics tables.
+
+Partitioning is optional and only supported on PostgreSQL. MySQL and MariaDB
+can only range partition on integer expressions, which rules out the DOUBLE
+timestamp columns, and InnoDB does not allow foreign keys on partitioned tables.
+
+When a table is converted, the existing table is attached as a single legacy
+partition holding every row older than the first boundary, and new rows are
+written to daily or weekly partitions that are created ahead of time. Purging
+drops every partition that is entirely older than the purge cutoff, so only the
+partition that straddles the cutoff still needs row deletes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import StrEnum
+import logging
+import re
+from typing import TYPE_CHECKING
+
+from sqlalchemy import text
+from sqlalchemy.orm.session import Session
+from sqlalchemy.schema import CreateIndex
+
+import homeassistant.util.dt as dt_util
+
+from .const import SupportedDialect
+from .db_schema import TABLE_EVENTS, TABLE_STATES, TABLE_STATISTICS_SHORT_TERM, Base
+from .util import session_scope
+
+if TYPE_CHECKING:
+    from . import Recorder
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PartitionInterval(StrEnum):
+    """Supported partition intervals."""
+
+    DAY = "day"
+    WEEK = "week"
+
+
+@dataclass(frozen=True, slots=True)
+class PartitionedTable:
+    """Describe a table that can be partitioned."""
+
+    table: str
+    id_column: str
+    ts_column: str
+    # A column holding ids of rows in another table that must be
+    # checked for orphans after a partition has been dropped
+    linked_id_column: str | None
+
+
+PARTITIONED_TABLES: dict[str, PartitionedTable] = {
+    TABLE_STATES: PartitionedTable(
+        TABLE_STATES, "state_id", "last_updated_ts", "attributes_id"
+    ),
+    TABLE_EVENTS: PartitionedTable(
+        TABLE_EVENTS, "event_id", "time_fired_ts", "data_id"
+    ),
+    TABLE_STATISTICS_SHORT_TERM: PartitionedTable(
+        TABLE_STATISTICS_SHORT_TERM, "id", "start_ts", None
+    ),
+}
+
+# Number of future partitions to keep available for new rows
+PARTITIONS_AHEAD = 3
+
+LEGACY_PARTITION_SUFFIX = "legacy"
+DEFAULT_PARTITION_SUFFIX = "default"
+
+_BOUND_RE = re.compile(r"FROM \((?:'?([^')]+)'?)\) TO \((?:'?([^')]+)'?)\)")
+
+
+def partitioning_supported(dialect_name: SupportedDialect | None) -> bool:
+    """Return if the dialect supports partitioned tables."""
+    return dialect_name == SupportedDialect.POSTGRESQL
+
+
+def partition_start(interval: PartitionInterval, when: datetime) -> datetime:
+    """Return the start of the partition containing when."""
+    start = dt_util.as_utc(when).replace(hour=0, minute=0, second=0, microsecond=0)
+    if interval is PartitionInterval.WEEK:
+        start -= timedelta(days=start.weekday())
+    return start
+
+
+def partition_step(interval: PartitionInterval) -> timedelta:
+    """Return the length of a partition."""
+    return timedelta(days=7 if interval is PartitionInterval.WEEK else 1)
+
+
+def partition_name(table: str, start: datetime) -> str:
+    """Return the name of the partition starting at start."""
+    return f"{table}_p{start:%Y%m%d}"
+
+
+def parse_partition_bound(bound: str) -> tuple[float | None, float | None] | None:
+    """Parse a PostgreSQL range partition bound expression.
+
+    Returns None for the default partition, or the lower and upper
+    bound where None means MINVALUE/MAXVALUE.
+    """
+    if not (match := _BOUND_RE.search(bound)):
+        return None
+    lower, upper = match.groups()
+    return (
+        None if lower == "MINVALUE" else float(lower),
+        None if upper == "MAXVALUE" else float(upper),
+    )
+
+
+def get_partitioned_tables(session: Session) -> set[str]:
+    """Return the names of the tables that are partitioned."""
+    return {
+        relname
+        for (relname,) in session.execute(
+            text(
+                "SELECT c.relname FROM pg_partitioned_table p "
+                "JOIN pg_class c ON c.oid = p.partrelid "
+                "WHERE pg_table_is_visible(c.oid)"
+            )
+        )
+        if relname in PARTITIONED_TABLES
+    }
+
+
+def get_partitions(
+    session: Session, table: str
+) -> list[tuple[str, float | None, float | None]]:
+    """Return the range partitions of a table ordered by their lower bound."""
+    partitions: list[tuple[str, float | None, float | None]] = []
+    for name, bound in session.execute(
+        text(
+            "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) "
+            "FROM pg_inherits i "
+            "JOIN pg_class parent ON parent.oid = i.inhparent "
+            "JOIN pg_class child ON child.oid = i.inhrelid "
+            "WHERE parent.relname = :table AND pg_table_is_visible(parent.oid)"
+        ),
+        {"table": table},
+    ):
+        if (bounds := parse_partition_bound(bound)) is not None:
+            partitions.append((name, *bounds))
+    partitions.sort(key=lambda partition: partition[1] or float("-inf"))
+    return partitions
+
+
+def create_partitions(
+    session: Session, table: str, interval: PartitionInterval, now: datetime
+) -> None:
+    """Create the partitions for now and the next PARTITIONS_AHEAD intervals."""
+    step = partition_step(interval)
+    partitions = get_partitions(session, table)
+    existing = {name for name, _, _ in partitions}
+    highest_upper = max((upper for _, _, upper in partitions if upper), default=0.0)
+    start = partition_start(interval, now)
+    for _ in range(PARTITIONS_AHEAD + 1):
+        end = start + step
+        name = partition_name(table, start)
+        # The legacy partition may already cover part of this range
+        lower = max(start.timestamp(), highest_upper)
+        if name not in existing and lower < end.timestamp():
+            _LOGGER.debug("Creating partition %s", name)
+            session.execute(
+                text(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+                    f"FOR VALUES FROM ({lower}) TO ({end.timestamp()})"
+                )
+            )
+            highest_upper = end.timestamp()
+        start = end
+
+
+def create_upcoming_partitions(instance: Recorder) -> None:
+    """Create the upcoming partitions of all partitioned tables.
+
+    Must run in the recorder thread.
+    """
+    assert instance.partition_interval is not None
+    now = dt_util.utcnow()
+    with session_scope(session=instance.get_session()) as session:
+        for table in instance.partitioned_tables:
+            create_partitions(session, table, instance.partition_interval, now)
+
+
+def drop_partitions_before(
+    instance: Recorder, session: Session, table: str, purge_before: datetime
+) -> set[int]:
+    """Drop every partition of table that is entirely older than purge_before.
+
+    Returns the linked ids (attributes_id or data_id) referenced by
+    the dropped rows so the caller can purge orphans.
+    """
+    partitioned_table = PARTITIONED_TABLES[table]
+    purge_before_ts = purge_before.timestamp()
+    expired: list[str] = []
+    boundary: float | None = None
+    for name, _, upper in get_partitions(session, table):
+        if upper is None or upper > purge_before_ts:
+            break
+        expired.append(name)
+        boundary = upper
+    linked_ids: set[int] = set()
+    for name in expired:
+        if linked_column := partitioned_table.linked_id_column:
+            linked_ids.update(
+                linked_id
+                for (linked_id,) in session.execute(
+                    text(
+                        f"SELECT DISTINCT {linked_column} FROM {name} "  # noqa: S608
+                        f"WHERE {linked_column} IS NOT NULL"
+                    )
+                )
+            )
+        if table == TABLE_STATES:
+            # Unlink the newer states from the states about to be dropped like
+            # _purge_state_ids does, only the remaining partitions are scanned
+            # so the rows of the dropped partitions are not rewritten
+            session.execute(
+                text(
+                    f"UPDATE {table} SET old_state_id = NULL "  # noqa: S608
+                    f"WHERE {partitioned_table.ts_column} >= :boundary "
+                    f"AND old_state_id IN (SELECT state_id FROM {name})"
+                ),
+                {"boundary": boundary},
+            )
+            if max_state_id := session.execute(
+                text(f"SELECT MAX(state_id) FROM {name}")  # noqa: S608
+            ).scalar():
+                instance.states_manager.evict_purged_state_ids_up_to(max_state_id)
+        _LOGGER.debug("Dropping partition %s", name)
+        session.execute(text(f"DROP TABLE {name} CASCADE"))
+    return linked_ids
+
+
+def convert_to_partitioned_table(
+    session: Session, table: str, interval: PartitionInterval, now: datetime
+) -> None:
+    """Convert a table to a range partitioned table.
+
+    The existing table is renamed and attached as the legacy partition
+    so no rows need to be copied.
+    """
+    partitioned_table = PARTITIONED_TABLES[table]
+    id_column = partitioned_table.id_column
+    ts_column = partitioned_table.ts_column
+    legacy = f"{table}_{LEGACY_PARTITION_SUFFIX}"
+    sequence = f"{table}_{id_column}_partitioned_seq"
+    metadata_table = Base.metadata.tables[table]
+
+    next_id, newest_ts = session.execute(
+        text(
+            f"SELECT COALESCE(MAX({id_column}), 0) + 1, MAX({ts_column}) "  # noqa: S608
+            f"FROM {table}"
+        )
+    ).one()
+    # The legacy partition must hold every existing row, including the
+    # rows of the current interval and any rows from the future
+    newest = now
+    if newest_ts is not None and newest_ts > now.timestamp():
+        newest = dt_util.utc_from_timestamp(newest_ts)
+    boundary = (
+        partition_start(interval, newest) + partition_step(interval)
+    ).timestamp()
+    # Rows are always written with a timestamp, but the range partition
+    # constraint does not accept NULL so make any stray rows purgeable.
+    session.execute(
+        text(f"UPDATE {table} SET {ts_column} = 0 WHERE {ts_column} IS NULL")  # noqa: S608
+    )
+    session.execute(text(f"ALTER TABLE {table} RENAME TO {legacy}"))
+    # A table referenced by a foreign key cannot be attached as a partition,
+    # this drops the self reference of old_state_id of the states table
+    for constraint, referencing_table in session.execute(
+        text(
+            "SELECT conname, conrelid::regclass::text FROM pg_constraint "
+            "WHERE contype = 'f' AND confrelid = CAST(:table AS regclass)"
+        ),
+        {"table": legacy},
+    ).all():
+        session.execute(
+            text(f'ALTER TABLE {referencing_table} DROP CONSTRAINT "{constraint}"')
+        )
+    for (index_name,) in session.execute(
+        text(
+            "SELECT indexname FROM pg_indexes WHERE tablename = :table "
+            "AND indexname LIKE 'ix_%'"
+        ),
+        {"table": legacy},
+    ).all():
+        session.execute(text(f"ALTER INDEX {index_name} RENAME TO {index_name}_legacy"))
+    session.execute(
+        text(f"ALTER TABLE {legacy} ALTER COLUMN {id_column} DROP IDENTITY IF EXISTS")
+    )
+    session.execute(text(f"ALTER TABLE {legacy} ALTER COLUMN {id_column} DROP DEFAULT"))
+    session.execute(
+        text(
+            f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS) "
+            f"PARTITION BY RANGE ({ts_column})"
+        )
+    )
+    session.execute(text(f"CREATE SEQUENCE {sequence} START WITH {next_id}"))
+    session.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY {table}.{id_column}"))
+    session.execute(
+        text(
+            f"ALTER TABLE {table} ALTER COLUMN {id_column} "
+            f"SET DEFAULT nextval('{sequence}')"
+        )
+    )
+    connection = session.connection()
+    for index in metadata_table.indexes:
+        connection.execute(CreateIndex(index))  # type: ignore[no-untyped-call]
+    for foreign_key in metadata_table.foreign_keys:
+        # A partitioned table cannot be referenced by a foreign key
+        # because its primary key must include the partition column
+        if foreign_key.column.table.name == table:
+            continue
+        on_delete = f" ON DELETE {foreign_key.ondelete}" if foreign_key.ondelete else ""
+        session.execute(
+            text(
+                f"ALTER TABLE {table} ADD FOREIGN KEY ({foreign_key.parent.name}) "
+                f"REFERENCES {foreign_key.column.table.name} "
+                f"({foreign_key.column.name}){on_delete}"
+            )
+        )
+    session.execute(
+        text(
+            f"ALTER TABLE {table} ATTACH PARTITION {legacy} "
+            f"FOR VALUES FROM (MINVALUE) TO ({boundary})"
+        )
+    )
+    session.execute(
+        text(
+            f"CREATE TABLE {table}_{DEFAULT_PARTITION_SUFFIX} "
+            f"PARTITION OF {table} DEFAULT"
+        )
+    )
+    create_partitions(session, table, interval, now)
@@ -6,14 +6,15 @@ from collections.abc import Callable
 from datetime import datetime
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
 
 from homeassistant.util.collection import chunked_or_all
 
-from .db_schema import Events, States, StatesMeta
+from .db_schema import TABLE_EVENTS, TABLE_STATES, Events, States, StatesMeta
 from .models import DatabaseEngine
+from .partition import drop_partitions_before
 from .queries import (
     attributes_ids_exist_in_states,
     attributes_ids_exist_in_states_with_fast_in_distinct,
@@ -36,6 +37,7 @@ from .queries import (
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_oldest_state,
     find_short_term_statistics_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
@@ -52,6 +54,155 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# The wall time we aim for a single purge pass to hold the database
+PURGE_TARGET_PASS_DURATION = 1.0
+# When the queue backlog reaches this size we purge with the smallest
+# batches so pending events are committed between passes as soon as possible
+PURGE_BACKLOG_YIELD_THRESHOLD = 1000
+# Fast passes grow the batch sizes up to this many times the defaults. The
+# bound keeps a pass short if deleting a batch suddenly gets slower, since
+# the batch sizes are only adapted once the pass is done
+PURGE_MAX_BATCH_SIZE_FACTOR = 4
+
+
+def _adjust_batch_size(
+    batch_size: int, max_batch_size: int, duration: float, backlog: int
+) -> int:
+    """Return the batch size to use for the next purge pass."""
+    if backlog >= PURGE_BACKLOG_YIELD_THRESHOLD:
+        return 1
+    if duration > PURGE_TARGET_PASS_DURATION:
+        return max(1, batch_size // 2)
+    if duration < PURGE_TARGET_PASS_DURATION / 2:
+        return min(max_batch_size, batch_size + max(1, batch_size // 2))
+    return batch_size
+
+
+class PurgeScheduler:
+    """Adapt purge batch sizes and track the progress of a purge.
+
+    A purge runs as a sequence of PurgeTask passes in the recorder thread.
+    A pass that did not finish is re-queued behind the pending events so
+    the size of each pass determines how long event commits are delayed.
+    The batch sizes are halved when a pass exceeds the target duration or
+    the backlog is growing and are increased again when passes are fast.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the purge scheduler."""
+        self.states_batch_size = DEFAULT_STATES_BATCHES_PER_PURGE
+        self.events_batch_size = DEFAULT_EVENTS_BATCHES_PER_PURGE
+        self.passes = 0
+        self.last_pass_duration: float | None = None
+        self._batches_duration: float | None = None
+        self._purge_before: datetime | None = None
+        self._started: float | None = None
+        self._first_oldest_ts: float | None = None
+        self._oldest_ts: float | None = None
+
+    @property
+    def in_progress(self) -> bool:
+        """Return if a purge is in progress."""
+        return self._purge_before is not None
+
+    @property
+    def progress(self) -> float | None:
+        """Return the fraction of the current purge that has completed."""
+        if (
+            self._purge_before is None
+            or self._first_oldest_ts is None
+            or self._oldest_ts is None
+        ):
+            return None
+        total = self._purge_before.timestamp() - self._first_oldest_ts
+        if total <= 0:
+            return 1.0
+        return min(1.0, max(0.0, (self._oldest_ts - self._first_oldest_ts) / total))
+
+    @property
+    def estimated_time_remaining(self) -> float | None:
+        """Return the estimated seconds until the current purge completes."""
+        if not (progress := self.progress) or self._started is None:
+            return None
+        elapsed = time.monotonic() - self._started
+        return elapsed * (1 - progress) / progress
+
+    def start_pass(self, session: Session, purge_before: datetime) -> None:
+        """Record the start of a purge pass.
+
+        Must run in the recorder thread.
+        """
+        if self._purge_before != purge_before:
+            self._purge_before = purge_before
+            self._started = time.monotonic()
+            self._first_oldest_ts = None
+            self.passes = 0
+        self._batches_duration = None
+        oldest_ts = session.execute(find_oldest_state()).scalar()
+        if self._first_oldest_ts is None:
+            self._first_oldest_ts = oldest_ts
+        self._oldest_ts = oldest_ts
+
+    def record_batches(self, duration: float) -> None:
+        """Record how long purging the batches of the pass took.
+
+        Must run in the recorder thread.
+        """
+        self._batches_duration = duration
+
+    def finish_pass(self, backlog: int, finished: bool) -> None:
+        """Record the end of a purge pass and adapt the batch sizes.
+
+        The batch sizes are adapted to the time it took to purge the batches,
+        which excludes the cleanups, filtering and repacking done once the
+        purge is finished. They are kept as is when the pass failed before
+        the batches were purged.
+
+        Must run in the recorder thread.
+        """
+        self.passes += 1
+        if (duration := self._batches_duration) is not None:
+            self.last_pass_duration = duration
+            self.states_batch_size = _adjust_batch_size(
+                self.states_batch_size,
+                DEFAULT_STATES_BATCHES_PER_PURGE * PURGE_MAX_BATCH_SIZE_FACTOR,
+                duration,
+                backlog,
+            )
+            self.events_batch_size = _adjust_batch_size(
+                self.events_batch_size,
+                DEFAULT_EVENTS_BATCHES_PER_PURGE * PURGE_MAX_BATCH_SIZE_FACTOR,
+                duration,
+                backlog,
+            )
+            _LOGGER.debug(
+                "Purge pass %s purged batches in %.3fs with backlog %s;"
+                " next batch sizes states=%s events=%s",
+                self.passes,
+                duration,
+                backlog,
+                self.states_batch_size,
+                self.events_batch_size,
+            )
+        self._batches_duration = None
+        if finished:
+            self._purge_before = None
+            self._started = None
+            self._first_oldest_ts = None
+            self._oldest_ts = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the purge progress as a dict."""
+        return {
+            "in_progress": self.in_progress,
+            "progress": self.progress,
+            "estimated_time_remaining": self.estimated_time_remaining,
+            "passes": self.passes,
+            "last_pass_duration": self.last_pass_duration,
+            "states_batch_size": self.states_batch_size,
+            "events_batch_size": self.events_batch_size,
+        }
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -61,6 +212,7 @@ def purge_old_data(
     apply_filter: bool = False,
     events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
     states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    purge_scheduler: PurgeScheduler | None = None,
 ) -> bool:
     """Purge events and states older than purge_before.
 
@@ -71,6 +223,9 @@ def purge_old_data(
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
     with session_scope(session=instance.get_session()) as session:
+        if purge_scheduler is not None:
+            purge_scheduler.start_pass(session, purge_before)
+        batches_start = time.monotonic()
         # Purge a max of max_bind_vars, based on the oldest states or events record
         has_more_to_purge = False
         if instance.use_legacy_events_index and _purging_legacy_format(session):
@@ -84,6 +239,10 @@ def purge_old_data(
                 "Purge running in new format as there are NO states with event_id"
                 " remaining"
             )
+            # Whole partitions older than purge_before are dropped first so
+            # only the partition that straddles it needs rows deleted
+            if instance.partitioned_tables:
+                _drop_expired_partitions(instance, session, purge_before)
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
                 instance, session, states_batch_size, purge_before
@@ -104,6 +263,9 @@ def purge_old_data(
         if short_term_statistics:
             _purge_short_term_statistics(session, short_term_statistics)
 
+        if purge_scheduler is not None:
+            purge_scheduler.record_batches(time.monotonic() - batches_start)
+
         if has_more_to_purge or statistics_runs or short_term_statistics:
             # Return false, as we might not be done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
@@ -129,6 +291,18 @@ def purge_old_data(
     return True
 
 
+def _drop_expired_partitions(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> None:
+    """Drop the partitions that only hold rows older than purge_before."""
+    for table in instance.partitioned_tables:
+        linked_ids = drop_partitions_before(instance, session, table, purge_before)
+        if table == TABLE_STATES:
+            _purge_unused_attributes_ids(instance, session, linked_ids)
+        elif table == TABLE_EVENTS:
+            _purge_unused_data_ids(instance, session, linked_ids)
+
+
 def _purging_legacy_format(session: Session) -> bool:
     """Check if there are any legacy event_id linked states rows remaining."""
     return bool(session.execute(find_legacy_row()).scalar())
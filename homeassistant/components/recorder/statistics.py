@@ -248,13 +248,12 @@ def get_display_unit(
     return state_unit
 
 
-def _get_statistic_to_display_unit_converter(
+def _get_statistic_to_display_unit(
     statistic_unit: str | None,
     state_unit: str | None,
     requested_units: dict[str, str] | None,
-    allow_none: bool = True,
-) -> Callable[[float | None], float | None] | Callable[[float], float] | None:
-    """Prepare a converter from the statistics unit to display unit."""
+) -> tuple[type[BaseUnitConverter], str | None] | None:
+    """Return the converter and display unit if the statistics need conversion."""
     if (converter := STATISTIC_UNIT_TO_UNIT_CONVERTER.get(statistic_unit)) is None:
         return None
 
@@ -272,11 +271,43 @@ def _get_statistic_to_display_unit_converter(
     if display_unit == statistic_unit:
         return None
 
-    if allow_none:
-        return converter.converter_factory_allow_none(
-            from_unit=statistic_unit, to_unit=display_unit
+    return converter, display_unit
+
+
+def _get_statistic_to_display_unit_converter(
+    statistic_unit: str | None,
+    state_unit: str | None,
+    requested_units: dict[str, str] | None,
+) -> Callable[[float | None], float | None] | None:
+    """Prepare a converter from the statistics unit to display unit."""
+    if (
+        conversion := _get_statistic_to_display_unit(
+            statistic_unit, state_unit, requested_units
         )
-    return converter.converter_factory(from_unit=statistic_unit, to_unit=display_unit)
+    ) is None:
+        return None
+    converter, display_unit = conversion
+    return converter.converter_factory_allow_none(
+        from_unit=statistic_unit, to_unit=display_unit
+    )
+
+
+def _get_statistic_to_display_unit_sequence_converter(
+    statistic_unit: str | None,
+    state_unit: str | None,
+    requested_units: dict[str, str] | None,
+) -> Callable[[Iterable[float | None]], list[float | None]] | None:
+    """Prepare a converter of value sequences from the statistics unit to display unit."""
+    if (
+        conversion := _get_statistic_to_display_unit(
+            statistic_unit, state_unit, requested_units
+        )
+    ) is None:
+        return None
+    converter, display_unit = conversion
+    return converter.converter_factory_sequence(
+        from_unit=statistic_unit, to_unit=display_unit
+    )
 
 
 def _get_display_to_statistic_unit_converter(
@@ -2086,16 +2117,20 @@ def _build_sum_converted_stats(
     table_duration_seconds: float,
     start_ts_idx: int,
     sum_idx: int,
-    convert: Callable[[float | None], float | None] | Callable[[float], float],
+    convert_values: Callable[[Iterable[float | None]], list[float | None]],
 ) -> list[StatisticsRow]:
     """Build a list of sum statistics."""
     return [
         {
             "start": (start_ts := db_row[start_ts_idx]),
             "end": start_ts + table_duration_seconds,
-            "sum": None if (v := db_row[sum_idx]) is None else convert(v),
+            "sum": value,
         }
-        for db_row in db_rows
+        for db_row, value in zip(
+            db_rows,
+            convert_values([db_row[sum_idx] for db_row in db_rows]),
+            strict=True,
+        )
     ]
 
 
@@ -2138,20 +2173,23 @@ def _build_converted_stats(
     table_duration_seconds: float,
     start_ts_idx: int,
     row_mapping: tuple[tuple[str, int], ...],
-    convert: Callable[[float | None], float | None] | Callable[[float], float],
+    convert_values: Callable[[Iterable[float | None]], list[float | None]],
 ) -> list[StatisticsRow]:
     """Build a list of statistics with unit conversion."""
-    return [
+    stats: list[StatisticsRow] = [
         {
             "start": (start_ts := db_row[start_ts_idx]),
             "end": start_ts + table_duration_seconds,
-            **{
-                key: None if (v := db_row[idx]) is None else convert(v)  # type: ignore[typeddict-item]
-                for key, idx in row_mapping
-            },
         }
         for db_row in db_rows
     ]
+    # Convert the values column by column instead of value by value
+    for key, idx in row_mapping:
+        for row, value in zip(
+            stats, convert_values([db_row[idx] for db_row in db_rows]), strict=True
+        ):
+            row[key] = value  # type: ignore[literal-required]
+    return stats
 
 
 def _sorted_statistics_to_dict(
@@ -2205,8 +2243,8 @@ def _sorted_statistics_to_dict(
             state_unit = unit = metadata_by_id["unit_of_measurement"]
             if state := hass.states.get(statistic_id):
                 state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
-            convert = _get_statistic_to_display_unit_converter(
-                unit, state_unit, units, allow_none=False
+            convert = _get_statistic_to_display_unit_sequence_converter(
+                unit, state_unit, units
             )
         else:
             convert = None
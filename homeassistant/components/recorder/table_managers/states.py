@@ -125,6 +125,20 @@ class StatesManager:
         ):
             last_committed_ids.pop(last_committed_ids_reversed[purged_state_id], None)
 
+    def evict_purged_state_ids_up_to(self, max_state_id: int) -> None:
+        """Evict committed states with a state_id up to max_state_id.
+
+        Used when a whole partition of states is dropped at once and
+        the purged state_ids are not selected one by one.
+        """
+        self.evict_purged_state_ids(
+            {
+                state_id
+                for state_id in self._last_committed_id.values()
+                if state_id <= max_state_id
+            }
+        )
+
     def evict_purged_entity_ids(self, purged_entity_ids: set[str]) -> None:
         """Evict purged entity_ids from the committed states.
 
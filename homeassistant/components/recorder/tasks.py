@@ -14,8 +14,8 @@ from typing import TYPE_CHECKING, Any
 from homeassistant.helpers.typing import UndefinedType
 from homeassistant.util.event_type import EventType
 
-from . import entity_registry, purge, statistics
-from .const import DOMAIN
+from . import entity_registry, partition, purge, statistics
+from .const import DOMAIN, EVENT_RECORDER_STATISTICS_UPDATED
 from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticData, StatisticMetaData
 from .util import periodic_db_cleanups, session_scope
@@ -117,9 +117,22 @@ class PurgeTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
-        if purge.purge_old_data(
-            instance, self.purge_before, self.repack, self.apply_filter
-        ):
+        scheduler = instance.purge_scheduler
+        # A purge that raises is not rescheduled, so the pass ends with it
+        finished = True
+        try:
+            finished = purge.purge_old_data(
+                instance,
+                self.purge_before,
+                self.repack,
+                self.apply_filter,
+                events_batch_size=scheduler.events_batch_size,
+                states_batch_size=scheduler.states_batch_size,
+                purge_scheduler=scheduler,
+            )
+        finally:
+            scheduler.finish_pass(instance.backlog, finished)
+        if finished:
             # We always need to do the db cleanups after a purge
             # is finished to ensure the WAL checkpoint and other
             # tasks happen after a vacuum.
@@ -158,6 +171,15 @@ class PerodicCleanupTask(RecorderTask):
         periodic_db_cleanups(instance)
 
 
+@dataclass(slots=True)
+class PartitionMaintenanceTask(RecorderTask):
+    """An object to insert into the recorder to create upcoming partitions."""
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        partition.create_upcoming_partitions(instance)
+
+
 @dataclass(slots=True)
 class StatisticsTask(RecorderTask):
     """An object to insert into the recorder queue to run a statistics task."""
@@ -198,6 +220,10 @@ class ImportStatisticsTask(RecorderTask):
         if statistics.import_statistics(
             instance, self.metadata, self.statistics, self.table
         ):
+            instance.hass.bus.fire(
+                EVENT_RECORDER_STATISTICS_UPDATED,
+                {"statistic_id": self.metadata["statistic_id"]},
+            )
             return
         # Schedule a new statistics task if this one didn't finish
         instance.queue_task(
@@ -223,6 +249,9 @@ class AdjustStatisticsTask(RecorderTask):
             self.sum_adjustment,
             self.adjustment_unit,
         ):
+            instance.hass.bus.fire(
+                EVENT_RECORDER_STATISTICS_UPDATED, {"statistic_id": self.statistic_id}
+            )
             return
         # Schedule a new adjust statistics task if this one didn't finish
         instance.queue_task(
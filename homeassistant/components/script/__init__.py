@@ -48,6 +48,7 @@ from homeassistant.helpers.issue_registry import (
     async_create_issue,
     async_delete_issue,
 )
+from homeassistant.helpers.reference_index import ReferenceIndex
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -64,6 +65,7 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 from homeassistant.util.async_ import create_eager_task
 from homeassistant.util.dt import parse_datetime
+from homeassistant.util.hass_dict import HassKey
 
 from .config import ScriptConfig, ValidationStatus
 from .const import (
@@ -86,6 +88,10 @@ SCRIPT_TURN_ONOFF_SCHEMA = make_entity_service_schema(
 )
 RELOAD_SERVICE_SCHEMA = vol.Schema({})
 
+DATA_REFERENCES: HassKey[ReferenceIndex[BaseScriptEntity]] = HassKey(
+    f"{DOMAIN}_references"
+)
+
 
 @bind_hass
 def is_on(hass: HomeAssistant, entity_id: str) -> bool:
@@ -97,15 +103,14 @@ def _scripts_with_x(
     hass: HomeAssistant, referenced_id: str, property_name: str
 ) -> list[str]:
     """Return all scripts that reference the x."""
-    if DOMAIN not in hass.data:
+    if DATA_REFERENCES not in hass.data:
         return []
 
-    component: EntityComponent[BaseScriptEntity] = hass.data[DOMAIN]
-
     return [
         script_entity.entity_id
-        for script_entity in component.entities
-        if referenced_id in getattr(script_entity, property_name)
+        for script_entity in hass.data[DATA_REFERENCES].async_get(
+            property_name, referenced_id
+        )
     ]
 
 
@@ -185,16 +190,7 @@ def labels_in_script(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def scripts_with_blueprint(hass: HomeAssistant, blueprint_path: str) -> list[str]:
     """Return all scripts that reference the blueprint."""
-    if DOMAIN not in hass.data:
-        return []
-
-    component: EntityComponent[BaseScriptEntity] = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if script_entity.referenced_blueprint == blueprint_path
-    ]
+    return _scripts_with_x(hass, blueprint_path, "referenced_blueprint")
 
 
 @callback
@@ -216,6 +212,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data[DOMAIN] = component = EntityComponent[BaseScriptEntity](
         LOGGER, DOMAIN, hass
     )
+    hass.data[DATA_REFERENCES] = ReferenceIndex()
 
     # Register script as valid domain for Blueprint
     async_get_blueprints(hass)
@@ -457,6 +454,26 @@ class BaseScriptEntity(ToggleEntity, ABC):
     def referenced_entities(self) -> set[str]:
         """Return a set of referenced entities."""
 
+    async def async_added_to_hass(self) -> None:
+        """Index the items referenced by the script."""
+        await super().async_added_to_hass()
+        self.hass.data[DATA_REFERENCES].async_add(
+            self,
+            {
+                "referenced_labels": self.referenced_labels,
+                "referenced_floors": self.referenced_floors,
+                "referenced_areas": self.referenced_areas,
+                "referenced_blueprint": (self.referenced_blueprint,),
+                "referenced_devices": self.referenced_devices,
+                "referenced_entities": self.referenced_entities,
+            },
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Remove the script from the reference index."""
+        await super().async_will_remove_from_hass()
+        self.hass.data[DATA_REFERENCES].async_remove(self)
+
 
 class UnavailableScriptEntity(BaseScriptEntity):
     """A non-functional script entity with its state set to unavailable.
@@ -724,6 +741,7 @@ class ScriptEntity(BaseScriptEntity, RestoreEntity):
 
     async def async_added_to_hass(self) -> None:
         """Restore last triggered on startup and register service."""
+        await super().async_added_to_hass()
         if TYPE_CHECKING:
             assert self.unique_id is not None
             assert self.registry_entry is not None
@@ -753,6 +771,7 @@ class ScriptEntity(BaseScriptEntity, RestoreEntity):
 
     async def async_will_remove_from_hass(self) -> None:
         """Stop script and remove service when it will be removed from HA."""
+        await super().async_will_remove_from_hass()
         await self.script.async_stop()
 
         # remove service
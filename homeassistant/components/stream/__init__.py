@@ -49,9 +49,14 @@ from .const import (
     CONF_PREFER_TCP,
     CONF_RTSP_TRANSPORT,
     CONF_SEGMENT_DURATION,
+    CONF_TRANSCODE,
+    CONF_TRANSCODE_BITRATE,
+    CONF_TRANSCODE_HEIGHT,
+    CONF_TRANSCODE_MAX_ENCODERS,
     CONF_USE_WALLCLOCK_AS_TIMESTAMPS,
     DOMAIN,
     FORMAT_CONTENT_TYPE,
+    HLS_LOW_PROVIDER,
     HLS_PROVIDER,
     MAX_SEGMENTS,
     OUTPUT_FORMATS,
@@ -74,6 +79,12 @@ from .core import (
 )
 from .diagnostics import Diagnostics
 from .hls import HlsStreamOutput, async_setup_hls
+from .transcode import (
+    HlsTranscodeOutput,
+    Transcoder,
+    TranscodeSettings,
+    async_setup_transcode,
+)
 
 if TYPE_CHECKING:
     from av.container import InputContainer, OutputContainer
@@ -291,6 +302,19 @@ DOMAIN_SCHEMA = vol.Schema(
         vol.Optional(CONF_PART_DURATION, default=1): vol.All(
             cv.positive_float, vol.Range(min=0.2, max=1.5)
         ),
+        vol.Optional(CONF_TRANSCODE): vol.Schema(
+            {
+                vol.Optional(CONF_TRANSCODE_HEIGHT, default=360): vol.All(
+                    vol.Coerce(int), vol.Range(min=144, max=480)
+                ),
+                vol.Optional(CONF_TRANSCODE_BITRATE, default=500000): vol.All(
+                    vol.Coerce(int), vol.Range(min=100000, max=2000000)
+                ),
+                vol.Optional(CONF_TRANSCODE_MAX_ENCODERS, default=2): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=8)
+                ),
+            }
+        ),
     }
 )
 
@@ -362,6 +386,18 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hls_endpoint = async_setup_hls(hass)
     hass.data[DOMAIN][ATTR_ENDPOINTS][HLS_PROVIDER] = hls_endpoint
 
+    # Setup the low resolution rendition
+    transcoder: Transcoder | None = None
+    if transcode_conf := conf.get(CONF_TRANSCODE):
+        transcoder = async_setup_transcode(
+            hass,
+            TranscodeSettings(
+                height=transcode_conf[CONF_TRANSCODE_HEIGHT],
+                bitrate=transcode_conf[CONF_TRANSCODE_BITRATE],
+                max_encoders=transcode_conf[CONF_TRANSCODE_MAX_ENCODERS],
+            ),
+        )
+
     # Setup Recorder
     async_setup_recorder(hass)
 
@@ -375,6 +411,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         ]:
             await asyncio.wait(awaitables)
         _LOGGER.debug("Stopped stream workers")
+        if transcoder is not None:
+            transcoder.async_shutdown()
         cancel_logging_listener()
 
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, shutdown)
@@ -599,6 +637,9 @@ class Stream:
 
     async def stop(self) -> None:
         """Remove outputs and access token."""
+        # Release the segments buffered by the outputs
+        for provider in self._outputs.values():
+            provider.cleanup()
         self._outputs = {}
         self.access_token = None
 
@@ -679,9 +720,27 @@ class Stream:
             wait_for_next_keyframe=wait_for_next_keyframe,
         )
 
+    @property
+    def buffer_size(self) -> int:
+        """Return the number of bytes of the segments held by the outputs."""
+        # Outputs share the segments produced by the worker
+        segments = {
+            id(segment): segment
+            for provider in self._outputs.values()
+            for segment in provider.get_segments()
+        }
+        return sum(segment.data_size_with_init for segment in segments.values())
+
     def get_diagnostics(self) -> dict[str, Any]:
         """Return diagnostics information for the stream."""
-        return self._diagnostics.as_dict()
+        diagnostics = self._diagnostics.as_dict()
+        if buffer_size := self.buffer_size:
+            diagnostics["buffer_size"] = buffer_size
+        if (transcode_output := self._outputs.get(HLS_LOW_PROVIDER)) is not None:
+            diagnostics["transcode"] = cast(
+                HlsTranscodeOutput, transcode_output
+            ).as_dict()
+        return diagnostics
 
 
 def _should_retry() -> bool:
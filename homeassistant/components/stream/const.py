@@ -11,6 +11,7 @@ ATTR_SETTINGS = "settings"
 ATTR_STREAMS = "streams"
 
 HLS_PROVIDER = "hls"
+HLS_LOW_PROVIDER = "hls_low"
 RECORDER_PROVIDER = "recorder"
 
 OUTPUT_FORMATS = [HLS_PROVIDER]
@@ -19,6 +20,9 @@ SEGMENT_CONTAINER_FORMAT: Final = "mp4"  # format for segments
 RECORDER_CONTAINER_FORMAT: Final = "mp4"  # format for recorder output
 AUDIO_CODECS = {"aac", "mp3"}
 
+# Codec of the low resolution rendition, H.264 main profile level 3.0
+TRANSCODE_CODEC = "avc1.4d401e"
+
 FORMAT_CONTENT_TYPE = {HLS_PROVIDER: "application/vnd.apple.mpegurl"}
 
 OUTPUT_IDLE_TIMEOUT = 300  # Idle timeout due to inactivity
@@ -47,6 +51,10 @@ STREAM_RESTART_RESET_TIME = 300  # Reset wait_timeout after this many seconds
 CONF_LL_HLS = "ll_hls"
 CONF_PART_DURATION = "part_duration"
 CONF_SEGMENT_DURATION = "segment_duration"
+CONF_TRANSCODE = "transcode"
+CONF_TRANSCODE_HEIGHT = "height"
+CONF_TRANSCODE_BITRATE = "bitrate"
+CONF_TRANSCODE_MAX_ENCODERS = "max_encoders"
 
 CONF_PREFER_TCP = "prefer_tcp"
 CONF_RTSP_TRANSPORT = "rtsp_transport"
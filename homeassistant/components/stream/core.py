@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+from bisect import bisect_right
 from collections import deque
 from collections.abc import Callable, Coroutine, Iterable
 from dataclasses import dataclass, field
 import datetime
 from enum import IntEnum
+from io import SEEK_CUR, SEEK_END, SEEK_SET, RawIOBase
+from itertools import accumulate
 import logging
 from typing import TYPE_CHECKING, Any, cast
 
@@ -27,6 +30,8 @@ from .const import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Buffer
+
     from av import Packet, VideoCodecContext
 
     from homeassistant.components.camera import DynamicStreamSettings
@@ -142,6 +147,13 @@ class Segment:
         """Return reconstructed data for all parts as bytes, without init."""
         return b"".join([part.data for part in self.parts])
 
+    def get_reader(self) -> SegmentReader:
+        """Return a file like reader of the init and all parts.
+
+        Unlike get_data, this does not copy the parts into a new buffer.
+        """
+        return SegmentReader([self.init, *(part.data for part in self.parts)])
+
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
         """Render the HLS playlist section for the Segment.
 
@@ -222,6 +234,49 @@ class Segment:
         return (playlist + "\n" + hint) if playlist else hint
 
 
+class SegmentReader(RawIOBase):
+    """Read a list of buffers as a single file without joining them."""
+
+    def __init__(self, chunks: list[bytes]) -> None:
+        """Initialize SegmentReader."""
+        self._chunks = chunks
+        # The file offset of the start of each chunk and the end of the file
+        self._offsets = list(accumulate((len(chunk) for chunk in chunks), initial=0))
+        self._pos = 0
+
+    def readable(self) -> bool:
+        """Return True, the reader is readable."""
+        return True
+
+    def seekable(self) -> bool:
+        """Return True, the reader is seekable."""
+        return True
+
+    def tell(self) -> int:
+        """Return the current position."""
+        return self._pos
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        """Move to a new position."""
+        if whence == SEEK_CUR:
+            offset += self._pos
+        elif whence == SEEK_END:
+            offset += self._offsets[-1]
+        self._pos = max(offset, 0)
+        return self._pos
+
+    def readinto(self, buffer: Buffer) -> int:
+        """Read from the chunk at the current position into buffer."""
+        if (index := bisect_right(self._offsets, self._pos) - 1) >= len(self._chunks):
+            return 0
+        view = memoryview(buffer).cast("B")
+        start = self._pos - self._offsets[index]
+        data = memoryview(self._chunks[index])[start : start + len(view)]
+        view[: len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+
 class IdleTimer:
     """Invoke a callback after an inactivity timeout.
 
@@ -10,12 +10,15 @@ from aiohttp import web
 from homeassistant.core import HomeAssistant, callback
 
 from .const import (
+    DOMAIN,
     EXT_X_START_LL_HLS,
     EXT_X_START_NON_LL_HLS,
     FORMAT_CONTENT_TYPE,
+    HLS_LOW_PROVIDER,
     HLS_PROVIDER,
     MAX_SEGMENTS,
     NUM_PLAYLIST_SEGMENTS,
+    TRANSCODE_CODEC,
 )
 from .core import (
     PROVIDERS,
@@ -119,7 +122,7 @@ class HlsMasterPlaylistView(StreamView):
     cors_allowed = True
 
     @staticmethod
-    def render(track: StreamOutput) -> str:
+    def render(track: StreamOutput, low_bandwidth: int | None = None) -> str:
         """Render M3U8 file."""
         # Need to calculate max bandwidth as input_container.bit_rate doesn't seem to work
         # Calculate file size / duration and use a small multiplier to account for variation
@@ -128,8 +131,16 @@ class HlsMasterPlaylistView(StreamView):
             return ""
         bandwidth = round(segment.data_size_with_init * 8 / segment.duration * 1.2)
         codecs = get_codec_string(segment.init)
-        lines = [
-            "#EXTM3U",
+        lines = ["#EXTM3U"]
+        if low_bandwidth is not None:
+            # The video of the low resolution rendition is always H.264
+            low_codecs = ",".join([TRANSCODE_CODEC, *codecs.split(",")[1:]])
+            lines += [
+                f'#EXT-X-STREAM-INF:BANDWIDTH={low_bandwidth},CODECS="{low_codecs}"',
+                "low/playlist.m3u8",
+            ]
+        # Keep the full resolution rendition last for clients that pick the last one
+        lines += [
             f'#EXT-X-STREAM-INF:BANDWIDTH={bandwidth},CODECS="{codecs}"',
             "playlist.m3u8",
         ]
@@ -146,8 +157,11 @@ class HlsMasterPlaylistView(StreamView):
             return web.HTTPNotFound()
         if len(track.sequences) == 1 and not await track.recv():
             return web.HTTPNotFound()
+        low_bandwidth: int | None = None
+        if (transcoder := stream.hass.data[DOMAIN].get(HLS_LOW_PROVIDER)) is not None:
+            low_bandwidth = round(transcoder.settings.bitrate * 1.2)
         response = web.Response(
-            body=self.render(track).encode("utf-8"),
+            body=self.render(track, low_bandwidth).encode("utf-8"),
             headers={
                 "Content-Type": FORMAT_CONTENT_TYPE[HLS_PROVIDER],
             },
@@ -162,6 +176,7 @@ class HlsPlaylistView(StreamView):
     url = r"/api/hls/{token:[a-f0-9]+}/playlist.m3u8"
     name = "api:stream:hls:playlist"
     cors_allowed = True
+    provider = HLS_PROVIDER
 
     @classmethod
     def render(cls, track: HlsStreamOutput) -> str:
@@ -253,7 +268,7 @@ class HlsPlaylistView(StreamView):
     ) -> web.Response:
         """Return m3u8 playlist."""
         track: HlsStreamOutput = cast(
-            HlsStreamOutput, stream.add_provider(HLS_PROVIDER)
+            HlsStreamOutput, stream.add_provider(self.provider)
         )
         await stream.start()
 
@@ -340,12 +355,13 @@ class HlsInitView(StreamView):
     url = r"/api/hls/{token:[a-f0-9]+}/init.mp4"
     name = "api:stream:hls:init"
     cors_allowed = True
+    provider = HLS_PROVIDER
 
     async def handle(
         self, request: web.Request, stream: Stream, sequence: str, part_num: str
     ) -> web.Response:
         """Return init.mp4."""
-        track = stream.add_provider(HLS_PROVIDER)
+        track = stream.add_provider(self.provider)
         if not (segments := track.get_segments()) or not (body := segments[0].init):
             return web.HTTPNotFound()
         return web.Response(
@@ -402,13 +418,14 @@ class HlsSegmentView(StreamView):
     url = r"/api/hls/{token:[a-f0-9]+}/segment/{sequence:\d+}.m4s"
     name = "api:stream:hls:segment"
     cors_allowed = True
+    provider = HLS_PROVIDER
 
     async def handle(
         self, request: web.Request, stream: Stream, sequence: str, part_num: str
     ) -> web.StreamResponse:
         """Handle segments."""
         track: HlsStreamOutput = cast(
-            HlsStreamOutput, stream.add_provider(HLS_PROVIDER)
+            HlsStreamOutput, stream.add_provider(self.provider)
         )
         track.idle_timer.awake()
         # Ensure that we have a segment. If the request is from a hint for part 0
@@ -425,9 +442,12 @@ class HlsSegmentView(StreamView):
                 body=None,
                 status=HTTPStatus.NOT_FOUND,
             )
-        return web.Response(
-            body=segment.get_data(),
-            headers={
-                "Content-Type": "video/iso.segment",
-            },
-        )
+        # Write the parts one by one instead of joining them into a new buffer
+        parts = list(segment.parts)
+        response = web.StreamResponse(headers={"Content-Type": "video/iso.segment"})
+        response.content_length = sum(len(part.data) for part in parts)
+        await response.prepare(request)
+        for part in parts:
+            await response.write(part.data)
+        await response.write_eof()
+        return response
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import deque
-from io import DEFAULT_BUFFER_SIZE, BytesIO
+from io import DEFAULT_BUFFER_SIZE
 import logging
 import os
 from typing import TYPE_CHECKING
@@ -91,7 +91,7 @@ class RecorderOutput(StreamOutput):
 
             # Open segment
             source = av.open(
-                BytesIO(segment.init + segment.get_data()),
+                segment.get_reader(),
                 "r",
                 format=SEGMENT_CONTAINER_FORMAT,
             )
@@ -0,0 +1,342 @@
+"""Transcode HLS segments into a low resolution rendition.
+
+Segments produced by the stream worker are re-encoded with a software H.264
+encoder in a pool of worker processes, so the encoding does not compete with
+the event loop for the GIL. The pool is only running while at least one
+client is watching a low resolution rendition, and its size limits how many
+segments are encoded at the same time across all streams.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from io import BytesIO
+import logging
+import multiprocessing
+import time
+from typing import TYPE_CHECKING, Any, cast
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, HLS_LOW_PROVIDER
+from .core import PROVIDERS, IdleTimer, Part, Segment, StreamSettings
+from .fmp4utils import read_init
+from .hls import HlsInitView, HlsPlaylistView, HlsSegmentView, HlsStreamOutput
+
+if TYPE_CHECKING:
+    from homeassistant.components.camera import DynamicStreamSettings
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class TranscodeSettings:
+    """Settings of the low resolution rendition."""
+
+    height: int
+    bitrate: int
+    max_encoders: int
+
+
+def transcode_segment(
+    init: bytes, data: bytes, height: int, bitrate: int
+) -> tuple[bytes, bytes, float]:
+    """Transcode a fragmented mp4 segment to a lower resolution.
+
+    This runs in a worker process. Returns the init and media data of
+    the new segment and the cpu time spent encoding it.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import av
+
+    start = time.process_time()
+    output_file = BytesIO()
+    with av.open(BytesIO(init + data), mode="r") as input_container:
+        input_video = input_container.streams.video[0]
+        input_audio = (
+            input_container.streams.audio[0] if input_container.streams.audio else None
+        )
+        height = min(height, input_video.codec_context.height)
+        # Encoders need an even width
+        width = (
+            round(
+                input_video.codec_context.width
+                * height
+                / input_video.codec_context.height
+                / 2
+            )
+            * 2
+        )
+        time_base = input_video.time_base
+        assert time_base is not None
+        with av.open(
+            output_file,
+            mode="w",
+            format="mp4",
+            container_options={
+                "movflags": "empty_moov+default_base_moof+frag_discont+negative_cts_offsets+skip_trailer",
+                "avoid_negative_ts": "disabled",
+                "video_track_timescale": str(time_base.denominator),
+            },
+        ) as output_container:
+            output_video = cast(
+                av.VideoStream,
+                output_container.add_stream(
+                    "libx264",
+                    rate=input_video.average_rate,
+                    options={
+                        "preset": "veryfast",
+                        "tune": "zerolatency",
+                        "profile": "main",
+                        "x264-params": "scenecut=0:level=3.0",
+                    },
+                ),
+            )
+            output_video.width = width
+            output_video.height = height
+            output_video.pix_fmt = "yuv420p"
+            output_video.bit_rate = bitrate
+            output_video.codec_context.time_base = time_base
+            # The segment is encoded as a single group of pictures
+            output_video.codec_context.gop_size = 10000
+            output_audio = (
+                output_container.add_stream(template=input_audio)
+                if input_audio
+                else None
+            )
+            for packet in input_container.demux():
+                # The demuxer ends with empty packets to flush the decoders
+                if packet.dts is None:
+                    continue  # type: ignore[unreachable]
+                if packet.stream.type == "video":
+                    for frame in input_video.codec_context.decode(packet):
+                        scaled_frame = frame.reformat(
+                            width=width, height=height, format="yuv420p"
+                        )
+                        scaled_frame.pts = frame.pts
+                        scaled_frame.time_base = frame.time_base
+                        for output_packet in output_video.encode(scaled_frame):
+                            output_container.mux(output_packet)
+                elif output_audio is not None:
+                    packet.stream = output_audio
+                    output_container.mux(packet)
+            for output_packet in output_video.encode(None):
+                output_container.mux(output_packet)
+    output_file.seek(0)
+    output_init = read_init(output_file)
+    output_file.seek(len(output_init))
+    return output_init, output_file.read(), time.process_time() - start
+
+
+class Transcoder:
+    """Run transcode jobs in a pool of worker processes."""
+
+    def __init__(self, hass: HomeAssistant, settings: TranscodeSettings) -> None:
+        """Initialize the transcoder."""
+        self._hass = hass
+        self.settings = settings
+        self._executor: ProcessPoolExecutor | None = None
+        self._users = 0
+
+    @callback
+    def async_acquire(self) -> None:
+        """Start the worker processes for a new rendition."""
+        self._users += 1
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.settings.max_encoders,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    @callback
+    def async_release(self) -> None:
+        """Stop the worker processes when no rendition is watched."""
+        self._users = max(self._users - 1, 0)
+        if not self._users:
+            self.async_shutdown()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def async_transcode(
+        self, init: bytes, data: bytes
+    ) -> tuple[bytes, bytes, float]:
+        """Transcode a segment in a worker process."""
+        if self._executor is None:
+            raise RuntimeError("Transcoder is not running")
+        return await self._hass.loop.run_in_executor(
+            self._executor,
+            transcode_segment,
+            init,
+            data,
+            self.settings.height,
+            self.settings.bitrate,
+        )
+
+
+@PROVIDERS.register(HLS_LOW_PROVIDER)
+class HlsTranscodeOutput(HlsStreamOutput):
+    """Low resolution HLS rendition transcoded from the source segments.
+
+    The transcoded segments have a single part, so the rendition does not
+    support low latency HLS. When the encoders can not keep up, source
+    segments are skipped and a discontinuity is added to the playlist.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        idle_timer: IdleTimer,
+        stream_settings: StreamSettings,
+        dynamic_stream_settings: DynamicStreamSettings,
+    ) -> None:
+        """Initialize the output."""
+        super().__init__(
+            hass,
+            idle_timer,
+            replace(stream_settings, ll_hls=False),
+            dynamic_stream_settings,
+        )
+        self._transcoder: Transcoder = hass.data[DOMAIN][HLS_LOW_PROVIDER]
+        self._transcoder.async_acquire()
+        self._source_segment: Segment | None = None
+        # A complete source segment waiting for the running job
+        self._queued: Segment | None = None
+        self._job: asyncio.Task[None] | None = None
+        self._sequence = -1
+        self.segments_transcoded = 0
+        self.segments_dropped = 0
+        self.cpu_time = 0.0
+
+    @property
+    def name(self) -> str:
+        """Return provider name."""
+        return HLS_LOW_PROVIDER
+
+    @callback
+    def _async_put(self, segment: Segment) -> None:
+        """Track the source segment being written by the worker."""
+        self.idle_timer.start()
+        self._source_segment = segment
+
+    def part_put(self) -> None:
+        """Transcode the source segment once it is complete."""
+        if (segment := self._source_segment) is None or not segment.complete:
+            return
+        self._source_segment = None
+        if self._job is None:
+            self._job = self._hass.async_create_background_task(
+                self._async_transcode(segment), "stream transcode"
+            )
+            return
+        if self._queued is not None:
+            # The encoders can not keep up, skip the oldest waiting segment
+            self.segments_dropped += 1
+        self._queued = segment
+
+    def discontinuity(self) -> None:
+        """Drop the incomplete source segment."""
+        self._hass.loop.call_soon_threadsafe(self._async_discontinuity)
+
+    @callback
+    def _async_discontinuity(self) -> None:
+        """Drop the incomplete source segment in event loop."""
+        self._source_segment = None
+
+    async def _async_transcode(self, segment: Segment) -> None:
+        """Transcode source segments until none are waiting."""
+        source: Segment | None = segment
+        while source is not None:
+            try:
+                init, data, cpu_time = await self._transcoder.async_transcode(
+                    source.init, source.get_data()
+                )
+            except Exception:  # noqa: BLE001
+                _LOGGER.debug("Unable to transcode segment", exc_info=True)
+                self.segments_dropped += 1
+            else:
+                self._async_add_segment(source, init, data, cpu_time)
+            source, self._queued = self._queued, None
+        self._job = None
+
+    @callback
+    def _async_add_segment(
+        self, source: Segment, init: bytes, data: bytes, cpu_time: float
+    ) -> None:
+        """Store a transcoded segment and wake up waiting clients."""
+        self._sequence += 1
+        self.segments_transcoded += 1
+        self.cpu_time += cpu_time
+        segment = Segment(
+            sequence=self._sequence,
+            init=init,
+            # Every skipped segment starts a new discontinuity
+            stream_id=source.stream_id + self.segments_dropped,
+            start_time=source.start_time,
+            _stream_outputs=(),
+        )
+        segment.async_add_part(
+            Part(duration=source.duration, has_keyframe=True, data=data),
+            source.duration,
+        )
+        super()._async_put(segment)
+        super().part_put()
+
+    def cleanup(self) -> None:
+        """Handle cleanup."""
+        super().cleanup()
+        if self._job is not None:
+            self._job.cancel()
+            self._job = None
+        self._source_segment = self._queued = None
+        self._transcoder.async_release()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the transcoding statistics."""
+        return {
+            "segments_transcoded": self.segments_transcoded,
+            "segments_dropped": self.segments_dropped,
+            "cpu_time": round(self.cpu_time, 3),
+        }
+
+
+class HlsLowPlaylistView(HlsPlaylistView):
+    """Stream view to serve the M3U8 playlist of the low resolution rendition."""
+
+    url = r"/api/hls/{token:[a-f0-9]+}/low/playlist.m3u8"
+    name = "api:stream:hls:low_playlist"
+    provider = HLS_LOW_PROVIDER
+
+
+class HlsLowInitView(HlsInitView):
+    """Stream view to serve the init.mp4 of the low resolution rendition."""
+
+    url = r"/api/hls/{token:[a-f0-9]+}/low/init.mp4"
+    name = "api:stream:hls:low_init"
+    provider = HLS_LOW_PROVIDER
+
+
+class HlsLowSegmentView(HlsSegmentView):
+    """Stream view to serve a segment of the low resolution rendition."""
+
+    url = r"/api/hls/{token:[a-f0-9]+}/low/segment/{sequence:\d+}.m4s"
+    name = "api:stream:hls:low_segment"
+    provider = HLS_LOW_PROVIDER
+
+
+@callback
+def async_setup_transcode(
+    hass: HomeAssistant, settings: TranscodeSettings
+) -> Transcoder:
+    """Set up the low resolution rendition."""
+    transcoder = hass.data[DOMAIN][HLS_LOW_PROVIDER] = Transcoder(hass, settings)
+    hass.http.register_view(HlsLowPlaylistView())
+    hass.http.register_view(HlsLowInitView())
+    hass.http.register_view(HlsLowSegmentView())
+    return transcoder
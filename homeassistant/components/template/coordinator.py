@@ -8,7 +8,7 @@ from homeassistant.const import EVENT_HOMEASSISTANT_START
 from homeassistant.core import Context, CoreState, Event, HomeAssistant, callback
 from homeassistant.helpers import condition, discovery, trigger as trigger_helper
 from homeassistant.helpers.script import Script
-from homeassistant.helpers.trace import trace_get
+from homeassistant.helpers.trace import trace_cv, trace_get
 from homeassistant.helpers.typing import ConfigType, TemplateVarsType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
@@ -126,12 +126,20 @@ class TriggerUpdateCoordinator(DataUpdateCoordinator):
     def _check_condition(self, run_variables: TemplateVarsType) -> bool:
         if not self._cond_func:
             return True
-        condition_result = self._cond_func(run_variables)
-        if condition_result is False:
-            _LOGGER.debug(
-                "Conditions not met, aborting template trigger update. Condition summary: %s",
-                trace_get(clear=False),
-            )
+        if not _LOGGER.isEnabledFor(logging.DEBUG):
+            return self._cond_func(run_variables)
+        # Conditions are only traced while a trace is active, start one for
+        # the summary and stop it again so later evaluations are not traced
+        token = trace_cv.set({})
+        try:
+            condition_result = self._cond_func(run_variables)
+            if condition_result is False:
+                _LOGGER.debug(
+                    "Conditions not met, aborting template trigger update. Condition summary: %s",
+                    trace_get(clear=False),
+                )
+        finally:
+            trace_cv.reset(token)
         return condition_result
 
     @callback
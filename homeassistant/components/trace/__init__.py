@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 import logging
 
 import voluptuous as vol
 
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import Event, HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
@@ -20,9 +22,10 @@ from .const import (
     DATA_TRACE,
     DATA_TRACE_STORE,
     DEFAULT_STORED_TRACES,
+    TRACE_MEMORY_CHECK_INTERVAL,
 )
 from .models import ActionTrace
-from .util import async_store_trace
+from .util import async_enforce_memory_budget, async_store_trace
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -70,4 +73,16 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     # Store traces when stopping hass
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_store_traces_at_stop)
 
+    @callback
+    def _async_enforce_memory_budget(_: datetime) -> None:
+        """Evict stored traces over the memory budget."""
+        async_enforce_memory_budget(hass)
+
+    async_track_time_interval(
+        hass,
+        _async_enforce_memory_budget,
+        TRACE_MEMORY_CHECK_INTERVAL,
+        cancel_on_shutdown=True,
+    )
+
     return True
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
 from homeassistant.util.hass_dict import HassKey
@@ -17,3 +18,5 @@ DATA_TRACE: HassKey[TraceData] = HassKey("trace")
 DATA_TRACE_STORE: HassKey[Store[dict[str, list]]] = HassKey("trace_store")
 DATA_TRACES_RESTORED: HassKey[bool] = HassKey("trace_traces_restored")
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
+TRACE_MEMORY_BUDGET = 32 * 1024**2  # Compressed bytes of all stored traces
+TRACE_MEMORY_CHECK_INTERVAL = timedelta(minutes=1)
@@ -6,8 +6,12 @@ import abc
 from collections import deque
 import datetime as dt
 from typing import Any
+import zlib
+
+import orjson
 
 from homeassistant.core import Context
+from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_get,
@@ -16,11 +20,36 @@ from homeassistant.helpers.trace import (
     trace_set_child_id,
 )
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads_object
 from homeassistant.util.limited_size_dict import LimitedSizeDict
 import homeassistant.util.uuid as uuid_util
 
 type TraceData = dict[str, LimitedSizeDict[str, BaseTrace]]
 
+# Favor speed, most of the gain comes from values repeated across steps
+TRACE_COMPRESSION_LEVEL = 1
+
+_extended_json_default = ExtendedJSONEncoder().default
+
+
+def compress_trace_dict(data: dict[str, Any]) -> bytes:
+    """Encode a trace dict as compressed JSON.
+
+    Variables and results that repeat across the steps of a trace
+    are stored once and referenced by the compressor.
+    """
+    return zlib.compress(
+        orjson.dumps(
+            data, option=orjson.OPT_NON_STR_KEYS, default=_extended_json_default
+        ),
+        TRACE_COMPRESSION_LEVEL,
+    )
+
+
+def decompress_trace_dict(data: bytes) -> dict[str, Any]:
+    """Expand a trace dict encoded by compress_trace_dict."""
+    return json_loads_object(zlib.decompress(data))
+
 
 class BaseTrace(abc.ABC):
     """Base container for a script or automation trace."""
@@ -28,6 +57,12 @@ class BaseTrace(abc.ABC):
     context: Context
     key: str
     run_id: str
+    _compressed_dict: bytes | None = None
+
+    @property
+    def compressed_size(self) -> int:
+        """Return the size of the compressed extended dict, 0 if not compressed."""
+        return len(self._compressed_dict) if self._compressed_dict else 0
 
     def as_dict(self) -> dict[str, Any]:
         """Return an dictionary version of this ActionTrace for saving."""
@@ -69,7 +104,6 @@ class ActionTrace(BaseTrace):
         self._timestamp_finish: dt.datetime | None = None
         self._timestamp_start: dt.datetime = dt_util.utcnow()
         self.key = f"{self._domain}.{item_id}"
-        self._dict: dict[str, Any] | None = None
         self._short_dict: dict[str, Any] | None = None
         if trace_id_get():
             trace_set_child_id(self.key, self.run_id)
@@ -88,11 +122,20 @@ class ActionTrace(BaseTrace):
         self._timestamp_finish = dt_util.utcnow()
         self._state = "stopped"
         self._script_execution = script_execution_get()
+        # Cache the short dict and compress the extended dict so the trace
+        # elements and the variables they reference can be released
+        self.as_short_dict()
+        try:
+            self._compressed_dict = compress_trace_dict(self.as_extended_dict())
+        except orjson.JSONEncodeError:
+            # Keep the uncompressed trace, it is serialized again on request
+            return
+        self._trace = None
 
     def as_extended_dict(self) -> dict[str, Any]:
         """Return an extended dictionary version of this ActionTrace."""
-        if self._dict:
-            return self._dict
+        if self._compressed_dict:
+            return decompress_trace_dict(self._compressed_dict)
 
         result = dict(self.as_short_dict())
 
@@ -109,10 +152,6 @@ class ActionTrace(BaseTrace):
                 "context": self.context,
             }
         )
-
-        if self._state == "stopped":
-            # Execution has stopped, save the result
-            self._dict = result
         return result
 
     def as_short_dict(self) -> dict[str, Any]:
@@ -162,12 +201,13 @@ class RestoredTrace(BaseTrace):
         self.context = context
         self.key = f"{extended_dict['domain']}.{extended_dict['item_id']}"
         self.run_id = extended_dict["run_id"]
-        self._dict = extended_dict
+        self._compressed_dict = compress_trace_dict(extended_dict)
         self._short_dict = short_dict
 
     def as_extended_dict(self) -> dict[str, Any]:
         """Return an extended dictionary version of this RestoredTrace."""
-        return self._dict  # type: ignore[no-any-return]
+        assert self._compressed_dict is not None
+        return decompress_trace_dict(self._compressed_dict)
 
     def as_short_dict(self) -> dict[str, Any]:
         """Return a brief dictionary version of this RestoredTrace."""
@@ -6,11 +6,16 @@ from collections.abc import Mapping
 import logging
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util.limited_size_dict import LimitedSizeDict
 
-from .const import DATA_TRACE, DATA_TRACE_STORE, DATA_TRACES_RESTORED
+from .const import (
+    DATA_TRACE,
+    DATA_TRACE_STORE,
+    DATA_TRACES_RESTORED,
+    TRACE_MEMORY_BUDGET,
+)
 from .models import ActionTrace, BaseTrace, RestoredTrace, TraceData
 
 _LOGGER = logging.getLogger(__name__)
@@ -91,6 +96,43 @@ def async_store_trace(
         traces[key][trace.run_id] = trace
 
 
+@callback
+def async_enforce_memory_budget(
+    hass: HomeAssistant, budget: int = TRACE_MEMORY_BUDGET
+) -> None:
+    """Evict stored traces until their compressed size fits the budget.
+
+    The oldest trace of the script or automation using the most memory
+    is evicted first, the newest trace of each is always kept.
+    """
+    traces = hass.data[DATA_TRACE]
+    usage = {
+        key: sum(trace.compressed_size for trace in traces_for_key.values())
+        for key, traces_for_key in traces.items()
+    }
+    total = sum(usage.values())
+    while total > budget and usage:
+        key = max(usage, key=usage.__getitem__)
+        traces_for_key = traces[key]
+        newest_run_id = next(reversed(traces_for_key), None)
+        run_id = next(
+            (
+                run_id
+                for run_id, trace in traces_for_key.items()
+                if trace.compressed_size and run_id != newest_run_id
+            ),
+            None,
+        )
+        if run_id is None:
+            del usage[key]
+            continue
+        size = traces_for_key.pop(run_id).compressed_size
+        usage[key] -= size
+        total -= size
+    if total > budget:
+        _LOGGER.debug("Stored traces use %s bytes, over budget %s", total, budget)
+
+
 def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> None:
     """Store a restored trace and move it to the end of the LimitedSizeDict."""
     key = trace.key
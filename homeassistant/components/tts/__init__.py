@@ -16,7 +16,7 @@ import re
 import secrets
 import subprocess
 import tempfile
-from typing import Any, Final, TypedDict, final
+from typing import Any, Final, final
 
 from aiohttp import web
 import mutagen
@@ -48,9 +48,11 @@ from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.network import get_url
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, ConfigType
 from homeassistant.util import dt as dt_util, language as language_util
 
+from .cache import FileCache, MemoryCache, TTSCache
 from .const import (
     ATTR_CACHE,
     ATTR_LANGUAGE,
@@ -58,6 +60,7 @@ from .const import (
     ATTR_OPTIONS,
     CONF_CACHE,
     CONF_CACHE_DIR,
+    CONF_CACHE_MAX_SIZE,
     CONF_TIME_MEMORY,
     DATA_COMPONENT,
     DATA_TTS_MANAGER,
@@ -65,6 +68,7 @@ from .const import (
     DEFAULT_CACHE_DIR,
     DEFAULT_TIME_MEMORY,
     DOMAIN,
+    MEMORY_CACHE_MAX_SIZE,
     TtsAudioType,
 )
 from .helper import get_engine_instance
@@ -125,13 +129,10 @@ KEY_PATTERN = "{0}_{1}_{2}_{3}"
 
 SCHEMA_SERVICE_CLEAR_CACHE = vol.Schema({})
 
-
-class TTSCache(TypedDict):
-    """Cached TTS file."""
-
-    filename: str
-    voice: bytes
-    pending: asyncio.Task | None
+STORAGE_KEY = f"{DOMAIN}.cache"
+STORAGE_VERSION = 1
+# Delay writing the cache index to batch the changes of bursts of messages
+STORAGE_SAVE_DELAY = 30
 
 
 @callback
@@ -309,8 +310,15 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     use_cache: bool = conf.get(CONF_CACHE, DEFAULT_CACHE)
     cache_dir: str = conf.get(CONF_CACHE_DIR, DEFAULT_CACHE_DIR)
     time_memory: int = conf.get(CONF_TIME_MEMORY, DEFAULT_TIME_MEMORY)
-
-    tts = SpeechManager(hass, use_cache, cache_dir, time_memory)
+    cache_max_size: int | None = conf.get(CONF_CACHE_MAX_SIZE)
+
+    tts = SpeechManager(
+        hass,
+        use_cache,
+        cache_dir,
+        time_memory,
+        cache_max_size * 1024 * 1024 if cache_max_size else None,
+    )
 
     try:
         await tts.async_init_cache()
@@ -530,6 +538,7 @@ class SpeechManager:
         use_cache: bool,
         cache_dir: str,
         time_memory: int,
+        cache_max_size: int | None = None,
     ) -> None:
         """Initialize a speech store."""
         self.hass = hass
@@ -538,43 +547,87 @@ class SpeechManager:
         self.use_cache = use_cache
         self.cache_dir = cache_dir
         self.time_memory = time_memory
-        self.file_cache: dict[str, str] = {}
-        self.mem_cache: dict[str, TTSCache] = {}
+        self.file_cache = FileCache(cache_max_size)
+        self.mem_cache = MemoryCache(MEMORY_CACHE_MAX_SIZE)
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
 
         # filename <-> token
         self.filename_to_token: dict[str, str] = {}
         self.token_to_filename: dict[str, str] = {}
 
-    def _init_cache(self) -> dict[str, str]:
-        """Init cache folder and fetch files."""
+    def _init_cache(self, index: dict[str, Any] | None) -> list[list[Any]]:
+        """Init cache folder and fetch files.
+
+        The stored index is checked against the files in the directory. Files
+        which are gone are dropped and files missing from the index are added
+        as least recently used. Only the size of those is read from disk.
+        """
         try:
             self.cache_dir = _init_tts_cache_dir(self.hass, self.cache_dir)
         except OSError as err:
             raise HomeAssistantError(f"Can't init cache dir {err}") from err
 
         try:
-            return _get_cache_files(self.cache_dir)
+            cache_files = _get_cache_files(self.cache_dir)
         except OSError as err:
             raise HomeAssistantError(f"Can't read cache dir {err}") from err
 
+        indexed_files: list[list[Any]] = []
+        if index is not None and index["cache_dir"] == self.cache_dir:
+            for key, filename, size in index["files"]:
+                if cache_files.get(key) == filename:
+                    del cache_files[key]
+                    indexed_files.append([key, filename, size])
+        return [
+            *(
+                [key, filename, _get_file_size(os.path.join(self.cache_dir, filename))]
+                for key, filename in cache_files.items()
+            ),
+            *indexed_files,
+        ]
+
     async def async_init_cache(self) -> None:
         """Init config folder and load file cache."""
-        self.file_cache.update(await self.hass.async_add_executor_job(self._init_cache))
+        index = await self._store.async_load()
+        files = await self.hass.async_add_executor_job(self._init_cache, index)
+        evicted: list[str] = []
+        for key, filename, size in files:
+            evicted.extend(self.file_cache.add(key, filename, size))
+        if evicted:
+            await self._async_remove_files(evicted)
+        if index is None or evicted or files != index["files"]:
+            self._async_schedule_save_index()
 
-    async def async_clear_cache(self) -> None:
-        """Read file cache and delete files."""
-        self.mem_cache = {}
+    @callback
+    def _async_schedule_save_index(self) -> None:
+        """Schedule saving the index of the file cache."""
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the index of the file cache to store."""
+        return {"cache_dir": self.cache_dir, "files": self.file_cache.as_list()}
+
+    async def _async_remove_files(self, filenames: list[str]) -> None:
+        """Remove files from the cache directory."""
 
         def remove_files() -> None:
             """Remove files from filesystem."""
-            for filename in self.file_cache.values():
+            for filename in filenames:
                 try:
                     os.remove(os.path.join(self.cache_dir, filename))
                 except OSError as err:
                     _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
 
         await self.hass.async_add_executor_job(remove_files)
-        self.file_cache = {}
+
+    async def async_clear_cache(self) -> None:
+        """Read file cache and delete files."""
+        self.mem_cache.clear()
+        filenames = self.file_cache.filenames()
+        self.file_cache.clear()
+        self._async_schedule_save_index()
+        await self._async_remove_files(filenames)
 
     @callback
     def async_register_legacy_engine(
@@ -649,12 +702,25 @@ class SpeechManager:
         use_cache = cache if cache is not None else self.use_cache
 
         # Is speech already in memory
-        if cache_key in self.mem_cache:
-            filename = self.mem_cache[cache_key]["filename"]
+        if cached := self.mem_cache.get(cache_key):
+            filename = cached["filename"]
         # Is file store in file cache
-        elif use_cache and cache_key in self.file_cache:
-            filename = self.file_cache[cache_key]
-            self.hass.async_create_task(self._async_file_to_mem(cache_key))
+        elif use_cache and (cached_filename := self.file_cache.get(cache_key)):
+            filename = cached_filename
+
+            async def load_speech() -> None:
+                """Load the speech from the file cache or generate it again."""
+                if await self._async_file_to_mem(cache_key) is None:
+                    await self._async_get_tts_audio(
+                        engine_instance,
+                        cache_key,
+                        message,
+                        use_cache,
+                        language,
+                        options,
+                    )
+
+            self.hass.async_create_task(load_speech())
         # Load speech from engine into memory
         else:
             filename = await self._async_get_tts_audio(
@@ -690,20 +756,18 @@ class SpeechManager:
         use_cache = cache if cache is not None else self.use_cache
 
         # If we have the file, load it into memory if necessary
-        if cache_key not in self.mem_cache:
+        if (cached := self.mem_cache.get(cache_key)) is None:
             if use_cache and cache_key in self.file_cache:
-                await self._async_file_to_mem(cache_key)
-            else:
+                cached = await self._async_file_to_mem(cache_key)
+            if cached is None:
                 await self._async_get_tts_audio(
                     engine_instance, cache_key, message, use_cache, language, options
                 )
+                cached = self.mem_cache.get(cache_key)
+                assert cached is not None
 
-        extension = os.path.splitext(self.mem_cache[cache_key]["filename"])[1][1:]
-        cached = self.mem_cache[cache_key]
-        if pending := cached.get("pending"):
-            await pending
-            cached = self.mem_cache[cache_key]
-        return extension, cached["voice"]
+        extension = os.path.splitext(cached["filename"])[1][1:]
+        return extension, await _async_get_voice(cached)
 
     @callback
     def _generate_cache_key(
@@ -773,7 +837,7 @@ class SpeechManager:
         if sample_bytes is not None:
             sample_bytes = int(sample_bytes)
 
-        async def get_tts_data() -> str:
+        async def get_tts_data() -> bytes:
             """Handle data available."""
             if engine_instance.name is None or engine_instance.name is UNDEFINED:
                 raise HomeAssistantError("TTS engine name is not set.")
@@ -837,23 +901,26 @@ class SpeechManager:
                     self._async_save_tts_audio(cache_key, filename, data)
                 )
 
-            return filename
+            return data
 
         audio_task = self.hass.async_create_task(get_tts_data(), eager_start=False)
 
         def handle_error(_future: asyncio.Future) -> None:
             """Handle error."""
             if audio_task.exception():
-                self.mem_cache.pop(cache_key, None)
+                self.mem_cache.pop(cache_key)
 
         audio_task.add_done_callback(handle_error)
 
         filename = f"{cache_key}.{final_extension}".lower()
-        self.mem_cache[cache_key] = {
-            "filename": filename,
-            "voice": b"",
-            "pending": audio_task,
-        }
+        self.mem_cache.set(
+            cache_key,
+            {
+                "filename": filename,
+                "voice": b"",
+                "pending": audio_task,
+            },
+        )
         return filename
 
     async def _async_save_tts_audio(
@@ -872,13 +939,19 @@ class SpeechManager:
 
         try:
             await self.hass.async_add_executor_job(save_speech)
-            self.file_cache[cache_key] = filename
         except OSError as err:
             _LOGGER.error("Can't write %s: %s", filename, err)
+            return
+        if evicted := self.file_cache.add(cache_key, filename, len(data)):
+            await self._async_remove_files(evicted)
+        self._async_schedule_save_index()
 
-    async def _async_file_to_mem(self, cache_key: str) -> None:
+    async def _async_file_to_mem(self, cache_key: str) -> TTSCache | None:
         """Load voice from file cache into memory.
 
+        Returns None and removes the file from the file cache when it can not
+        be read, so the speech can be generated again.
+
         This method is a coroutine.
         """
         if not (filename := self.file_cache.get(cache_key)):
@@ -894,26 +967,29 @@ class SpeechManager:
         try:
             data = await self.hass.async_add_executor_job(load_speech)
         except OSError as err:
-            del self.file_cache[cache_key]
-            raise HomeAssistantError(f"Can't read {voice_file}") from err
+            _LOGGER.warning("Can't read %s: %s", voice_file, err)
+            self.file_cache.pop(cache_key)
+            self._async_schedule_save_index()
+            return None
 
-        self._async_store_to_memcache(cache_key, filename, data)
+        return self._async_store_to_memcache(cache_key, filename, data)
 
     @callback
     def _async_store_to_memcache(
         self, cache_key: str, filename: str, data: bytes
-    ) -> None:
+    ) -> TTSCache:
         """Store data to memcache and set timer to remove it."""
-        self.mem_cache[cache_key] = {
+        cached: TTSCache = {
             "filename": filename,
             "voice": data,
             "pending": None,
         }
+        self.mem_cache.set(cache_key, cached)
 
         @callback
         def async_remove_from_mem(_: datetime) -> None:
             """Cleanup memcache."""
-            self.mem_cache.pop(cache_key, None)
+            self.mem_cache.pop(cache_key)
 
         async_call_later(
             self.hass,
@@ -924,6 +1000,7 @@ class SpeechManager:
                 cancel_on_shutdown=True,
             ),
         )
+        return cached
 
     async def async_read_tts(self, token: str) -> tuple[str | None, bytes]:
         """Read a voice file and return binary.
@@ -943,18 +1020,15 @@ class SpeechManager:
             record.group(1), record.group(2), record.group(3), record.group(4)
         )
 
-        if cache_key not in self.mem_cache:
-            if cache_key not in self.file_cache:
+        if (cached := self.mem_cache.get(cache_key)) is None:
+            if (
+                cache_key not in self.file_cache
+                or (cached := await self._async_file_to_mem(cache_key)) is None
+            ):
                 raise HomeAssistantError(f"{cache_key} not in cache!")
-            await self._async_file_to_mem(cache_key)
-
-        cached = self.mem_cache[cache_key]
-        if pending := cached.get("pending"):
-            await pending
-            cached = self.mem_cache[cache_key]
 
         content, _ = mimetypes.guess_type(filename)
-        return content, cached["voice"]
+        return content, await _async_get_voice(cached)
 
     @staticmethod
     def write_tags(
@@ -1019,6 +1093,21 @@ def _init_tts_cache_dir(hass: HomeAssistant, cache_dir: str) -> str:
     return cache_dir
 
 
+async def _async_get_voice(cached: TTSCache) -> bytes:
+    """Return the audio of a cache entry, waiting for it to be generated."""
+    if pending := cached["pending"]:
+        return await pending
+    return cached["voice"]
+
+
+def _get_file_size(path: str) -> int:
+    """Return the size of a file, 0 if it can not be read."""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
 def _get_cache_files(cache_dir: str) -> dict[str, str]:
     """Return a dict of given engine files."""
     cache = {}
@@ -0,0 +1,139 @@
+"""Memory and file caches for generated TTS audio."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from typing import Any, TypedDict
+
+
+class TTSCache(TypedDict):
+    """Cached TTS file."""
+
+    filename: str
+    voice: bytes
+    pending: asyncio.Task[bytes] | None
+
+
+class MemoryCache:
+    """Least recently used cache of audio bounded by its size in bytes.
+
+    Entries with a pending task are never evicted, and the most recently
+    stored entry is kept even if it is larger than the maximum size.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the cache."""
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, TTSCache] = OrderedDict()
+
+    def __contains__(self, cache_key: str) -> bool:
+        """Return if the cache holds an entry for the key."""
+        return cache_key in self._entries
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self._entries)
+
+    def get(self, cache_key: str) -> TTSCache | None:
+        """Return an entry and mark it as recently used."""
+        if (entry := self._entries.get(cache_key)) is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(cache_key)
+        return entry
+
+    def set(self, cache_key: str, entry: TTSCache) -> None:
+        """Store an entry and evict the least recently used ones over the size."""
+        self.pop(cache_key)
+        self._entries[cache_key] = entry
+        self.size += len(entry["voice"])
+        if self.size <= self.max_size:
+            return
+        for key in list(self._entries)[:-1]:
+            if self._entries[key]["pending"] is None:
+                self.pop(key)
+                if self.size <= self.max_size:
+                    return
+
+    def pop(self, cache_key: str) -> TTSCache | None:
+        """Remove an entry."""
+        if (entry := self._entries.pop(cache_key, None)) is not None:
+            self.size -= len(entry["voice"])
+        return entry
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self.size = 0
+
+
+class FileCache:
+    """Index of the audio files in the cache directory.
+
+    Files are kept in least recently used order so the oldest files can be
+    removed once the directory grows over the maximum size.
+    """
+
+    def __init__(self, max_size: int | None) -> None:
+        """Initialize the index."""
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        # Cache key to filename and size of the file
+        self._files: OrderedDict[str, tuple[str, int]] = OrderedDict()
+
+    def __contains__(self, cache_key: str) -> bool:
+        """Return if a file is cached for the key."""
+        return cache_key in self._files
+
+    def __len__(self) -> int:
+        """Return the number of files."""
+        return len(self._files)
+
+    def get(self, cache_key: str) -> str | None:
+        """Return the filename for a key and mark it as recently used."""
+        if (file := self._files.get(cache_key)) is None:
+            return None
+        self.hits += 1
+        self._files.move_to_end(cache_key)
+        return file[0]
+
+    def add(self, cache_key: str, filename: str, size: int) -> list[str]:
+        """Add a file and return the filenames to remove to stay under the size."""
+        self.pop(cache_key)
+        self._files[cache_key] = (filename, size)
+        self.size += size
+        evicted: list[str] = []
+        if self.max_size is None:
+            return evicted
+        for key in list(self._files)[:-1]:
+            if self.size <= self.max_size:
+                break
+            if (evicted_filename := self.pop(key)) is not None:
+                evicted.append(evicted_filename)
+        return evicted
+
+    def pop(self, cache_key: str) -> str | None:
+        """Remove a file from the index and return its filename."""
+        if (file := self._files.pop(cache_key, None)) is None:
+            return None
+        self.size -= file[1]
+        return file[0]
+
+    def filenames(self) -> list[str]:
+        """Return the filenames of all the cached files."""
+        return [filename for filename, _ in self._files.values()]
+
+    def clear(self) -> None:
+        """Remove all files from the index."""
+        self._files.clear()
+        self.size = 0
+
+    def as_list(self) -> list[list[Any]]:
+        """Return the index to store it, least recently used first."""
+        return [[key, filename, size] for key, (filename, size) in self._files.items()]
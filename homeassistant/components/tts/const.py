@@ -18,6 +18,7 @@ ATTR_OPTIONS = "options"
 
 CONF_CACHE = "cache"
 CONF_CACHE_DIR = "cache_dir"
+CONF_CACHE_MAX_SIZE = "cache_max_size"
 CONF_FIELDS = "fields"
 CONF_TIME_MEMORY = "time_memory"
 
@@ -25,6 +26,9 @@ DEFAULT_CACHE = True
 DEFAULT_CACHE_DIR = "tts"
 DEFAULT_TIME_MEMORY = 300
 
+# Maximum size of the audio kept in memory in bytes
+MEMORY_CACHE_MAX_SIZE = 64 * 1024 * 1024
+
 DOMAIN = "tts"
 DATA_COMPONENT: HassKey[EntityComponent[TextToSpeechEntity]] = HassKey(DOMAIN)
 
@@ -45,6 +45,7 @@ from .const import (
     ATTR_OPTIONS,
     CONF_CACHE,
     CONF_CACHE_DIR,
+    CONF_CACHE_MAX_SIZE,
     CONF_FIELDS,
     CONF_TIME_MEMORY,
     DATA_TTS_MANAGER,
@@ -77,6 +78,8 @@ PLATFORM_SCHEMA = cv.PLATFORM_SCHEMA.extend(
         vol.Required(CONF_PLATFORM): vol.All(cv.string, _deprecated_platform),
         vol.Optional(CONF_CACHE, default=DEFAULT_CACHE): cv.boolean,
         vol.Optional(CONF_CACHE_DIR, default=DEFAULT_CACHE_DIR): cv.string,
+        # Maximum size of the cache directory in megabytes
+        vol.Optional(CONF_CACHE_MAX_SIZE): vol.All(vol.Coerce(int), vol.Range(min=1)),
         vol.Optional(CONF_TIME_MEMORY, default=DEFAULT_TIME_MEMORY): vol.All(
             vol.Coerce(int), vol.Range(min=60, max=57600)
         ),
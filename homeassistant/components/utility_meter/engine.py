@@ -0,0 +1,248 @@
+"""Shared source tracking and reset scheduling of the utility meters."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Coroutine
+from datetime import datetime
+from decimal import Decimal, DecimalException
+import logging
+from typing import Any
+
+from cronsim import CronSim
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.event import (
+    async_track_point_in_time,
+    async_track_state_change_event,
+)
+import homeassistant.util.dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_ENGINE: HassKey[MeterEngine] = HassKey(f"{DOMAIN}_engine")
+
+type ReadingCallback = Callable[[Event[EventStateChangedData], SourceReading], None]
+type ResetCallback = Callable[[datetime], Coroutine[Any, Any, None]]
+
+
+def parse_state(state: State | None) -> Decimal | None:
+    """Parse the state as a Decimal, None if it is not a number."""
+    try:
+        return (
+            None
+            if state is None or state.state in [STATE_UNAVAILABLE, STATE_UNKNOWN]
+            else Decimal(state.state)
+        )
+    except DecimalException:
+        return None
+
+
+class SourceReading:
+    """A state change of a source shared by all the meters of the source.
+
+    The states are only parsed once, and meters with the same settings and
+    last valid state share the computed adjustment.
+    """
+
+    __slots__ = (
+        "_adjustments",
+        "_old_parsed",
+        "_old_value",
+        "new_state",
+        "new_value",
+        "old_state",
+    )
+
+    def __init__(self, old_state: State | None, new_state: State | None) -> None:
+        """Initialize the reading."""
+        self.old_state = old_state
+        self.new_state = new_state
+        self.new_value = parse_state(new_state)
+        self._old_value: Decimal | None = None
+        self._old_parsed = False
+        self._adjustments: dict[tuple[bool, bool, Decimal | None], Decimal | None] = {}
+
+    @property
+    def old_value(self) -> Decimal | None:
+        """Return the parsed old state."""
+        if not self._old_parsed:
+            self._old_value = parse_state(self.old_state)
+            self._old_parsed = True
+        return self._old_value
+
+    def adjustment(
+        self,
+        delta_values: bool,
+        periodically_resetting: bool,
+        last_valid_state: Decimal | None,
+    ) -> Decimal | None:
+        """Return the adjustment of a meter, None if it can not be calculated."""
+        key = (delta_values, periodically_resetting, last_valid_state)
+        if key in self._adjustments:
+            return self._adjustments[key]
+        adjustment: Decimal | None
+        if (new_value := self.new_value) is None:
+            adjustment = None
+        elif delta_values:
+            adjustment = new_value
+        elif not periodically_resetting and last_valid_state is not None:
+            adjustment = new_value - last_valid_state
+        # Fallback to old_state if sensor is periodically resetting
+        # but last_valid_state is None
+        elif (old_value := self.old_value) is not None:
+            adjustment = new_value - old_value
+        else:
+            adjustment = None
+        self._adjustments[key] = adjustment
+        return adjustment
+
+
+class SourceTracker:
+    """Track the state changes of a source for all the meters collecting it."""
+
+    def __init__(self, hass: HomeAssistant, entity_id: str) -> None:
+        """Initialize the tracker."""
+        self._hass = hass
+        self._entity_id = entity_id
+        self._callbacks: dict[ReadingCallback, None] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(self, reading_callback: ReadingCallback) -> CALLBACK_TYPE:
+        """Add a meter collecting the source."""
+        self._callbacks[reading_callback] = None
+        if self._unsub is None:
+            self._unsub = async_track_state_change_event(
+                self._hass, [self._entity_id], self._async_state_changed
+            )
+
+        @callback
+        def _remove() -> None:
+            """Remove the meter."""
+            self._callbacks.pop(reading_callback, None)
+            if not self._callbacks and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+
+        return _remove
+
+    @property
+    def has_callbacks(self) -> bool:
+        """Return if any meter is collecting the source."""
+        return bool(self._callbacks)
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Fan out a state change to all the meters."""
+        reading = SourceReading(event.data["old_state"], event.data["new_state"])
+        for reading_callback in list(self._callbacks):
+            reading_callback(event, reading)
+
+
+class _ResetGroup:
+    """Meters reset at the same times."""
+
+    def __init__(self, cron_pattern: str, time_zone: str) -> None:
+        """Initialize the group."""
+        # we need timezone for DST purposes (see issue #102984)
+        self.scheduler = CronSim(
+            cron_pattern, dt_util.now(dt_util.get_time_zone(time_zone))
+        )
+        self.next_reset: datetime | None = None
+        self.callbacks: dict[ResetCallback, None] = {}
+        self.unsub: CALLBACK_TYPE | None = None
+
+
+class MeterEngine:
+    """Share the source listeners and reset timers of the utility meters."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the engine."""
+        self._hass = hass
+        self._trackers: dict[str, SourceTracker] = {}
+        self._reset_groups: dict[tuple[str, str], _ResetGroup] = {}
+
+    @callback
+    def async_track_source(
+        self, entity_id: str, reading_callback: ReadingCallback
+    ) -> CALLBACK_TYPE:
+        """Call back with the state changes of a source."""
+        if (tracker := self._trackers.get(entity_id)) is None:
+            tracker = self._trackers[entity_id] = SourceTracker(self._hass, entity_id)
+        remove_from_tracker = tracker.async_add(reading_callback)
+
+        @callback
+        def _remove() -> None:
+            """Stop tracking the source, and drop its tracker if it is unused."""
+            remove_from_tracker()
+            if not tracker.has_callbacks and self._trackers.get(entity_id) is tracker:
+                del self._trackers[entity_id]
+
+        return _remove
+
+    @callback
+    def async_schedule_reset(
+        self, cron_pattern: str, reset_callback: ResetCallback
+    ) -> tuple[datetime, CALLBACK_TYPE]:
+        """Call back at every time matching the cron pattern.
+
+        Returns the next reset and a function to stop the resets.
+        """
+        key = (cron_pattern, self._hass.config.time_zone)
+        if (group := self._reset_groups.get(key)) is None:
+            group = self._reset_groups[key] = _ResetGroup(*key)
+            self._async_program_reset(key, group)
+        group.callbacks[reset_callback] = None
+        assert group.next_reset is not None
+
+        @callback
+        def _remove() -> None:
+            """Stop the resets of the meter."""
+            group.callbacks.pop(reset_callback, None)
+            if group.callbacks or self._reset_groups.get(key) is not group:
+                return
+            del self._reset_groups[key]
+            if group.unsub is not None:
+                group.unsub()
+                group.unsub = None
+
+        return group.next_reset, _remove
+
+    @callback
+    def _async_program_reset(self, key: tuple[str, str], group: _ResetGroup) -> None:
+        """Program the next reset of a group."""
+        group.next_reset = next_reset = next(group.scheduler)
+        _LOGGER.debug("Next reset of %s is %s", key[0], next_reset)
+
+        async def _async_reset(now: datetime) -> None:
+            """Reset all the meters of the group."""
+            self._async_program_reset(key, group)
+            assert group.next_reset is not None
+            next_reset = group.next_reset
+            for reset_callback in list(group.callbacks):
+                # A failing meter must not keep the others from resetting
+                try:
+                    await reset_callback(next_reset)
+                except Exception:
+                    _LOGGER.exception("Error resetting utility meter")
+
+        group.unsub = async_track_point_in_time(self._hass, _async_reset, next_reset)
+
+
+@callback
+def async_get_engine(hass: HomeAssistant) -> MeterEngine:
+    """Return the meter engine."""
+    if (engine := hass.data.get(DATA_ENGINE)) is None:
+        engine = hass.data[DATA_ENGINE] = MeterEngine(hass)
+    return engine
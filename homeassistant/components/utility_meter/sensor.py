@@ -5,11 +5,10 @@ from __future__ import annotations
 from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from decimal import Decimal, DecimalException, InvalidOperation
+from decimal import Decimal, InvalidOperation
 import logging
 from typing import Any, Self
 
-from cronsim import CronSim
 import voluptuous as vol
 
 from homeassistant.components.sensor import (
@@ -29,9 +28,9 @@ from homeassistant.const import (
     CONF_UNIQUE_ID,
     EVENT_CORE_CONFIG_UPDATE,
     STATE_UNAVAILABLE,
-    STATE_UNKNOWN,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Event,
     EventStateChangedData,
     HomeAssistant,
@@ -42,10 +41,7 @@ from homeassistant.helpers import entity_platform, entity_registry as er
 from homeassistant.helpers.device import async_device_info_to_link_from_entity
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import (
-    async_track_point_in_time,
-    async_track_state_change_event,
-)
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.template import is_number
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
@@ -81,6 +77,7 @@ from .const import (
     WEEKLY,
     YEARLY,
 )
+from .engine import SourceReading, async_get_engine
 
 PERIOD2CRON = {
     QUARTER_HOURLY: "{minute}/15 * * * *",
@@ -406,19 +403,7 @@ class UtilityMeterSensor(RestoreSensor):
         self._tariff_entity = tariff_entity
         self._next_reset = None
         self._current_tz = None
-        self._config_scheduler()
-
-    def _config_scheduler(self):
-        self.scheduler = (
-            CronSim(
-                self._cron_pattern,
-                dt_util.now(
-                    dt_util.get_default_time_zone()
-                ),  # we need timezone for DST purposes (see issue #102984)
-            )
-            if self._cron_pattern
-            else None
-        )
+        self._unsub_reset: CALLBACK_TYPE | None = None
 
     def start(self, attributes: Mapping[str, Any]) -> None:
         """Initialize unit and state upon source initial update."""
@@ -427,39 +412,29 @@ class UtilityMeterSensor(RestoreSensor):
         self._attr_native_value = 0
         self.async_write_ha_state()
 
-    @staticmethod
-    def _validate_state(state: State | None) -> Decimal | None:
-        """Parse the state as a Decimal if available. Throws DecimalException if the state is not a number."""
-        try:
-            return (
-                None
-                if state is None or state.state in [STATE_UNAVAILABLE, STATE_UNKNOWN]
-                else Decimal(state.state)
-            )
-        except DecimalException:
-            return None
-
     def calculate_adjustment(
-        self, old_state: State | None, new_state: State
+        self,
+        old_state: State | None,
+        new_state: State,
+        reading: SourceReading | None = None,
     ) -> Decimal | None:
         """Calculate the adjustment based on the old and new state."""
+        if reading is None:
+            reading = SourceReading(old_state, new_state)
 
         # First check if the new_state is valid (see discussion in PR #88446)
-        if (new_state_val := self._validate_state(new_state)) is None:
+        if (new_state_val := reading.new_value) is None:
             _LOGGER.warning("Invalid state %s", new_state.state)
             return None
 
-        if self._sensor_delta_values:
-            return new_state_val
-
         if (
-            not self._sensor_periodically_resetting
-            and self._last_valid_state is not None
-        ):  # Fallback to old_state if sensor is periodically resetting but last_valid_state is None
-            return new_state_val - self._last_valid_state
-
-        if (old_state_val := self._validate_state(old_state)) is not None:
-            return new_state_val - old_state_val
+            adjustment := reading.adjustment(
+                self._sensor_delta_values,
+                self._sensor_periodically_resetting,
+                self._last_valid_state,
+            )
+        ) is not None:
+            return adjustment
 
         _LOGGER.debug(
             "%s received an invalid state change coming from %s (%s > %s)",
@@ -471,7 +446,11 @@ class UtilityMeterSensor(RestoreSensor):
         return None
 
     @callback
-    def async_reading(self, event: Event[EventStateChangedData]) -> None:
+    def async_reading(
+        self,
+        event: Event[EventStateChangedData],
+        reading: SourceReading | None = None,
+    ) -> None:
         """Handle the sensor state changes."""
         if (
             source_state := self.hass.states.get(self._sensor_source_id)
@@ -488,9 +467,11 @@ class UtilityMeterSensor(RestoreSensor):
         if new_state is None:
             return
         new_state_attributes: Mapping[str, Any] = new_state.attributes or {}
+        if reading is None:
+            reading = SourceReading(old_state, new_state)
 
         # First check if the new_state is valid (see discussion in PR #88446)
-        if (new_state_val := self._validate_state(new_state)) is None:
+        if (new_state_val := reading.new_value) is None:
             _LOGGER.warning(
                 "%s received an invalid new state from %s : %s",
                 self.name,
@@ -513,7 +494,7 @@ class UtilityMeterSensor(RestoreSensor):
                     )
 
         if (
-            adjustment := self.calculate_adjustment(old_state, new_state)
+            adjustment := self.calculate_adjustment(old_state, new_state, reading)
         ) is not None and (self._sensor_net_consumption or adjustment >= 0):
             # If net_consumption is off, the adjustment must be non-negative
             self._attr_native_value += adjustment  # type: ignore[operator] # self._attr_native_value will be set to by the start function if it is None, therefore it always has a valid Decimal value at this line
@@ -535,8 +516,8 @@ class UtilityMeterSensor(RestoreSensor):
 
     def _change_status(self, tariff: str) -> None:
         if self._tariff == tariff:
-            self._collecting = async_track_state_change_event(
-                self.hass, [self._sensor_source_id], self.async_reading
+            self._collecting = async_get_engine(self.hass).async_track_source(
+                self._sensor_source_id, self.async_reading
             )
         else:
             if self._collecting:
@@ -557,26 +538,25 @@ class UtilityMeterSensor(RestoreSensor):
 
         self.async_write_ha_state()
 
-    async def _program_reset(self):
-        """Program the reset of the utility meter."""
-        if self.scheduler:
-            self._next_reset = next(self.scheduler)
-
+    @callback
+    def _program_reset(self) -> None:
+        """Program the reset of the utility meter.
+
+        Meters with the same cron pattern share a single timer.
+        """
+        if self._unsub_reset is not None:
+            self._unsub_reset()
+            self._unsub_reset = None
+        if self._cron_pattern:
+            self._next_reset, self._unsub_reset = async_get_engine(
+                self.hass
+            ).async_schedule_reset(self._cron_pattern, self._async_reset_meter)
             _LOGGER.debug("Next reset of %s is %s", self.entity_id, self._next_reset)
-            self.async_on_remove(
-                async_track_point_in_time(
-                    self.hass,
-                    self._async_reset_meter,
-                    self._next_reset,
-                )
-            )
             self.async_write_ha_state()
 
-    async def _async_reset_meter(self, event):
+    async def _async_reset_meter(self, next_reset: datetime) -> None:
         """Reset the utility meter status."""
-
-        await self._program_reset()
-
+        self._next_reset = next_reset
         await self.async_reset_meter(self._tariff_entity)
 
     async def async_reset_meter(self, entity_id):
@@ -611,7 +591,7 @@ class UtilityMeterSensor(RestoreSensor):
         # and we need to reconfigure the scheduler
         self._current_tz = self.hass.config.time_zone
 
-        await self._program_reset()
+        self._program_reset()
 
         self.async_on_remove(
             async_dispatcher_connect(
@@ -659,8 +639,8 @@ class UtilityMeterSensor(RestoreSensor):
                 self.native_unit_of_measurement,
                 self._sensor_source_id,
             )
-            self._collecting = async_track_state_change_event(
-                self.hass, [self._sensor_source_id], self.async_reading
+            self._collecting = async_get_engine(self.hass).async_track_source(
+                self._sensor_source_id, self.async_reading
             )
 
         self.async_on_remove(async_at_started(self.hass, async_source_tracking))
@@ -671,8 +651,7 @@ class UtilityMeterSensor(RestoreSensor):
             if self._current_tz != self.hass.config.time_zone:
                 self._current_tz = self.hass.config.time_zone
 
-                self._config_scheduler()
-                await self._program_reset()
+                self._program_reset()
 
         self.async_on_remove(
             self.hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, async_track_time_zone)
@@ -683,6 +662,9 @@ class UtilityMeterSensor(RestoreSensor):
         if self._collecting:
             self._collecting()
         self._collecting = None
+        if self._unsub_reset is not None:
+            self._unsub_reset()
+            self._unsub_reset = None
 
     @property
     def device_class(self):
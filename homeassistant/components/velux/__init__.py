@@ -8,6 +8,9 @@ from homeassistant.core import HomeAssistant, ServiceCall
 
 from .const import DOMAIN, LOGGER, PLATFORMS
 
+# The KLF 200 handles one command at a time, whatever the platform
+PARALLEL_SERVICE_CALLS = 1
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up the velux component."""
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
+from collections.abc import Callable
 import logging
 from operator import attrgetter
 import sys
@@ -23,6 +23,7 @@ from homeassistant.const import (
     CONF_NAME,
     CONF_RADIUS,
     EVENT_CORE_CONFIG_UPDATE,
+    EVENT_STATE_CHANGED,
     SERVICE_RELOAD,
     STATE_HOME,
     STATE_NOT_HOME,
@@ -47,9 +48,11 @@ from homeassistant.helpers import (
 )
 from homeassistant.helpers.typing import ConfigType, VolDictType
 from homeassistant.loader import bind_hass
+from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.location import distance
 
 from .const import ATTR_PASSIVE, ATTR_RADIUS, CONF_PASSIVE, DOMAIN, HOME_ZONE
+from .spatial_index import ZoneSpatialIndex
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -106,7 +109,8 @@ STORAGE_VERSION = 1
 
 ENTITY_ID_SORTER = attrgetter("entity_id")
 
-ZONE_ENTITY_IDS = "zone_entity_ids"
+ZONE_SPATIAL_INDEX: HassKey[ZoneSpatialIndex] = HassKey("zone_spatial_index")
+ZONES_BY_NAME: HassKey[dict[str, set[Zone]]] = HassKey("zones_by_name")
 
 
 @bind_hass
@@ -122,9 +126,11 @@ def async_active_zone(
     closest: State | None = None
 
     # This can be called before async_setup by device tracker
-    zone_entity_ids: Iterable[str] = hass.data.get(ZONE_ENTITY_IDS, ())
+    if (spatial_index := hass.data.get(ZONE_SPATIAL_INDEX)) is None:
+        return None
 
-    for entity_id in zone_entity_ids:
+    # Only check the zones near the location
+    for entity_id in spatial_index.async_candidates(latitude, longitude, radius):
         if (
             not (zone := hass.states.get(entity_id))
             # Skip unavailable zones
@@ -165,29 +171,70 @@ def async_active_zone(
     return closest
 
 
+@callback
+def _async_zone_changed_filter(event_data: EventStateChangedData) -> bool:
+    """Filter the state changes of zones which were not added or removed."""
+    return (
+        event_data["old_state"] is not None
+        and event_data["new_state"] is not None
+        and event_data["entity_id"].startswith(f"{DOMAIN}.")
+    )
+
+
 @callback
 def async_setup_track_zone_entity_ids(hass: HomeAssistant) -> None:
-    """Set up track of entity IDs for zones."""
-    zone_entity_ids: list[str] = hass.states.async_entity_ids(DOMAIN)
-    hass.data[ZONE_ENTITY_IDS] = zone_entity_ids
+    """Set up track of the locations of zones."""
+    spatial_index = hass.data[ZONE_SPATIAL_INDEX] = ZoneSpatialIndex()
+    for zone_state in hass.states.async_all(DOMAIN):
+        spatial_index.async_update(zone_state)
 
     @callback
-    def _async_add_zone_entity_id(
-        event_: Event[EventStateChangedData],
-    ) -> None:
-        """Add zone entity ID."""
-        zone_entity_ids.append(event_.data["entity_id"])
-        zone_entity_ids.sort()
+    def _async_update_zone(event_: Event[EventStateChangedData]) -> None:
+        """Index a new zone or reindex a zone if its location changed."""
+        if (new_state := event_.data["new_state"]) is not None:
+            spatial_index.async_update(new_state)
+
+    @callback
+    def _async_remove_zone(event_: Event[EventStateChangedData]) -> None:
+        """Remove a zone from the spatial index."""
+        spatial_index.async_remove(event_.data["entity_id"])
+
+    event.async_track_state_added_domain(hass, DOMAIN, _async_update_zone)
+    event.async_track_state_removed_domain(hass, DOMAIN, _async_remove_zone)
+    # A zone can also move without being removed, for example on reload
+    hass.bus.async_listen(
+        EVENT_STATE_CHANGED,
+        _async_update_zone,
+        event_filter=_async_zone_changed_filter,
+    )
+
+
+@callback
+def _async_setup_track_persons(hass: HomeAssistant) -> None:
+    """Set up dispatching person state changes to the zones they concern."""
+    zones_by_name: dict[str, set[Zone]] = {}
+    hass.data[ZONES_BY_NAME] = zones_by_name
+    person_domain = "person"  # avoid circular import
 
     @callback
-    def _async_remove_zone_entity_id(
+    def _async_person_state_changed(
         event_: Event[EventStateChangedData],
     ) -> None:
-        """Remove zone entity ID."""
-        zone_entity_ids.remove(event_.data["entity_id"])
-
-    event.async_track_state_added_domain(hass, DOMAIN, _async_add_zone_entity_id)
-    event.async_track_state_removed_domain(hass, DOMAIN, _async_remove_zone_entity_id)
+        """Let the zones the person entered or left update their persons."""
+        zones: set[Zone] = set()
+        for state in (event_.data["old_state"], event_.data["new_state"]):
+            if state is not None and (
+                name_zones := zones_by_name.get(state.state.casefold())
+            ):
+                zones |= name_zones
+        for zone in zones:
+            zone.async_person_state_changed(event_)
+
+    event.async_track_state_change_filtered(
+        hass,
+        event.TrackStates(False, set(), {person_domain}),
+        _async_person_state_changed,
+    )
 
 
 def in_zone(zone: State, latitude: float, longitude: float, radius: float = 0) -> bool:
@@ -234,6 +281,7 @@ class ZoneStorageCollection(collection.DictStorageCollection):
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up configured zones as well as Home Assistant zone if necessary."""
     async_setup_track_zone_entity_ids(hass)
+    _async_setup_track_persons(hass)
 
     component = entity_component.EntityComponent[Zone](_LOGGER, DOMAIN, hass)
     id_manager = collection.IDManager()
@@ -347,6 +395,8 @@ class Zone(collection.CollectionEntity):
         self._attrs: dict | None = None
         self._remove_listener: Callable[[], None] | None = None
         self._persons_in_zone: set[str] = set()
+        # Case folded person states the zone receives the changes of
+        self._person_states: set[str] = set()
         self._set_attrs_from_config()
 
     def _set_attrs_from_config(self) -> None:
@@ -385,11 +435,40 @@ class Zone(collection.CollectionEntity):
             return
         self._config = config
         self._set_attrs_from_config()
+        if self._person_states:
+            # The name of the zone may have changed
+            self._async_track_person_states()
+            self._async_load_persons_in_zone()
         self._generate_attrs()
         self.async_write_ha_state()
 
     @callback
-    def _person_state_change_listener(self, evt: Event[EventStateChangedData]) -> None:
+    def _async_track_person_states(self) -> None:
+        """Receive the state changes of persons entering or leaving the zone."""
+        self._async_untrack_person_states()
+        self._person_states = {self._case_folded_name}
+        if self.entity_id == ENTITY_ID_HOME:
+            self._person_states.add(STATE_HOME)
+        zones_by_name = self.hass.data[ZONES_BY_NAME]
+        for person_state in self._person_states:
+            zones_by_name.setdefault(person_state, set()).add(self)
+
+    @callback
+    def _async_untrack_person_states(self) -> None:
+        """Stop receiving the state changes of persons."""
+        if not self._person_states:
+            return
+        zones_by_name = self.hass.data[ZONES_BY_NAME]
+        for person_state in self._person_states:
+            if zones := zones_by_name.get(person_state):
+                zones.discard(self)
+                if not zones:
+                    del zones_by_name[person_state]
+        self._person_states = set()
+
+    @callback
+    def async_person_state_changed(self, evt: Event[EventStateChangedData]) -> None:
+        """Update the persons in the zone when the state of a person changed."""
         person_entity_id = evt.data["entity_id"]
         persons_in_zone = self._persons_in_zone
         cur_count = len(persons_in_zone)
@@ -405,21 +484,21 @@ class Zone(collection.CollectionEntity):
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         await super().async_added_to_hass()
+        self._async_load_persons_in_zone()
+        self._generate_attrs()
+
+        self._async_track_person_states()
+        self.async_on_remove(self._async_untrack_person_states)
+
+    @callback
+    def _async_load_persons_in_zone(self) -> None:
+        """Load the persons currently in the zone."""
         person_domain = "person"  # avoid circular import
         self._persons_in_zone = {
             state.entity_id
             for state in self.hass.states.async_all(person_domain)
             if self._state_is_in_zone(state)
         }
-        self._generate_attrs()
-
-        self.async_on_remove(
-            event.async_track_state_change_filtered(
-                self.hass,
-                event.TrackStates(False, set(), {person_domain}),
-                self._person_state_change_listener,
-            ).async_remove
-        )
 
     @callback
     def _generate_attrs(self) -> None:
@@ -0,0 +1,131 @@
+"""Grid index of the zones to find the zones near a location."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from contextlib import suppress
+import math
+from typing import Any
+
+from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE
+from homeassistant.core import State, callback
+
+from .const import ATTR_RADIUS
+
+# Size of the grid cells in degrees
+CELL_SIZE = 0.25
+LON_CELLS = round(360 / CELL_SIZE)
+# Zones or searches covering more cells are not indexed
+MAX_CELLS = 64
+
+# Lower bound of the meters per degree of latitude and of longitude at the
+# equator on the WGS-84 ellipsoid, with a margin for the bounding boxes
+METERS_PER_DEGREE = 110_000
+# Zones closer to the poles than this are not indexed
+MAX_LATITUDE = 85.0
+
+type _Cell = tuple[int, int]
+
+
+def _bounding_cells(
+    latitude: float, longitude: float, radius: float
+) -> list[_Cell] | None:
+    """Return the cells of the bounding box of a circle or None if too large."""
+    if not (
+        math.isfinite(latitude) and math.isfinite(longitude) and math.isfinite(radius)
+    ):
+        return None
+    # A point is in a zone when its distance to the center minus its radius is
+    # less than the zone radius, the boxes with the radii clamped to 0 still
+    # overlap when the radius of either is negative
+    delta_lat = max(radius, 0.0) / METERS_PER_DEGREE
+    max_abs_lat = abs(latitude) + delta_lat
+    if max_abs_lat >= MAX_LATITUDE:
+        return None
+    delta_lon = max(radius, 0.0) / (
+        METERS_PER_DEGREE * math.cos(math.radians(max_abs_lat))
+    )
+    lat_start = math.floor((latitude - delta_lat) / CELL_SIZE)
+    lat_end = math.floor((latitude + delta_lat) / CELL_SIZE)
+    lon_start = math.floor((longitude - delta_lon) / CELL_SIZE)
+    lon_end = math.floor((longitude + delta_lon) / CELL_SIZE)
+    if (lat_end - lat_start + 1) * (lon_end - lon_start + 1) > MAX_CELLS:
+        return None
+    return [
+        (lat_cell, lon_cell % LON_CELLS)
+        for lat_cell in range(lat_start, lat_end + 1)
+        for lon_cell in range(lon_start, lon_end + 1)
+    ]
+
+
+class ZoneSpatialIndex:
+    """Index the zones by the grid cells their bounding box covers.
+
+    Zones which are too large, too close to the poles or have an invalid
+    location are always returned as candidates.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._cells: dict[_Cell, set[str]] = {}
+        # entity_id -> (latitude, longitude, radius), cells
+        self._zones: dict[str, tuple[tuple[Any, Any, Any], list[_Cell] | None]] = {}
+        self._unindexed: set[str] = set()
+
+    @callback
+    def async_update(self, state: State) -> None:
+        """Index or reindex a zone if its location changed."""
+        entity_id = state.entity_id
+        attributes = state.attributes
+        location: tuple[Any, Any, Any] = (
+            attributes.get(ATTR_LATITUDE),
+            attributes.get(ATTR_LONGITUDE),
+            attributes.get(ATTR_RADIUS),
+        )
+        if (indexed := self._zones.get(entity_id)) is not None:
+            if indexed[0] == location:
+                return
+            self.async_remove(entity_id)
+
+        cells: list[_Cell] | None = None
+        with suppress(TypeError, ValueError):
+            cells = _bounding_cells(
+                float(location[0]), float(location[1]), float(location[2])
+            )
+        self._zones[entity_id] = (location, cells)
+        if cells is None:
+            self._unindexed.add(entity_id)
+            return
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(entity_id)
+
+    @callback
+    def async_remove(self, entity_id: str) -> None:
+        """Remove a zone from the index."""
+        if (indexed := self._zones.pop(entity_id, None)) is None:
+            return
+        if (cells := indexed[1]) is None:
+            self._unindexed.discard(entity_id)
+            return
+        for cell in cells:
+            zones = self._cells[cell]
+            zones.discard(entity_id)
+            if not zones:
+                del self._cells[cell]
+
+    @callback
+    def async_candidates(
+        self, latitude: float, longitude: float, radius: float
+    ) -> Iterable[str]:
+        """Return the sorted zones which may be within radius of a location."""
+        try:
+            cells = _bounding_cells(latitude, longitude, radius)
+        except TypeError:
+            cells = None
+        if cells is None:
+            return sorted(self._zones)
+        candidates = set(self._unindexed)
+        for cell in cells:
+            if zones := self._cells.get(cell):
+                candidates |= zones
+        return sorted(candidates)
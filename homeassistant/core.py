@@ -1910,10 +1910,22 @@ class State:
             as_dict["context"] = ReadOnlyDict(context)
         return ReadOnlyDict(as_dict)
 
+    @under_cached_property
+    def attributes_json(self) -> bytes:
+        """Return a JSON string of the attributes.
+
+        The attributes are only encoded once and embedded in the other JSON
+        representations of the State. A State created with the attributes
+        of the previous State reuses their JSON string.
+        """
+        return json_bytes(self.attributes)
+
     @under_cached_property
     def as_dict_json(self) -> bytes:
         """Return a JSON string of the State."""
-        return json_bytes(self._as_dict)
+        return json_bytes(
+            {**self._as_dict, "attributes": json_fragment(self.attributes_json)}
+        )
 
     @under_cached_property
     def json_fragment(self) -> json_fragment:
@@ -1956,7 +1968,11 @@ class State:
 
         It is used for sending multiple states in a single message.
         """
-        return json_bytes({self.entity_id: self.as_compressed_state})[1:-1]
+        compressed_state = {
+            **self.as_compressed_state,
+            COMPRESSED_STATE_ATTRIBUTES: json_fragment(self.attributes_json),
+        }
+        return json_bytes({self.entity_id: compressed_state})[1:-1]
 
     @classmethod
     def from_dict(cls, json_dict: dict[str, Any]) -> Self | None:
@@ -2354,10 +2370,13 @@ class StateMachine:
             )
             return
 
+        attributes_json: bytes | None = None
         if same_attr:
             if TYPE_CHECKING:
                 assert old_state is not None
             attributes = old_state.attributes
+            # Reuse the JSON string of the attributes if it was already built
+            attributes_json = old_state._cache.get("attributes_json")  # noqa: SLF001
 
         # This is intentionally called with positional only arguments for performance
         # reasons
@@ -2373,6 +2392,8 @@ class StateMachine:
             state_info,
             timestamp,
         )
+        if attributes_json is not None:
+            state._cache["attributes_json"] = attributes_json  # noqa: SLF001
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
@@ -62,6 +62,7 @@ from .helpers import config_validation as cv, issue_registry as ir
 from .helpers.entity_values import EntityValues
 from .helpers.frame import ReportBehavior, report_usage
 from .helpers.storage import Store
+from .helpers.timer_wheel import async_enable_timer_wheel
 from .helpers.typing import UNDEFINED, UndefinedType
 from .util import dt as dt_util, location
 from .util.hass_dict import HassKey
@@ -86,6 +87,7 @@ DATA_CUSTOMIZE: HassKey[EntityValues] = HassKey("hass_customize")
 CONF_CREDENTIAL: Final = "credential"
 CONF_ICE_SERVERS: Final = "ice_servers"
 CONF_WEBRTC: Final = "webrtc"
+CONF_TIMER_WHEEL_RESOLUTION: Final = "timer_wheel_resolution"
 
 CORE_STORAGE_KEY = "core.config"
 CORE_STORAGE_VERSION = 1
@@ -324,6 +326,9 @@ CORE_CONFIG_SCHEMA = vol.All(
             vol.Optional(CONF_COUNTRY): cv.country,
             vol.Optional(CONF_LANGUAGE): cv.language,
             vol.Optional(CONF_DEBUG): cv.boolean,
+            vol.Optional(CONF_TIMER_WHEEL_RESOLUTION): vol.All(
+                vol.Coerce(float), vol.Range(min=0.01, max=1)
+            ),
             vol.Optional(CONF_WEBRTC): vol.Schema(
                 {
                     vol.Required(CONF_ICE_SERVERS): vol.All(
@@ -416,6 +421,9 @@ async def async_process_ha_core_config(hass: HomeAssistant, config: dict) -> Non
     if config.get(CONF_DEBUG):
         hac.debug = True
 
+    if CONF_TIMER_WHEEL_RESOLUTION in config:
+        async_enable_timer_wheel(hass, config[CONF_TIMER_WHEEL_RESOLUTION])
+
     if CONF_WEBRTC in config:
         hac.webrtc.ice_servers = [
             RTCIceServer(
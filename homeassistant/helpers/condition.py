@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 from collections import deque
 from collections.abc import Callable, Container, Generator
-from contextlib import contextmanager
+from contextlib import AbstractContextManager, contextmanager, nullcontext
 from datetime import datetime, time as dt_time, timedelta
 import functools as ft
 import logging
@@ -65,6 +65,7 @@ from .template import Template, render_complex
 from .trace import (
     TraceElement,
     trace_append_element,
+    trace_cv,
     trace_path,
     trace_path_get,
     trace_stack_cv,
@@ -118,6 +119,9 @@ class ConditionProtocol(Protocol):
 
 type ConditionCheckerType = Callable[[HomeAssistant, TemplateVarsType], bool | None]
 
+# Context manager used instead of the trace helpers when tracing is disabled
+_NO_TRACE = nullcontext()
+
 
 def condition_trace_append(variables: TemplateVarsType, path: str) -> TraceElement:
     """Append a TraceElement to trace[path]."""
@@ -150,6 +154,27 @@ def condition_trace_update_result(**kwargs: Any) -> None:
     node.update_result(**kwargs)
 
 
+def _trace_paths(key: str, count: int) -> list[list[str]]:
+    """Return the trace paths of the items of a list in the config tree."""
+    return [[key, str(index)] for index in range(count)]
+
+
+def _trace_path(suffix: list[str]) -> AbstractContextManager[None]:
+    """Go deeper in the config tree if tracing is enabled."""
+    if trace_cv.get() is None:
+        return _NO_TRACE
+    return trace_path(suffix)
+
+
+def _trace_condition(
+    variables: TemplateVarsType,
+) -> AbstractContextManager[TraceElement | None]:
+    """Trace condition evaluation if tracing is enabled."""
+    if trace_cv.get() is None:
+        return _NO_TRACE
+    return trace_condition(variables)
+
+
 @contextmanager
 def trace_condition(variables: TemplateVarsType) -> Generator[TraceElement]:
     """Trace condition evaluation."""
@@ -177,6 +202,9 @@ def trace_condition_function(condition: ConditionCheckerType) -> ConditionChecke
     @ft.wraps(condition)
     def wrapper(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool | None:
         """Trace condition."""
+        if trace_cv.get() is None:
+            # Not tracing, skip building the trace elements
+            return condition(hass, variables)
         with trace_condition(variables):
             result = condition(hass, variables)
             condition_trace_update_result(result=result)
@@ -263,6 +291,7 @@ async def async_and_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'AND'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    paths = _trace_paths("conditions", len(checks))
 
     @trace_condition_function
     def if_and_condition(
@@ -272,7 +301,7 @@ async def async_and_from_config(
         errors = []
         for index, check in enumerate(checks):
             try:
-                with trace_path(["conditions", str(index)]):
+                with _trace_path(paths[index]):
                     if check(hass, variables) is False:
                         return False
             except ConditionError as ex:
@@ -294,6 +323,7 @@ async def async_or_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'OR'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    paths = _trace_paths("conditions", len(checks))
 
     @trace_condition_function
     def if_or_condition(
@@ -303,7 +333,7 @@ async def async_or_from_config(
         errors = []
         for index, check in enumerate(checks):
             try:
-                with trace_path(["conditions", str(index)]):
+                with _trace_path(paths[index]):
                     if check(hass, variables) is True:
                         return True
             except ConditionError as ex:
@@ -325,6 +355,7 @@ async def async_not_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'NOT'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    paths = _trace_paths("conditions", len(checks))
 
     @trace_condition_function
     def if_not_condition(
@@ -334,7 +365,7 @@ async def async_not_from_config(
         errors = []
         for index, check in enumerate(checks):
             try:
-                with trace_path(["conditions", str(index)]):
+                with _trace_path(paths[index]):
                     if check(hass, variables):
                         return False
             except ConditionError as ex:
@@ -505,6 +536,7 @@ def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
     below = config.get(CONF_BELOW)
     above = config.get(CONF_ABOVE)
     value_template = config.get(CONF_VALUE_TEMPLATE)
+    paths = _trace_paths("entity_id", len(entity_ids))
 
     @trace_condition_function
     def if_numeric_state(
@@ -514,7 +546,7 @@ def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
         errors = []
         for index, entity_id in enumerate(entity_ids):
             try:
-                with trace_path(["entity_id", str(index)]), trace_condition(variables):
+                with _trace_path(paths[index]), _trace_condition(variables):
                     if not async_numeric_state(
                         hass,
                         entity_id,
@@ -624,6 +656,7 @@ def state_from_config(config: ConfigType) -> ConditionCheckerType:
 
     if not isinstance(req_states, list):
         req_states = [req_states]
+    paths = _trace_paths("entity_id", len(entity_ids))
 
     @trace_condition_function
     def if_state(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
@@ -632,7 +665,7 @@ def state_from_config(config: ConfigType) -> ConditionCheckerType:
         result: bool = match != ENTITY_MATCH_ANY
         for index, entity_id in enumerate(entity_ids):
             try:
-                with trace_path(["entity_id", str(index)]), trace_condition(variables):
+                with _trace_path(paths[index]), _trace_condition(variables):
                     if state(
                         hass, entity_id, req_states, for_period, attribute, variables
                     ):
@@ -1088,13 +1121,14 @@ async def async_conditions_from_config(
         await async_from_config(hass, condition_config)
         for condition_config in condition_configs
     ]
+    paths = _trace_paths("condition", len(checks))
 
     def check_conditions(variables: TemplateVarsType = None) -> bool:
         """AND all conditions."""
         errors: list[ConditionErrorIndex] = []
         for index, check in enumerate(checks):
             try:
-                with trace_path(["condition", str(index)]):
+                with _trace_path(paths[index]):
                     if check(hass, variables) is False:
                         return False
             except ConditionError as ex:
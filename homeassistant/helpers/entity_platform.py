@@ -47,6 +47,7 @@ from . import (
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
 from .event import async_call_later
 from .issue_registry import IssueSeverity, async_create_issue
+from .polling import PollJob, async_get_polling_scheduler
 from .typing import UNDEFINED, ConfigType, DiscoveryInfoType, VolDictType, VolSchemaType
 
 if TYPE_CHECKING:
@@ -149,14 +150,15 @@ class EntityPlatform:
         self._tasks: list[asyncio.Task[None]] = []
         # Stop tracking tasks after setup is completed
         self._setup_complete = False
-        # Method to cancel the state change listener
-        self._async_polling_timer: asyncio.TimerHandle | None = None
+        # Periodic poll of the entities by the polling scheduler
+        self._async_polling_timer: PollJob | None = None
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
 
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
+        self._update_in_executor: bool = False
 
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
@@ -209,6 +211,7 @@ class EntityPlatform:
             return self.parallel_updates
 
         self.parallel_updates_created = True
+        self._update_in_executor = entity_has_sync_update
 
         parallel_updates = getattr(self.platform, "PARALLEL_UPDATES", None)
 
@@ -672,18 +675,20 @@ class EntityPlatform:
         ):
             return
 
-        self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
-            self._async_handle_interval_callback,
+        key = f"{self.domain}.{self.platform_name}"
+        if self.config_entry:
+            key = f"{key}.{self.config_entry.entry_id}"
+        if self.entity_namespace:
+            key = f"{key}.{self.entity_namespace}"
+        self._async_polling_timer = async_get_polling_scheduler(
+            self.hass
+        ).async_schedule(
+            key, self.scan_interval_seconds, self._async_handle_interval_callback
         )
 
     @callback
     def _async_handle_interval_callback(self) -> None:
         """Update all the entity states in a single platform."""
-        self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
-            self._async_handle_interval_callback,
-        )
         if self.config_entry:
             self.config_entry.async_create_background_task(
                 self.hass,
@@ -1034,6 +1039,7 @@ class EntityPlatform:
         """
         if self._process_updates is None:
             self._process_updates = asyncio.Lock()
+        poll_job = self._async_polling_timer
         if self._process_updates.locked():
             self.logger.warning(
                 "Updating %s %s took longer than the scheduled update interval %s",
@@ -1041,28 +1047,40 @@ class EntityPlatform:
                 self.domain,
                 self.scan_interval,
             )
+            if poll_job is not None:
+                poll_job.async_record_overrun()
             return
 
         async with self._process_updates:
-            if self._update_in_sequence or len(self.entities) <= 1:
-                # If we know we will update sequentially, we want to avoid scheduling
-                # the coroutines as tasks that will wait on the semaphore lock.
-                for entity in list(self.entities.values()):
-                    # If the entity is removed from hass during the previous
-                    # entity being updated, we need to skip updating the
-                    # entity.
-                    if entity.should_poll and entity.hass:
-                        await entity.async_update_ha_state(True)
-                return
+            start = self.hass.loop.time()
+            if self._update_in_executor:
+                # Limit the platforms updating entities in the executor at once
+                async with async_get_polling_scheduler(self.hass).executor_polls:
+                    await self._async_update_polling_entities()
+            else:
+                await self._async_update_polling_entities()
+            if poll_job is not None:
+                poll_job.async_record_poll(self.hass.loop.time() - start)
+
+    async def _async_update_polling_entities(self) -> None:
+        """Update the polling entities."""
+        if self._update_in_sequence or len(self.entities) <= 1:
+            # If we know we will update sequentially, we want to avoid scheduling
+            # the coroutines as tasks that will wait on the semaphore lock.
+            for entity in list(self.entities.values()):
+                # If the entity is removed from hass during the previous
+                # entity being updated, we need to skip updating the
+                # entity.
+                if entity.should_poll and entity.hass:
+                    await entity.async_update_ha_state(True)
+            return
 
-            if tasks := [
-                create_eager_task(
-                    entity.async_update_ha_state(True), loop=self.hass.loop
-                )
-                for entity in self.entities.values()
-                if entity.should_poll
-            ]:
-                await asyncio.gather(*tasks)
+        if tasks := [
+            create_eager_task(entity.async_update_ha_state(True), loop=self.hass.loop)
+            for entity in self.entities.values()
+            if entity.should_poll
+        ]:
+            await asyncio.gather(*tasks)
 
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
@@ -55,6 +55,7 @@ from .entity_registry import (
 from .ratelimit import KeyedRateLimit
 from .sun import get_astral_event_next
 from .template import RenderInfo, Template, result_as_boolean
+from .timer_wheel import DATA_TIMER_WHEEL, TimerWheelHandle, integration_for_target
 from .typing import TemplateVarsType
 
 _TRACK_STATE_CHANGE_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = HassKey(
@@ -1492,13 +1493,16 @@ class _TrackPointUTCTime:
     job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     utc_point_in_time: datetime
     expected_fire_timestamp: float
-    _cancel_callback: asyncio.TimerHandle | None = None
+    _cancel_callback: asyncio.TimerHandle | TimerWheelHandle | None = None
 
     def async_attach(self) -> None:
         """Initialize track job."""
-        loop = self.hass.loop
-        self._cancel_callback = loop.call_at(
-            loop.time() + self.expected_fire_timestamp - time.time(), self
+        hass = self.hass
+        self._cancel_callback = _async_schedule_at(
+            hass,
+            hass.loop.time() + self.expected_fire_timestamp - time.time(),
+            self.job.target,
+            self,
         )
 
     @callback
@@ -1517,8 +1521,10 @@ class _TrackPointUTCTime:
         # time.
         if (delta := (self.expected_fire_timestamp - time_tracker_timestamp())) > 0:
             _LOGGER.debug("Called %f seconds too early, rearming", delta)
-            loop = self.hass.loop
-            self._cancel_callback = loop.call_at(loop.time() + delta, self)
+            hass = self.hass
+            self._cancel_callback = _async_schedule_at(
+                hass, hass.loop.time() + delta, self.job.target, self
+            )
             return
 
         self.hass.async_run_hass_job(self.job, self.utc_point_in_time)
@@ -1559,6 +1565,15 @@ def async_track_point_in_utc_time(
 track_point_in_utc_time = threaded_listener_factory(async_track_point_in_utc_time)
 
 
+def _async_schedule_at(
+    hass: HomeAssistant, when: float, target: Any, func: Callable[..., Any], *args: Any
+) -> asyncio.TimerHandle | TimerWheelHandle:
+    """Schedule a callback with the event loop, or the timer wheel if enabled."""
+    if (wheel := hass.data.get(DATA_TIMER_WHEEL)) is None:
+        return hass.loop.call_at(when, func, *args)
+    return wheel.async_call_at(when, integration_for_target(target), func, *args)
+
+
 def _run_async_call_action(
     hass: HomeAssistant, job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
 ) -> None:
@@ -1583,7 +1598,9 @@ def async_call_at(
         if isinstance(action, HassJob)
         else HassJob(action, f"call_at {loop_time}")
     )
-    return hass.loop.call_at(loop_time, _run_async_call_action, hass, job).cancel
+    return _async_schedule_at(
+        hass, loop_time, job.target, _run_async_call_action, hass, job
+    ).cancel
 
 
 @callback
@@ -1605,8 +1622,9 @@ def async_call_later(
         if isinstance(action, HassJob)
         else HassJob(action, f"call_later {delay}")
     )
-    loop = hass.loop
-    return loop.call_at(loop.time() + delay, _run_async_call_action, hass, job).cancel
+    return _async_schedule_at(
+        hass, hass.loop.time() + delay, job.target, _run_async_call_action, hass, job
+    ).cancel
 
 
 call_later = threaded_listener_factory(async_call_later)
@@ -1623,7 +1641,7 @@ class _TrackTimeInterval:
     cancel_on_shutdown: bool | None
     _track_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
     _run_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
-    _timer_handle: asyncio.TimerHandle | None = None
+    _timer_handle: asyncio.TimerHandle | TimerWheelHandle | None = None
 
     def async_attach(self) -> None:
         """Initialize track job."""
@@ -1645,9 +1663,12 @@ class _TrackTimeInterval:
         if TYPE_CHECKING:
             assert self._track_job is not None
         hass = self.hass
-        loop = hass.loop
-        self._timer_handle = loop.call_at(
-            loop.time() + self.seconds, self._interval_listener, self._track_job
+        self._timer_handle = _async_schedule_at(
+            hass,
+            hass.loop.time() + self.seconds,
+            self.action,
+            self._interval_listener,
+            self._track_job,
         )
 
     @callback
@@ -0,0 +1,199 @@
+"""Global scheduler for the polling of entity platforms.
+
+Platforms sharing a scan interval that were set up at the same time used to
+poll in the same second, making the load of the event loop and executor
+spike in lockstep. The scheduler spreads the polls of the platforms over
+their interval with a stable phase derived from the platform, limits how
+many platforms update entities in the executor at the same time and
+stretches the intervals while the event loop keeps lagging.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+from typing import Any
+import zlib
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_POLLING_SCHEDULER: HassKey[PollingScheduler] = HassKey("polling_scheduler")
+
+# Maximum number of platforms updating entities in the executor at once
+MAX_EXECUTOR_POLLS = 10
+
+# Seconds a poll can start late before it counts as late
+LAG_THRESHOLD = 1.0
+# Consecutive late polls after which the event loop is considered lagging,
+# and consecutive polls on time after which it is considered recovered
+SUSTAINED_LAG_POLLS = 5
+# Intervals are stretched by this factor every time the event loop is
+# lagging and shrunk back by it every time it recovered
+STRETCH_FACTOR = 1.5
+MAX_STRETCH = 4.0
+
+
+class PollJob:
+    """Periodic poll of a platform."""
+
+    __slots__ = (
+        "_callback",
+        "_handle",
+        "_scheduler",
+        "interval",
+        "key",
+        "last_duration",
+        "max_duration",
+        "overruns",
+        "polls",
+    )
+
+    def __init__(
+        self,
+        scheduler: PollingScheduler,
+        key: str,
+        interval: float,
+        poll_callback: Callable[[], None],
+    ) -> None:
+        """Initialize the job."""
+        self._scheduler = scheduler
+        self._callback = poll_callback
+        self._handle: asyncio.TimerHandle | None = None
+        self.key = key
+        self.interval = interval
+        self.polls = 0
+        self.overruns = 0
+        self.last_duration = 0.0
+        self.max_duration = 0.0
+
+    @callback
+    def cancel(self) -> None:
+        """Stop polling."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._scheduler.async_remove(self)
+
+    @callback
+    def async_record_poll(self, duration: float) -> None:
+        """Record how long updating the entities took."""
+        self.polls += 1
+        self.last_duration = duration
+        self.max_duration = max(self.max_duration, duration)
+
+    @callback
+    def async_record_overrun(self) -> None:
+        """Record a poll skipped since the previous one was still running."""
+        self.overruns += 1
+
+    @callback
+    def async_schedule_at(self, when: float) -> None:
+        """Schedule the next poll."""
+        self._handle = self._scheduler.hass.loop.call_at(when, self._async_run, when)
+
+    @callback
+    def _async_run(self, when: float) -> None:
+        """Poll and schedule the next poll."""
+        scheduler = self._scheduler
+        now = scheduler.hass.loop.time()
+        scheduler.async_record_lag(now - when)
+        interval = self.interval * scheduler.stretch
+        self.async_schedule_at(max(when + interval, now + interval / 2))
+        self._callback()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics of the job."""
+        return {
+            "platform": self.key,
+            "interval": self.interval,
+            "polls": self.polls,
+            "overruns": self.overruns,
+            "last_duration": self.last_duration,
+            "max_duration": self.max_duration,
+        }
+
+
+class PollingScheduler:
+    """Schedule the polls of all entity platforms."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.executor_polls = asyncio.Semaphore(MAX_EXECUTOR_POLLS)
+        self.stretch = 1.0
+        self._late_polls = 0
+        self._on_time_polls = 0
+        self._jobs: dict[PollJob, None] = {}
+
+    @callback
+    def async_schedule(
+        self, key: str, interval: float, poll_callback: Callable[[], None]
+    ) -> PollJob:
+        """Call back every interval seconds at a stable phase for the key."""
+        job = PollJob(self, key, interval, poll_callback)
+        self._jobs[job] = None
+        phase = zlib.crc32(key.encode()) / 0xFFFFFFFF * interval
+        now = self.hass.loop.time()
+        job.async_schedule_at(now + ((phase - now) % interval or interval))
+        return job
+
+    @callback
+    def async_remove(self, job: PollJob) -> None:
+        """Forget a cancelled job."""
+        self._jobs.pop(job, None)
+
+    @callback
+    def async_record_lag(self, lag: float) -> None:
+        """Stretch or restore the intervals depending on the event loop lag.
+
+        A single late poll, for example after a slow startup or a long
+        blocking call, does not change the intervals. Only polls starting
+        late one after the other do.
+        """
+        if lag > LAG_THRESHOLD:
+            self._on_time_polls = 0
+            self._late_polls += 1
+            if self._late_polls < SUSTAINED_LAG_POLLS:
+                return
+            self._late_polls = 0
+            if self.stretch < MAX_STRETCH:
+                self.stretch = min(self.stretch * STRETCH_FACTOR, MAX_STRETCH)
+                _LOGGER.debug(
+                    "Polling keeps starting late, last by %.1f seconds,"
+                    " stretching the intervals by %s",
+                    lag,
+                    self.stretch,
+                )
+            return
+        self._late_polls = 0
+        if self.stretch == 1.0:
+            return
+        self._on_time_polls += 1
+        if self._on_time_polls >= SUSTAINED_LAG_POLLS:
+            self._on_time_polls = 0
+            self.stretch = max(self.stretch / STRETCH_FACTOR, 1.0)
+
+    @callback
+    def async_get_stats(self) -> list[dict[str, Any]]:
+        """Return the poll statistics of the platforms."""
+        return [job.as_dict() for job in self._jobs]
+
+
+@callback
+def async_get_polling_scheduler(hass: HomeAssistant) -> PollingScheduler:
+    """Return the polling scheduler."""
+    if (scheduler := hass.data.get(DATA_POLLING_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_POLLING_SCHEDULER] = PollingScheduler(hass)
+    return scheduler
+
+
+@callback
+def async_get_polling_stats(hass: HomeAssistant) -> list[dict[str, Any]] | None:
+    """Return the poll statistics of the platforms, None if nothing is polled."""
+    if (scheduler := hass.data.get(DATA_POLLING_SCHEDULER)) is None:
+        return None
+    return scheduler.async_get_stats()
@@ -0,0 +1,65 @@
+"""Reverse index of the items referenced by automations, scripts and scenes.
+
+Finding the automations referencing an entity, device, area, ... used to
+check the referenced items of every automation. The search integration
+does this for every item it visits, so the cost grew quadratically with
+the number of automations. Items are now indexed when they are added and
+removed from the index when they are removed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable, Mapping
+
+from homeassistant.core import callback
+
+
+class ReferenceIndex[_ItemT: Hashable]:
+    """Index of the items referencing an id, per kind of reference."""
+
+    __slots__ = ("_index", "_references")
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        # kind -> referenced id -> items, in the order they were added
+        self._index: dict[str, dict[str, dict[_ItemT, None]]] = {}
+        # item -> kind -> referenced ids
+        self._references: dict[_ItemT, dict[str, set[str]]] = {}
+
+    @callback
+    def async_add(
+        self, item: _ItemT, references: Mapping[str, Iterable[str | None]]
+    ) -> None:
+        """Index the ids referenced by an item, per kind of reference."""
+        self.async_remove(item)
+        item_references = self._references[item] = {}
+        for kind, referenced_ids in references.items():
+            ids = {referenced_id for referenced_id in referenced_ids if referenced_id}
+            if not ids:
+                continue
+            item_references[kind] = ids
+            kind_index = self._index.setdefault(kind, {})
+            for referenced_id in ids:
+                kind_index.setdefault(referenced_id, {})[item] = None
+
+    @callback
+    def async_remove(self, item: _ItemT) -> None:
+        """Remove the references of an item."""
+        if (item_references := self._references.pop(item, None)) is None:
+            return
+        for kind, ids in item_references.items():
+            kind_index = self._index[kind]
+            for referenced_id in ids:
+                items = kind_index[referenced_id]
+                del items[item]
+                if not items:
+                    del kind_index[referenced_id]
+            if not kind_index:
+                del self._index[kind]
+
+    @callback
+    def async_get(self, kind: str, referenced_id: str) -> list[_ItemT]:
+        """Return the items referencing an id."""
+        if (kind_index := self._index.get(kind)) is None:
+            return []
+        return list(kind_index.get(referenced_id, ()))
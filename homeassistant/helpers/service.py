@@ -47,7 +47,12 @@ from homeassistant.exceptions import (
     Unauthorized,
     UnknownUser,
 )
-from homeassistant.loader import Integration, async_get_integrations, bind_hass
+from homeassistant.loader import (
+    DATA_COMPONENTS,
+    Integration,
+    async_get_integrations,
+    bind_hass,
+)
 from homeassistant.util.async_ import create_eager_task
 from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.yaml import load_yaml_dict
@@ -68,7 +73,10 @@ from .selector import TargetSelector
 from .typing import ConfigType, TemplateVarsType, VolDictType, VolSchemaType
 
 if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+
     from .entity import Entity
+    from .entity_platform import EntityPlatform
 
 CONF_SERVICE_ENTITY_ID = "entity_id"
 
@@ -80,6 +88,9 @@ SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]]
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
     tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
+HUB_SERVICE_CALL_SEMAPHORES: HassKey[dict[str, asyncio.Semaphore | None]] = HassKey(
+    "hub_service_call_semaphores"
+)
 
 
 @cache
@@ -1003,9 +1014,15 @@ async def entity_service_call(
     if len(entities) == 1:
         # Single entity case avoids creating task
         entity = entities[0]
-        single_response = await _handle_entity_call(
-            hass, entity, func, data, call.context
-        )
+        if (hub_semaphore := _get_hub_semaphore(hass, entity.platform)) is None:
+            single_response = await _handle_entity_call(
+                hass, entity, func, data, call.context
+            )
+        else:
+            async with hub_semaphore:
+                single_response = await _handle_entity_call(
+                    hass, entity, func, data, call.context
+                )
         if entity.should_poll:
             # Context expires if the turn on commands took a long time.
             # Set context again so it's there when we update
@@ -1013,23 +1030,105 @@ async def entity_service_call(
             await entity.async_update_ha_state(True)
         return {entity.entity_id: single_response} if return_response else None
 
+    # Call the entities of each hub, which is a config entry, or of each
+    # platform without a config entry as a group. Calls within a group are
+    # limited by the parallel service calls of the hub and the parallel updates
+    # of the platforms, and the polling entities of a group are refreshed as
+    # soon as the group is done instead of after the slowest hub.
+    hub_entities: dict[ConfigEntry | EntityPlatform | None, list[Entity]] = {}
+    for entity in entities:
+        hub = (platform := entity.platform) and (platform.config_entry or platform)
+        hub_entities.setdefault(hub, []).append(entity)
+
+    start = hass.loop.time()
+    group_results: list[
+        tuple[dict[str, ServiceResponse | BaseException], float] | BaseException
+    ] = await asyncio.gather(
+        *[
+            _handle_entity_calls(hass, hub_group, func, data, call.context)
+            for hub_group in hub_entities.values()
+        ],
+        return_exceptions=True,
+    )
+
+    results: dict[str, ServiceResponse | BaseException] = {}
+    refresh_exception: BaseException | None = None
+    for group_result in group_results:
+        if isinstance(group_result, BaseException):
+            refresh_exception = refresh_exception or group_result
+        else:
+            results.update(group_result[0])
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        durations = {
+            hub: group_result[1]
+            for hub, group_result in zip(hub_entities, group_results, strict=True)
+            if not isinstance(group_result, BaseException)
+        }
+        slowest, slowest_duration = max(
+            durations.items(), key=lambda item: item[1], default=(None, 0.0)
+        )
+        _LOGGER.debug(
+            "Called %s.%s on %d entities of %d hubs in %.3f seconds,"
+            " slowest hub %s took %.3f seconds",
+            call.domain,
+            call.service,
+            len(entities),
+            len(hub_entities),
+            hass.loop.time() - start,
+            slowest,
+            slowest_duration,
+        )
+
+    # Raise the exception of the first entity to keep the order of the entities
+    response_data: EntityServiceResponse = {}
+    for entity in entities:
+        if entity.entity_id not in results:
+            continue
+        if isinstance(result := results[entity.entity_id], BaseException):
+            raise result from None
+        response_data[entity.entity_id] = result
+
+    if refresh_exception is not None:
+        raise refresh_exception
+
+    return response_data if return_response and response_data else None
+
+
+async def _handle_entity_calls(
+    hass: HomeAssistant,
+    entities: list[Entity],
+    func: str | HassJob,
+    data: dict | ServiceCall,
+    context: Context,
+) -> tuple[dict[str, ServiceResponse | BaseException], float]:
+    """Handle calling service method of the entities of a hub.
+
+    Returns the results per entity id and how long the calls took.
+    """
+    start = hass.loop.time()
+    hub_semaphore = _get_hub_semaphore(hass, entities[0].platform)
     # Use asyncio.gather here to ensure the returned results
     # are in the same order as the entities list
     results: list[ServiceResponse | BaseException] = await asyncio.gather(
         *[
-            entity.async_request_call(
-                _handle_entity_call(hass, entity, func, data, call.context)
+            _handle_hub_call(
+                hub_semaphore,
+                entity.async_request_call(
+                    _handle_entity_call(hass, entity, func, data, context)
+                ),
             )
             for entity in entities
         ],
         return_exceptions=True,
     )
-
-    response_data: EntityServiceResponse = {}
-    for entity, result in zip(entities, results, strict=False):
-        if isinstance(result, BaseException):
-            raise result from None
-        response_data[entity.entity_id] = result
+    duration = hass.loop.time() - start
+    entity_results = {
+        entity.entity_id: result
+        for entity, result in zip(entities, results, strict=False)
+    }
+    if any(isinstance(result, BaseException) for result in results):
+        return entity_results, duration
 
     tasks: list[asyncio.Task[None]] = []
 
@@ -1039,7 +1138,7 @@ async def entity_service_call(
 
         # Context expires if the turn on commands took a long time.
         # Set context again so it's there when we update
-        entity.async_set_context(call.context)
+        entity.async_set_context(context)
         tasks.append(create_eager_task(entity.async_update_ha_state(True)))
 
     if tasks:
@@ -1048,7 +1147,49 @@ async def entity_service_call(
         for future in done:
             future.result()  # pop exception if have
 
-    return response_data if return_response and response_data else None
+    return entity_results, duration
+
+
+@callback
+def _get_hub_semaphore(
+    hass: HomeAssistant, platform: EntityPlatform | None
+) -> asyncio.Semaphore | None:
+    """Return the semaphore limiting the service calls of a hub.
+
+    Integrations talking to a hub which can only handle a few commands at the
+    same time can set PARALLEL_SERVICE_CALLS in their integration module to
+    limit the entity service calls running at once per config entry, across
+    all platforms and service calls. The semaphore is dropped when the config
+    entry is unloaded.
+    """
+    if platform is None or (entry := platform.config_entry) is None:
+        return None
+    semaphores = hass.data.setdefault(HUB_SERVICE_CALL_SEMAPHORES, {})
+    if (entry_id := entry.entry_id) in semaphores:
+        return semaphores[entry_id]
+    component = hass.data[DATA_COMPONENTS].get(entry.domain)
+    parallel_calls: int | None = getattr(component, "PARALLEL_SERVICE_CALLS", None)
+    semaphores[entry_id] = semaphore = (
+        asyncio.Semaphore(parallel_calls) if parallel_calls else None
+    )
+
+    @callback
+    def _async_remove_semaphore() -> None:
+        """Remove the semaphore of an unloaded hub."""
+        semaphores.pop(entry_id, None)
+
+    entry.async_on_unload(_async_remove_semaphore)
+    return semaphore
+
+
+async def _handle_hub_call[_T](
+    hub_semaphore: asyncio.Semaphore | None, coro: Coroutine[Any, Any, _T]
+) -> _T:
+    """Run an entity service call within the limit of its hub."""
+    if hub_semaphore is None:
+        return await coro
+    async with hub_semaphore:
+        return await coro
 
 
 async def _handle_entity_call(
@@ -0,0 +1,215 @@
+"""Helper to batch the entity states reported to a cloud service.
+
+Voice assistants like Google Assistant and Alexa get the state of exposed
+entities pushed to them. The reporter collects the changes of entities over
+a time window, only keeps the properties that changed since they were last
+reported and retries the reports which were not delivered with a growing
+delay.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Coroutine, Hashable, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from logging import Logger
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+
+from .event import async_call_later
+
+# Maximum seconds to wait between reports while reports are not delivered
+MAX_BACKOFF = 300
+# Times a report is sent before it is dropped
+MAX_ATTEMPTS = 5
+
+
+@dataclass(slots=True)
+class StateReport[_DataT]:
+    """Pending report of an entity."""
+
+    data: _DataT
+    properties: Mapping[Hashable, Any]
+    changed: set[Hashable] = field(default_factory=set)
+    attempts: int = 0
+
+
+type SendCallback[_DataT] = Callable[
+    [dict[str, StateReport[_DataT]]], Coroutine[Any, Any, set[str]]
+]
+
+
+class StateReporter[_DataT]:
+    """Batch and deduplicate the entity states reported to a service.
+
+    The send callback receives the pending reports by entity id and returns
+    the entity ids whose report was not delivered, for example because the
+    service rate limited it or did not respond. Only the delivered reports
+    count as reported. The others are sent again after a growing delay and
+    dropped after MAX_ATTEMPTS tries.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        logger: Logger,
+        *,
+        name: str,
+        window: float,
+        send: SendCallback[_DataT],
+    ) -> None:
+        """Initialize the reporter.
+
+        window: seconds to collect changes before reporting them, with 0 the
+                changes are reported right away unless a report is in progress.
+        """
+        self.hass = hass
+        self.logger = logger
+        self.name = name
+        self.window = window
+        self._send = send
+        self._job = HassJob(
+            self._async_report_pending,
+            f"state reporter {name}",
+            cancel_on_shutdown=True,
+        )
+        # Last reported properties of each entity
+        self._reported: dict[str, dict[Hashable, Any]] = {}
+        self._pending: dict[str, StateReport[_DataT]] = {}
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._sending = False
+        self._shutdown = False
+        self.backoff: float = 0
+        self.reports_sent = 0
+        self.batches_sent = 0
+        self.skipped = 0
+        self.undelivered = 0
+        self.dropped = 0
+
+    @callback
+    def async_set_reported(
+        self, entity_id: str, properties: Mapping[Hashable, Any]
+    ) -> None:
+        """Mark properties of an entity as reported outside of the reporter."""
+        self._reported[entity_id] = dict(properties)
+
+    @callback
+    def async_report(
+        self,
+        entity_id: str,
+        data: _DataT,
+        properties: Mapping[Hashable, Any],
+        *,
+        force: bool = False,
+    ) -> bool:
+        """Queue a state of an entity.
+
+        Only the properties which differ from the last reported ones are
+        marked as changed, the state is not reported if none changed unless
+        force is set. Returns if the state was queued.
+        """
+        if self._shutdown:
+            return False
+        reported = self._reported.get(entity_id, {})
+        if force:
+            changed = set(properties)
+        else:
+            changed = {
+                key
+                for key, value in properties.items()
+                if key not in reported or reported[key] != value
+            }
+        if (pending := self._pending.get(entity_id)) is not None:
+            changed |= pending.changed
+        if not changed:
+            self.skipped += 1
+            return False
+        self._pending[entity_id] = StateReport(data, properties, changed)
+        self._async_schedule()
+        return True
+
+    @callback
+    def _async_schedule(self) -> None:
+        """Schedule a report of the pending states."""
+        if self._sending or self._unsub_timer is not None or not self._pending:
+            return
+        if (delay := max(self.window, self.backoff)) == 0:
+            self._sending = True
+            self.hass.async_create_task(
+                self._async_send_pending(), f"state reporter {self.name}"
+            )
+            return
+        self._unsub_timer = async_call_later(self.hass, delay, self._job)
+
+    async def _async_report_pending(self, _now: datetime) -> None:
+        """Report the pending states at the end of the window."""
+        self._unsub_timer = None
+        if self._sending:
+            return
+        self._sending = True
+        await self._async_send_pending()
+
+    async def _async_send_pending(self) -> None:
+        """Send the pending states in one batch."""
+        batch = self._pending
+        self._pending = {}
+        try:
+            undelivered = await self._send(batch)
+        finally:
+            self._sending = False
+        self.batches_sent += 1
+        for entity_id, report in batch.items():
+            if entity_id not in undelivered:
+                self.reports_sent += 1
+                self._reported[entity_id] = dict(report.properties)
+        if not undelivered:
+            self.backoff = 0
+            self._async_schedule()
+            return
+        self.undelivered += len(undelivered)
+        self.backoff = min(max(self.window, 1, self.backoff * 2), MAX_BACKOFF)
+        self.logger.warning(
+            "Reporting %s states to %s failed, retrying in %s seconds",
+            len(undelivered),
+            self.name,
+            self.backoff,
+        )
+        for entity_id in undelivered:
+            report = batch[entity_id]
+            report.attempts += 1
+            if (newer := self._pending.get(entity_id)) is not None:
+                newer.changed |= report.changed
+            elif report.attempts < MAX_ATTEMPTS:
+                self._pending[entity_id] = report
+            else:
+                self.dropped += 1
+                self.logger.warning(
+                    "Giving up reporting the state of %s to %s after %s attempts",
+                    entity_id,
+                    self.name,
+                    report.attempts,
+                )
+        self._async_schedule()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel the pending reports."""
+        self._shutdown = True
+        self._pending.clear()
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    @callback
+    def async_diagnostics(self) -> dict[str, Any]:
+        """Return the counters of the reporter."""
+        return {
+            "batches_sent": self.batches_sent,
+            "reports_sent": self.reports_sent,
+            "skipped": self.skipped,
+            "undelivered": self.undelivered,
+            "dropped": self.dropped,
+            "backoff": self.backoff,
+            "pending": len(self._pending),
+        }
@@ -0,0 +1,256 @@
+"""A hierarchical timer wheel to schedule large numbers of timers.
+
+Every timer scheduled with loop.call_at is its own handle in the heap of the
+event loop, so tens of thousands of pending timers make scheduling and
+cancelling them expensive. The timer wheel batches timers into slots of a
+configurable resolution and only keeps a single loop timer for the next slot
+that is due. Timers that are far in the future are kept in coarser slots that
+are moved to the finer levels once they get close.
+
+The timer wheel is opt-in, timers fire up to one resolution late.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable
+import heapq
+import math
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+DATA_TIMER_WHEEL: HassKey[TimerWheel] = HassKey("timer_wheel")
+
+DEFAULT_RESOLUTION = 0.1
+
+# Number of slots per level, each slot of a level covers
+# all the slots of the level below it
+WHEEL_BITS = 8
+WHEEL_SIZE = 1 << WHEEL_BITS
+LEVELS = 3
+
+
+def integration_for_target(target: Any) -> str:
+    """Return the integration a timer callback belongs to."""
+    module = getattr(target, "__module__", None) or getattr(
+        getattr(target, "func", None), "__module__", None
+    )
+    if not isinstance(module, str):
+        return "homeassistant"
+    if module.startswith("homeassistant.components."):
+        return module.split(".", 3)[2]
+    if module.startswith("custom_components."):
+        return module.split(".", 2)[1]
+    return "homeassistant"
+
+
+class TimerWheelHandle:
+    """Handle of a timer scheduled on the timer wheel."""
+
+    __slots__ = (
+        "_args",
+        "_bucket",
+        "_callback",
+        "_cancelled",
+        "_integration",
+        "_wheel",
+        "_when",
+    )
+
+    def __init__(
+        self,
+        wheel: TimerWheel,
+        when: float,
+        integration: str,
+        callback_: Callable[..., Any],
+        args: tuple[Any, ...],
+    ) -> None:
+        """Initialize the handle."""
+        self._wheel = wheel
+        self._when = when
+        self._integration = integration
+        self._callback = callback_
+        self._args = args
+        self._bucket: dict[TimerWheelHandle, None] | None = None
+        self._cancelled = False
+
+    def __repr__(self) -> str:
+        """Return the representation."""
+        return f"<TimerWheelHandle when={self._when} {self._callback}>"
+
+    def when(self) -> float:
+        """Return the loop time the timer is scheduled for."""
+        return self._when
+
+    def cancelled(self) -> bool:
+        """Return if the timer was cancelled."""
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Cancel the timer.
+
+        A timer taken out of its slot because it is due can still be
+        cancelled until it runs, like by an earlier timer of the same pass.
+        """
+        self._cancelled = True
+        if (bucket := self._bucket) is None:
+            return
+        del bucket[self]
+        self._bucket = None
+        wheel = self._wheel
+        wheel.pending[self._integration] -= 1
+        if not bucket:
+            wheel.async_slot_emptied()
+
+    def _run(self) -> None:
+        """Run the callback unless it was cancelled."""
+        if self._cancelled:
+            return
+        try:
+            self._callback(*self._args)
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as exc:  # noqa: BLE001
+            # Report the error like the handles of the event loop do
+            self._wheel.hass.loop.call_exception_handler(
+                {
+                    "message": f"Exception in callback {self._callback!r}",
+                    "exception": exc,
+                    "handle": self,
+                }
+            )
+
+
+class TimerWheel:
+    """Schedule timers in slots of a fixed resolution."""
+
+    def __init__(self, hass: HomeAssistant, resolution: float) -> None:
+        """Initialize the timer wheel."""
+        self.hass = hass
+        self.resolution = resolution
+        self.pending: Counter[str] = Counter()
+        # The slots of each level keyed by their absolute slot number
+        self._levels: list[dict[int, dict[TimerWheelHandle, None]]] = [
+            {} for _ in range(LEVELS)
+        ]
+        # Slot numbers of each level, may contain slots that were emptied
+        self._heaps: list[list[int]] = [[] for _ in range(LEVELS)]
+        self._current_tick = self._now_tick()
+        self._armed_tick: int | None = None
+        self._loop_timer: Any = None
+
+    def _now_tick(self) -> int:
+        """Return the tick of the current loop time."""
+        return int(self.hass.loop.time() / self.resolution)
+
+    @callback
+    def async_call_at(
+        self, when: float, integration: str, callback_: Callable[..., Any], *args: Any
+    ) -> TimerWheelHandle:
+        """Schedule a callback at or after the loop time when."""
+        handle = TimerWheelHandle(self, when, integration, callback_, args)
+        self.pending[integration] += 1
+        self._insert(handle)
+        self._arm()
+        return handle
+
+    @callback
+    def async_pending_by_integration(self) -> dict[str, int]:
+        """Return the number of pending timers of each integration."""
+        return {
+            integration: count for integration, count in self.pending.items() if count
+        }
+
+    def _insert(self, handle: TimerWheelHandle) -> None:
+        """Insert a timer in the slot of the level matching its distance."""
+        tick = math.ceil(handle.when() / self.resolution)
+        delta = tick - max(self._current_tick, self._now_tick())
+        level = 0
+        while level < LEVELS - 1 and delta >= WHEEL_SIZE << (WHEEL_BITS * level):
+            level += 1
+        slot = tick >> (WHEEL_BITS * level)
+        if (bucket := self._levels[level].get(slot)) is None:
+            bucket = self._levels[level][slot] = {}
+            heapq.heappush(self._heaps[level], slot)
+        bucket[handle] = None
+        handle._bucket = bucket  # noqa: SLF001
+
+    def _next_wake(self) -> tuple[int, int] | None:
+        """Return the tick and level of the next slot that is due."""
+        next_wake: tuple[int, int] | None = None
+        for level, heap in enumerate(self._heaps):
+            slots = self._levels[level]
+            while heap and not slots.get(heap[0]):
+                slots.pop(heapq.heappop(heap), None)
+            if heap:
+                tick = heap[0] << (WHEEL_BITS * level)
+                if next_wake is None or tick < next_wake[0]:
+                    next_wake = (tick, level)
+        return next_wake
+
+    def _arm(self) -> None:
+        """Make sure the loop timer fires for the next slot that is due."""
+        if (next_wake := self._next_wake()) is None:
+            if self._loop_timer is not None:
+                self._loop_timer.cancel()
+                self._loop_timer = self._armed_tick = None
+            return
+        if (tick := next_wake[0]) == self._armed_tick:
+            return
+        if self._loop_timer is not None:
+            self._loop_timer.cancel()
+        self._armed_tick = tick
+        self._loop_timer = self.hass.loop.call_at(
+            tick * self.resolution, self._async_fire, tick
+        )
+
+    @callback
+    def async_slot_emptied(self) -> None:
+        """Move the loop timer when all the timers of a slot were cancelled."""
+        if self._armed_tick is not None:
+            self._arm()
+
+    @callback
+    def _async_fire(self, armed_tick: int) -> None:
+        """Run the timers of every slot that is due."""
+        self._loop_timer = self._armed_tick = None
+        target = max(armed_tick, self._now_tick())
+        due: list[TimerWheelHandle] = []
+        while (next_wake := self._next_wake()) is not None and next_wake[0] <= target:
+            tick, level = next_wake
+            slot = heapq.heappop(self._heaps[level])
+            bucket = self._levels[level].pop(slot)
+            self._current_tick = max(self._current_tick, tick)
+            if level:
+                # Move the timers to the finer levels now they are close
+                for handle in bucket:
+                    self._insert(handle)
+                continue
+            for handle in bucket:
+                handle._bucket = None  # noqa: SLF001
+                self.pending[handle._integration] -= 1  # noqa: SLF001
+            due.extend(bucket)
+        # Timers scheduled by the callbacks are never run in the same pass
+        for handle in sorted(due, key=TimerWheelHandle.when):
+            handle._run()  # noqa: SLF001
+        self._arm()
+
+
+@callback
+def async_enable_timer_wheel(
+    hass: HomeAssistant, resolution: float = DEFAULT_RESOLUTION
+) -> TimerWheel:
+    """Schedule the timers of the event helpers on a timer wheel."""
+    if (wheel := hass.data.get(DATA_TIMER_WHEEL)) is None:
+        wheel = hass.data[DATA_TIMER_WHEEL] = TimerWheel(hass, resolution)
+    return wheel
+
+
+@callback
+def async_get_pending_timers(hass: HomeAssistant) -> dict[str, int] | None:
+    """Return the pending timers of each integration, None if not enabled."""
+    if (wheel := hass.data.get(DATA_TIMER_WHEEL)) is None:
+        return None
+    return wheel.async_pending_by_integration()
@@ -11,12 +11,14 @@ from timeit import default_timer as timer
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import condition, config_validation as cv
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.trace import trace_clear
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -308,3 +310,194 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def state_changed_json(hass):
+    """Serialize states with large attributes changing hundred thousand times."""
+    forecast = [
+        {
+            "datetime": f"2024-01-01T{hour:02}:00:00+00:00",
+            "condition": "cloudy",
+            "temperature": 10.5,
+            "templow": 5.0,
+            "precipitation": 0.2,
+            "precipitation_probability": 40,
+            "wind_bearing": 220.0,
+            "wind_speed": 15.3,
+        }
+        for hour in range(24)
+    ]
+    entities = {
+        "media_player.living_room": {
+            "volume_level": 0.3,
+            "is_volume_muted": False,
+            "media_content_id": "spotify:track:4uLU6hMCjMI75M1A2tKUQC",
+            "media_content_type": "music",
+            "media_duration": 212,
+            "media_position": 35,
+            "media_title": "Never Gonna Give You Up",
+            "media_artist": "Rick Astley",
+            "media_album_name": "Whenever You Need Somebody",
+            "source": "Spotify",
+            "source_list": [f"Source {i}" for i in range(20)],
+            "entity_picture": "/api/media_player_proxy/media_player.living_room",
+            "friendly_name": "Living Room",
+            "supported_features": 152511,
+        },
+        "weather.home": {
+            "temperature": 10.5,
+            "humidity": 80,
+            "pressure": 1012.5,
+            "wind_bearing": 220.0,
+            "wind_speed": 15.3,
+            "forecast": forecast,
+            "attribution": "Weather forecast from met.no",
+            "friendly_name": "Home",
+        },
+        "sensor.power": {
+            "state_class": "measurement",
+            "unit_of_measurement": "W",
+            "device_class": "power",
+            "friendly_name": "Power",
+        },
+    }
+
+    start = timer()
+    for i in range(10**5):
+        for entity_id, attributes in entities.items():
+            hass.states.async_set(entity_id, str(i), attributes)
+            state = hass.states.get(entity_id)
+            # What the websocket API serializes for its subscribers
+            state.as_compressed_state_json  # noqa: B018
+            state.as_dict_json  # noqa: B018
+    runtime = timer() - start
+
+    # The memory the cached JSON strings of the states take
+    cached_json = sum(
+        len(value)
+        for state in hass.states.async_all()
+        for value in state._cache.values()  # noqa: SLF001
+        if isinstance(value, bytes)
+    )
+    print(f"Cached JSON of {len(entities)} states: {cached_json} bytes")
+    return runtime
+
+
+async def _condition_benchmark(hass, config, trace=False):
+    """Evaluate a condition a hundred thousand times."""
+    for i in range(10):
+        hass.states.async_set(f"light.kitchen_{i}", "on", {"brightness": 100})
+        hass.states.async_set(f"sensor.temperature_{i}", "21.5")
+    config = await condition.async_validate_condition_config(
+        hass, cv.CONDITION_SCHEMA(config)
+    )
+    check = await condition.async_from_config(hass, config)
+    variables = {"trigger": {"platform": "state"}}
+
+    start = timer()
+    for _ in range(10**5):
+        if trace:
+            # Automations start a new trace for every run
+            trace_clear()
+        check(hass, variables)
+    return timer() - start
+
+
+@benchmark
+async def state_condition(hass):
+    """Evaluate a state condition of 10 entities."""
+    return await _condition_benchmark(
+        hass,
+        {
+            "condition": "state",
+            "entity_id": [f"light.kitchen_{i}" for i in range(10)],
+            "state": "on",
+        },
+    )
+
+
+@benchmark
+async def state_attribute_condition(hass):
+    """Evaluate a state condition on an attribute of 10 entities."""
+    return await _condition_benchmark(
+        hass,
+        {
+            "condition": "state",
+            "entity_id": [f"light.kitchen_{i}" for i in range(10)],
+            "attribute": "brightness",
+            "state": 100,
+        },
+    )
+
+
+@benchmark
+async def numeric_state_condition(hass):
+    """Evaluate a numeric state condition of 10 entities."""
+    return await _condition_benchmark(
+        hass,
+        {
+            "condition": "numeric_state",
+            "entity_id": [f"sensor.temperature_{i}" for i in range(10)],
+            "above": 20,
+            "below": 25,
+        },
+    )
+
+
+@benchmark
+async def template_condition(hass):
+    """Evaluate a template condition."""
+    return await _condition_benchmark(
+        hass,
+        {
+            "condition": "template",
+            "value_template": "{{ states('sensor.temperature_0') | float > 20 }}",
+        },
+    )
+
+
+_NESTED_CONDITION = {
+    "condition": "and",
+    "conditions": [
+        {"condition": "state", "entity_id": "light.kitchen_0", "state": "on"},
+        {
+            "condition": "or",
+            "conditions": [
+                {
+                    "condition": "numeric_state",
+                    "entity_id": "sensor.temperature_0",
+                    "below": 20,
+                },
+                {
+                    "condition": "not",
+                    "conditions": [
+                        {
+                            "condition": "state",
+                            "entity_id": "light.kitchen_1",
+                            "state": "off",
+                        }
+                    ],
+                },
+            ],
+        },
+        {
+            "condition": "state",
+            "entity_id": "light.kitchen_2",
+            "state": "on",
+            "enabled": False,
+        },
+    ],
+}
+
+
+@benchmark
+async def nested_condition(hass):
+    """Evaluate nested and, or and not conditions."""
+    return await _condition_benchmark(hass, _NESTED_CONDITION)
+
+
+@benchmark
+async def nested_condition_traced(hass):
+    """Evaluate nested and, or and not conditions while tracing."""
+    return await _condition_benchmark(hass, _NESTED_CONDITION, trace=True)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 import colorsys
+from functools import lru_cache, wraps
 import math
 from typing import NamedTuple
 
@@ -10,6 +12,29 @@ import attr
 
 from .scaling import scale_to_ranged_value
 
+# Number of results of each color conversion to cache
+CONVERSION_CACHE_SIZE = 256
+
+
+def _cached_conversion[**_P, _R](func: Callable[_P, _R]) -> Callable[_P, _R]:
+    """Cache the results of a color conversion.
+
+    The targets of a light service call or scene are usually converted from
+    the same color, so the conversion only needs to be done once.
+    """
+    cached_func = lru_cache(maxsize=CONVERSION_CACHE_SIZE)(func)
+
+    @wraps(func)
+    def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+        try:
+            hash((args, *kwargs.values()))
+        except TypeError:
+            # Unhashable arguments, like a gamut made of lists
+            return func(*args, **kwargs)
+        return cached_func(*args, **kwargs)  # type: ignore[arg-type]
+
+    return wrapper
+
 
 class RGBColor(NamedTuple):
     """RGB hex values."""
@@ -179,7 +204,7 @@ COLORS = {
 }
 
 
-@attr.s()
+@attr.s(frozen=True)
 class XYPoint:
     """Represents a CIE 1931 XY coordinate pair."""
 
@@ -187,7 +212,7 @@ class XYPoint:
     y: float = attr.ib()
 
 
-@attr.s()
+@attr.s(frozen=True)
 class GamutType:
     """Represents the Gamut of a light."""
 
@@ -218,6 +243,7 @@ def color_RGB_to_xy(
 # Taken from:
 # https://github.com/PhilipsHue/PhilipsHueSDK-iOS-OSX/blob/00187a3/ApplicationDesignNotes/RGB%20to%20xy%20Color%20conversion.md
 # License: Code is given as is. Use at your own risk and discretion.
+@_cached_conversion
 def color_RGB_to_xy_brightness(
     iR: int, iG: int, iB: int, Gamut: GamutType | None = None
 ) -> tuple[float, float, int]:
@@ -267,6 +293,7 @@ def color_xy_to_RGB(
 
 # Converted to Python from Obj-C, original source from:
 # https://github.com/PhilipsHue/PhilipsHueSDK-iOS-OSX/blob/00187a3/ApplicationDesignNotes/RGB%20to%20xy%20Color%20conversion.md
+@_cached_conversion
 def color_xy_brightness_to_RGB(
     vX: float, vY: float, ibrightness: int, Gamut: GamutType | None = None
 ) -> tuple[int, int, int]:
@@ -353,6 +380,7 @@ def color_hsb_to_RGB(fH: float, fS: float, fB: float) -> tuple[int, int, int]:
     return (r, g, b)
 
 
+@_cached_conversion
 def color_RGB_to_hsv(iR: float, iG: float, iB: float) -> tuple[float, float, float]:
     """Convert an rgb color to its hsv representation.
 
@@ -369,6 +397,7 @@ def color_RGB_to_hs(iR: float, iG: float, iB: float) -> tuple[float, float]:
     return color_RGB_to_hsv(iR, iG, iB)[:2]
 
 
+@_cached_conversion
 def color_hsv_to_RGB(iH: float, iS: float, iV: float) -> tuple[int, int, int]:
     """Convert an hsv color into its rgb representation.
 
@@ -435,6 +464,7 @@ def color_rgbw_to_rgb(r: int, g: int, b: int, w: int) -> tuple[int, int, int]:
     return match_max_scale((r, g, b, w), rgb)  # type: ignore[return-value]
 
 
+@_cached_conversion
 def color_rgb_to_rgbww(
     r: int, g: int, b: int, min_kelvin: int, max_kelvin: int
 ) -> tuple[int, int, int, int, int]:
@@ -461,6 +491,7 @@ def color_rgb_to_rgbww(
     return match_max_scale((r, g, b), rgbww)  # type: ignore[return-value]
 
 
+@_cached_conversion
 def color_rgbww_to_rgb(
     r: int, g: int, b: int, cw: int, ww: int, min_kelvin: int, max_kelvin: int
 ) -> tuple[int, int, int]:
@@ -507,6 +538,7 @@ def color_temperature_to_hs(color_temperature_kelvin: float) -> tuple[float, flo
     return color_RGB_to_hs(*color_temperature_to_rgb(color_temperature_kelvin))
 
 
+@_cached_conversion
 def color_temperature_to_rgb(
     color_temperature_kelvin: float,
 ) -> tuple[float, float, float]:
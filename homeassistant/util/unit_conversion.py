@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from functools import lru_cache
 
 from homeassistant.const import (
@@ -131,6 +131,24 @@ class BaseUnitConverter:
         from_ratio, to_ratio = cls._get_from_to_ratio(from_unit, to_unit)
         return lambda val: None if val is None else (val / from_ratio) * to_ratio
 
+    @classmethod
+    @lru_cache
+    def converter_factory_sequence(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> Callable[[Iterable[float | None]], list[float | None]]:
+        """Return a function to convert a sequence of values which allows None.
+
+        Converting the values in one comprehension avoids calling a converter
+        function for every value, which adds up when converting long series
+        like the statistics of a year.
+        """
+        if from_unit == to_unit:
+            return list
+        from_ratio, to_ratio = cls._get_from_to_ratio(from_unit, to_unit)
+        return lambda values: [
+            None if val is None else (val / from_ratio) * to_ratio for val in values
+        ]
+
     @classmethod
     @lru_cache
     def get_unit_ratio(cls, from_unit: str | None, to_unit: str | None) -> float:
@@ -449,6 +467,19 @@ class SpeedConverter(BaseUnitConverter):
         convert = cls._converter_factory(from_unit, to_unit)
         return lambda value: None if value is None else convert(value)
 
+    @classmethod
+    @lru_cache
+    def converter_factory_sequence(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> Callable[[Iterable[float | None]], list[float | None]]:
+        """Return a function to convert a sequence of speeds which allows None."""
+        if from_unit == to_unit:
+            return list
+        convert = cls._converter_factory(from_unit, to_unit)
+        return lambda values: [
+            None if value is None else convert(value) for value in values
+        ]
+
     @classmethod
     def _converter_factory(
         cls, from_unit: str | None, to_unit: str | None
@@ -499,6 +530,44 @@ class TemperatureConverter(BaseUnitConverter):
         UnitOfTemperature.FAHRENHEIT: 1.8,
         UnitOfTemperature.KELVIN: 1.0,
     }
+    # (from_unit, to_unit) -> (offset, divisor, factor, shift) applied as
+    # ((value + offset) / divisor) * factor + shift, the same operations as
+    # the scalar converters below so the results are identical
+    _AFFINE_CONVERSION: dict[
+        tuple[str | None, str | None], tuple[float, float, float, float]
+    ] = {
+        (UnitOfTemperature.CELSIUS, UnitOfTemperature.FAHRENHEIT): (
+            0.0,
+            1.0,
+            1.8,
+            32.0,
+        ),
+        (UnitOfTemperature.CELSIUS, UnitOfTemperature.KELVIN): (0.0, 1.0, 1.0, 273.15),
+        (UnitOfTemperature.FAHRENHEIT, UnitOfTemperature.CELSIUS): (
+            -32.0,
+            1.8,
+            1.0,
+            0.0,
+        ),
+        (UnitOfTemperature.FAHRENHEIT, UnitOfTemperature.KELVIN): (
+            -32.0,
+            1.8,
+            1.0,
+            273.15,
+        ),
+        (UnitOfTemperature.KELVIN, UnitOfTemperature.CELSIUS): (
+            -273.15,
+            1.0,
+            1.0,
+            0.0,
+        ),
+        (UnitOfTemperature.KELVIN, UnitOfTemperature.FAHRENHEIT): (
+            -273.15,
+            1.0,
+            1.8,
+            32.0,
+        ),
+    }
 
     @classmethod
     @lru_cache
@@ -528,6 +597,25 @@ class TemperatureConverter(BaseUnitConverter):
         convert = cls._converter_factory(from_unit, to_unit)
         return lambda value: None if value is None else convert(value)
 
+    @classmethod
+    @lru_cache
+    def converter_factory_sequence(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> Callable[[Iterable[float | None]], list[float | None]]:
+        """Return a function to convert a sequence of temperatures which allows None."""
+        if from_unit == to_unit:
+            return list
+        try:
+            offset, divisor, factor, shift = cls._AFFINE_CONVERSION[from_unit, to_unit]
+        except KeyError:
+            # Raise the same error as the scalar converters
+            cls._converter_factory(from_unit, to_unit)
+            raise
+        return lambda values: [
+            None if val is None else ((val + offset) / divisor) * factor + shift
+            for val in values
+        ]
+
     @classmethod
     def _converter_factory(
         cls, from_unit: str | None, to_unit: str | None
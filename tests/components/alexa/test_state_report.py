@@ -1,20 +1,24 @@
 """Test report state."""
 
+from datetime import timedelta
 import json
 from unittest.mock import AsyncMock, patch
 
 import aiohttp
 import pytest
+from pytest_unordered import unordered
 
 from homeassistant import core
 from homeassistant.components.alexa import errors, state_report
 from homeassistant.components.alexa.resources import AlexaGlobalCatalog
 from homeassistant.const import PERCENTAGE, UnitOfLength, UnitOfTemperature
 from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
 
 from .test_common import TEST_URL, get_default_config
 
-from tests.test_util.aiohttp import AiohttpClientMocker
+from tests.common import async_fire_time_changed
+from tests.test_util.aiohttp import AiohttpClientMocker, AiohttpClientMockResponse
 
 
 async def test_report_state(
@@ -166,6 +170,131 @@ async def test_report_state_retry(
     assert len(aioclient_mock.mock_calls) == 2
 
 
+async def test_report_state_only_changed_properties(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test unchanged properties are reported as context."""
+    aioclient_mock.post(TEST_URL, text="", status=202)
+    attributes = {
+        "friendly_name": "Test Light",
+        "supported_color_modes": ["brightness"],
+        "color_mode": "brightness",
+    }
+    hass.states.async_set("light.test", "off", attributes)
+
+    await state_report.async_enable_proactive_mode(hass, get_default_config(hass))
+
+    hass.states.async_set("light.test", "on", {**attributes, "brightness": 255})
+    await hass.async_block_till_done()
+    assert len(aioclient_mock.mock_calls) == 1
+    changed = aioclient_mock.mock_calls[0][2]["event"]["payload"]["change"]
+    assert {prop["name"] for prop in changed["properties"]} == {
+        "powerState",
+        "brightness",
+        "connectivity",
+    }
+
+    hass.states.async_set("light.test", "on", {**attributes, "brightness": 128})
+    await hass.async_block_till_done()
+    assert len(aioclient_mock.mock_calls) == 2
+    call_json = aioclient_mock.mock_calls[1][2]
+    changed = call_json["event"]["payload"]["change"]
+    assert [(prop["name"], prop["value"]) for prop in changed["properties"]] == [
+        ("brightness", 50)
+    ]
+    assert {prop["name"] for prop in call_json["context"]["properties"]} == {
+        "powerState",
+        "connectivity",
+    }
+
+
+async def test_report_state_rate_limited(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test proactive state reports are retried when rate limited."""
+    aioclient_mock.post(TEST_URL, text="", status=429)
+
+    hass.states.async_set(
+        "binary_sensor.test_contact",
+        "on",
+        {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+    )
+
+    unsub = await state_report.async_enable_proactive_mode(
+        hass, get_default_config(hass)
+    )
+
+    hass.states.async_set(
+        "binary_sensor.test_contact",
+        "off",
+        {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+    )
+    await hass.async_block_till_done()
+    assert len(aioclient_mock.mock_calls) == 1
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.post(TEST_URL, text="", status=202)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert len(aioclient_mock.mock_calls) == 1
+    call_json = aioclient_mock.mock_calls[0][2]
+    assert (
+        call_json["event"]["payload"]["change"]["properties"][0]["value"]
+        == "NOT_DETECTED"
+    )
+    assert unsub is not None
+    unsub()
+
+
+async def test_report_state_retries_undelivered_only(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test only the proactive state reports which were not accepted are retried."""
+    statuses = {"binary_sensor#test_a": 429, "binary_sensor#test_b": 202}
+
+    async def _post(method, url, data):
+        endpoint_id = data["event"]["endpoint"]["endpointId"]
+        return AiohttpClientMockResponse(method, url, status=statuses[endpoint_id])
+
+    aioclient_mock.post(TEST_URL, side_effect=_post)
+    attributes = {"friendly_name": "Test Contact Sensor", "device_class": "door"}
+    hass.states.async_set("binary_sensor.test_a", "on", attributes)
+    hass.states.async_set("binary_sensor.test_b", "on", attributes)
+
+    unsub = await state_report.async_enable_proactive_mode(
+        hass, get_default_config(hass)
+    )
+
+    hass.states.async_set("binary_sensor.test_a", "off", attributes)
+    await hass.async_block_till_done()
+    hass.states.async_set("binary_sensor.test_b", "off", attributes)
+    await hass.async_block_till_done()
+    assert len(aioclient_mock.mock_calls) == 1
+
+    # Both are sent, only the one not accepted is retried
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert [
+        call[2]["event"]["endpoint"]["endpointId"]
+        for call in aioclient_mock.mock_calls[1:]
+    ] == unordered(["binary_sensor#test_a", "binary_sensor#test_b"])
+
+    statuses["binary_sensor#test_a"] = 202
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await hass.async_block_till_done()
+    assert [
+        call[2]["event"]["endpoint"]["endpointId"]
+        for call in aioclient_mock.mock_calls[3:]
+    ] == ["binary_sensor#test_a"]
+
+    # Nothing is left to report
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=600))
+    await hass.async_block_till_done()
+    assert len(aioclient_mock.mock_calls) == 4
+    unsub()
+
+
 async def test_report_state_unsets_authorized_on_error(
     hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
 ) -> None:
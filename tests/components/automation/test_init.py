@@ -40,7 +40,7 @@ from homeassistant.core import (
     callback,
 )
 from homeassistant.exceptions import HomeAssistantError, Unauthorized
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import condition, device_registry as dr
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.script import (
     SCRIPT_MODE_CHOICES,
@@ -319,6 +319,50 @@ async def test_two_conditions_with_and(
     assert len(calls) == 1
 
 
+@pytest.mark.parametrize(
+    ("automation_config", "traced"),
+    [
+        ({}, False),
+        ({"id": "traced"}, True),
+        ({"id": "no_stored_traces", "trace": {"stored_traces": 0}}, False),
+    ],
+)
+async def test_conditions_traced_if_trace_stored(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    calls: list[ServiceCall],
+    automation_config: dict[str, Any],
+    traced: bool,
+) -> None:
+    """Test conditions are only traced if the trace can be looked up."""
+    caplog.set_level(logging.INFO, logger="homeassistant.components.automation")
+    entity_id = "test.entity"
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                **automation_config,
+                "triggers": [{"platform": "event", "event_type": "test_event"}],
+                "conditions": [
+                    {"condition": "state", "entity_id": entity_id, "state": "100"},
+                ],
+                "actions": {"action": "test.automation"},
+            }
+        },
+    )
+
+    hass.states.async_set(entity_id, 100)
+    with patch(
+        "homeassistant.helpers.condition.trace_condition",
+        wraps=condition.trace_condition,
+    ) as mock_trace_condition:
+        hass.bus.async_fire("test_event")
+        await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert mock_trace_condition.called is traced
+
+
 async def test_shorthand_conditions_template(
     hass: HomeAssistant, calls: list[ServiceCall]
 ) -> None:
@@ -132,6 +132,7 @@ async def test_diagnostics(
                     }
                 }
             },
+            "passive_update_processor": {},
             "manager": {
                 "adapters": {
                     "hci0": {
@@ -290,6 +291,7 @@ async def test_diagnostics_macos(
                     "vendor_id": "Unknown",
                 }
             },
+            "passive_update_processor": {},
             "manager": {
                 "adapters": {
                     "Core Bluetooth": {
@@ -483,6 +485,7 @@ async def test_diagnostics_remote_adapter(
                 }
             },
             "dbus": {},
+            "passive_update_processor": {},
             "manager": {
                 "adapters": {
                     "hci0": {
@@ -25,6 +25,7 @@ from homeassistant.components.bluetooth import (
 )
 from homeassistant.components.bluetooth.const import UNAVAILABLE_TRACK_SECONDS
 from homeassistant.components.bluetooth.passive_update_processor import (
+    DEDUP_REFRESH_INTERVAL,
     STORAGE_KEY,
     PassiveBluetoothDataProcessor,
     PassiveBluetoothDataUpdate,
@@ -273,6 +274,154 @@ async def test_basic_usage(hass: HomeAssistant) -> None:
     cancel_coordinator()
 
 
+@pytest.mark.usefixtures("mock_bleak_scanner_start", "mock_bluetooth_adapters")
+@pytest.mark.parametrize("deduplicate", [True, False])
+async def test_unchanged_advertisements_are_skipped(
+    hass: HomeAssistant, deduplicate: bool
+) -> None:
+    """Test unchanged advertisements only refresh the processors periodically."""
+    await async_setup_component(hass, DOMAIN, {DOMAIN: {}})
+    update_calls: list[BluetoothServiceInfo] = []
+
+    @callback
+    def _mock_update_method(
+        service_info: BluetoothServiceInfo,
+    ) -> dict[str, str]:
+        update_calls.append(service_info)
+        return {"test": "data"}
+
+    coordinator = PassiveBluetoothProcessorCoordinator(
+        hass,
+        _LOGGER,
+        "aa:bb:cc:dd:ee:ff",
+        BluetoothScanningMode.ACTIVE,
+        _mock_update_method,
+        deduplicate=deduplicate,
+    )
+    saved_callback = None
+
+    def _async_register_callback(_hass, _callback, _matcher, _mode):
+        nonlocal saved_callback
+        saved_callback = _callback
+        return lambda: None
+
+    processor = PassiveBluetoothDataProcessor(
+        lambda data: GENERIC_PASSIVE_BLUETOOTH_DATA_UPDATE
+    )
+    with patch(
+        "homeassistant.components.bluetooth.update_coordinator.async_register_callback",
+        _async_register_callback,
+    ):
+        unregister_processor = coordinator.async_register_processor(processor)
+        cancel_coordinator = coordinator.async_start()
+
+    all_events = []
+    cancel_listener = processor.async_add_listener(all_events.append)
+    now = time.monotonic()
+
+    with patch(
+        "homeassistant.components.bluetooth.passive_update_processor.monotonic_time_coarse",
+        return_value=now,
+    ):
+        saved_callback(GENERIC_BLUETOOTH_SERVICE_INFO, BluetoothChange.ADVERTISEMENT)
+        saved_callback(GENERIC_BLUETOOTH_SERVICE_INFO, BluetoothChange.ADVERTISEMENT)
+
+    expected = 1 if deduplicate else 2
+    assert len(update_calls) == expected
+    assert len(all_events) == expected
+    assert coordinator.async_diagnostics() == {
+        "processed_advertisements": expected,
+        "skipped_advertisements": 2 - expected,
+    }
+
+    # A changed payload is always processed
+    with patch(
+        "homeassistant.components.bluetooth.passive_update_processor.monotonic_time_coarse",
+        return_value=now + 1,
+    ):
+        saved_callback(GENERIC_BLUETOOTH_SERVICE_INFO_2, BluetoothChange.ADVERTISEMENT)
+    assert len(update_calls) == expected + 1
+
+    # An unchanged payload is processed again once the refresh interval passed
+    with patch(
+        "homeassistant.components.bluetooth.passive_update_processor.monotonic_time_coarse",
+        return_value=now + 1 + DEDUP_REFRESH_INTERVAL,
+    ):
+        saved_callback(GENERIC_BLUETOOTH_SERVICE_INFO_2, BluetoothChange.ADVERTISEMENT)
+    assert len(update_calls) == expected + 2
+    assert processor.available is True
+
+    # A newly registered processor gets the next unchanged payload
+    second_processor = PassiveBluetoothDataProcessor(
+        lambda data: GENERIC_PASSIVE_BLUETOOTH_DATA_UPDATE
+    )
+    unregister_second_processor = coordinator.async_register_processor(second_processor)
+    second_events = []
+    cancel_second_listener = second_processor.async_add_listener(second_events.append)
+    with patch(
+        "homeassistant.components.bluetooth.passive_update_processor.monotonic_time_coarse",
+        return_value=now + 2 + DEDUP_REFRESH_INTERVAL,
+    ):
+        saved_callback(GENERIC_BLUETOOTH_SERVICE_INFO_2, BluetoothChange.ADVERTISEMENT)
+    assert len(update_calls) == expected + 3
+    assert len(second_events) == 1
+
+    cancel_second_listener()
+    unregister_second_processor()
+    cancel_listener()
+    unregister_processor()
+    cancel_coordinator()
+
+
+@pytest.mark.usefixtures("mock_bleak_scanner_start", "mock_bluetooth_adapters")
+async def test_deduplication_is_opt_in(hass: HomeAssistant) -> None:
+    """Test unchanged advertisements are processed unless deduplication is enabled."""
+    await async_setup_component(hass, DOMAIN, {DOMAIN: {}})
+    update_calls: list[BluetoothServiceInfo] = []
+
+    @callback
+    def _mock_update_method(
+        service_info: BluetoothServiceInfo,
+    ) -> dict[str, str]:
+        update_calls.append(service_info)
+        return {"test": "data"}
+
+    coordinator = PassiveBluetoothProcessorCoordinator(
+        hass,
+        _LOGGER,
+        "aa:bb:cc:dd:ee:ff",
+        BluetoothScanningMode.ACTIVE,
+        _mock_update_method,
+    )
+    saved_callback = None
+
+    def _async_register_callback(_hass, _callback, _matcher, _mode):
+        nonlocal saved_callback
+        saved_callback = _callback
+        return lambda: None
+
+    processor = PassiveBluetoothDataProcessor(
+        lambda data: GENERIC_PASSIVE_BLUETOOTH_DATA_UPDATE
+    )
+    with patch(
+        "homeassistant.components.bluetooth.update_coordinator.async_register_callback",
+        _async_register_callback,
+    ):
+        unregister_processor = coordinator.async_register_processor(processor)
+        cancel_coordinator = coordinator.async_start()
+
+    saved_callback(GENERIC_BLUETOOTH_SERVICE_INFO, BluetoothChange.ADVERTISEMENT)
+    saved_callback(GENERIC_BLUETOOTH_SERVICE_INFO, BluetoothChange.ADVERTISEMENT)
+    assert len(update_calls) == 2
+    assert coordinator.async_diagnostics() == {
+        "processed_advertisements": 2,
+        "skipped_advertisements": 0,
+    }
+
+    unregister_processor()
+    cancel_coordinator()
+
+
 @pytest.mark.usefixtures("mock_bleak_scanner_start", "mock_bluetooth_adapters")
 async def test_entity_key_is_dispatched_on_entity_key_change(
     hass: HomeAssistant,
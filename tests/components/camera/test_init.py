@@ -1,7 +1,10 @@
 """The tests for the camera component."""
 
+import asyncio
+import gc
 from http import HTTPStatus
 import io
+import time
 from types import ModuleType
 from unittest.mock import ANY, AsyncMock, Mock, PropertyMock, mock_open, patch
 
@@ -21,6 +24,7 @@ from homeassistant.components.camera.const import (
     DOMAIN,
     PREF_ORIENTATION,
     PREF_PRELOAD_STREAM,
+    PREF_SNAPSHOT_MAX_AGE,
     StreamType,
 )
 from homeassistant.components.camera.helper import get_camera_from_entity_id
@@ -205,6 +209,126 @@ async def test_get_image_fails(hass: HomeAssistant) -> None:
         await camera.async_get_image(hass, "camera.demo_camera")
 
 
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_coalesces_concurrent_requests(hass: HomeAssistant) -> None:
+    """Test concurrent requests for the same size share a single fetch."""
+    fetched = asyncio.Event()
+
+    async def _camera_image(*args, **kwargs) -> bytes:
+        await fetched.wait()
+        return b"Test"
+
+    cam = get_camera_from_entity_id(hass, "camera.demo_camera")
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=_camera_image,
+    ) as mock_camera:
+        tasks = [
+            hass.async_create_task(camera.async_get_image(hass, "camera.demo_camera"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        fetched.set()
+        images = await asyncio.gather(*tasks)
+
+    assert mock_camera.call_count == 1
+    assert [image.content for image in images] == [b"Test"] * 3
+    assert cam.snapshot_cache.as_dict() == {
+        "hits": 0,
+        "misses": 1,
+        "coalesced": 2,
+        "cached_sizes": 0,
+        "last_fetch_time": ANY,
+        "average_fetch_time": ANY,
+    }
+
+
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_failed_fetch_without_requests(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the error of a fetch is retrieved when all its requests were cancelled."""
+    fetch_started = asyncio.Event()
+    fail = asyncio.Event()
+
+    async def _camera_image(*args, **kwargs) -> bytes:
+        fetch_started.set()
+        await fail.wait()
+        raise HomeAssistantError("Camera is offline")
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=_camera_image,
+    ):
+        request = hass.async_create_task(
+            camera.async_get_image(hass, "camera.demo_camera")
+        )
+        await fetch_started.wait()
+        request.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await request
+        fail.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    del request
+    gc.collect()
+    assert "Task exception was never retrieved" not in caplog.text
+
+
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_snapshot_max_age(hass: HomeAssistant) -> None:
+    """Test images are reused for the snapshot max age of the camera."""
+    with (
+        patch(
+            "homeassistant.components.demo.camera.DemoCamera.snapshot_max_age",
+            new_callable=PropertyMock(return_value=10),
+        ),
+        patch(
+            "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+            return_value=b"Test",
+        ) as mock_camera,
+    ):
+        for _ in range(2):
+            image = await camera.async_get_image(hass, "camera.demo_camera")
+            assert image.content == b"Test"
+        assert mock_camera.call_count == 1
+
+        # Every size is cached separately
+        await camera.async_get_image(hass, "camera.demo_camera", width=640, height=480)
+        assert mock_camera.call_count == 2
+
+        with patch(
+            "homeassistant.components.camera.snapshot.time.monotonic",
+            return_value=time.monotonic() + 11,
+        ):
+            await camera.async_get_image(hass, "camera.demo_camera")
+        assert mock_camera.call_count == 3
+
+
+@pytest.mark.usefixtures("mock_camera_with_device", "mock_camera")
+async def test_get_image_snapshot_max_age_option(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test the snapshot max age can be set with an entity option."""
+    entity_id = "camera.test_camera_device_demo_camera"
+    assert entity_registry.async_get(entity_id)
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=b"Test",
+    ) as mock_camera:
+        for _ in range(2):
+            await camera.async_get_image(hass, entity_id)
+        assert mock_camera.call_count == 2
+
+        entity_registry.async_update_entity_options(
+            entity_id, DOMAIN, {PREF_SNAPSHOT_MAX_AGE: 10}
+        )
+        await hass.async_block_till_done()
+        for _ in range(2):
+            await camera.async_get_image(hass, entity_id)
+        assert mock_camera.call_count == 3
+
+
 @pytest.mark.usefixtures("mock_camera")
 @pytest.mark.parametrize(
     ("filename_template", "expected_filename", "expected_issues"),
@@ -2907,10 +2907,16 @@ async def test_intent_cache_all_entities(hass: HomeAssistant) -> None:
     assert result is not None
     assert getattr(result, mark, None) is True
 
-    # Adding a new entity clears the cache
+    # Adding an entity with a name which is not in the text keeps the cache
     hass.states.async_set("light.new_light", "off")
     result = await agent.async_recognize_intent(user_input)
     assert result is not None
+    assert getattr(result, mark, None) is True
+
+    # Adding an entity with a name in the text clears the cached result
+    hass.states.async_set("switch.test", "off")
+    result = await agent.async_recognize_intent(user_input)
+    assert result is not None
     assert getattr(result, mark, None) is None
 
 
@@ -2943,6 +2949,113 @@ async def test_intent_cache_fuzzy(hass: HomeAssistant) -> None:
     assert getattr(result, mark, None) is True
 
 
+@pytest.mark.usefixtures("init_components")
+async def test_intents_compiled_on_load(hass: HomeAssistant) -> None:
+    """Test that sentence templates are compiled when the intents are loaded."""
+    agent = hass.data[DATA_DEFAULT_ENTITY]
+    assert isinstance(agent, default_agent.DefaultAgent)
+
+    lang_intents = await agent.async_get_or_load_intents(hass.config.language)
+    assert lang_intents is not None
+    sentences = [
+        sentence
+        for intent in lang_intents.intents.intents.values()
+        for intent_data in intent.data
+        for sentence in intent_data.sentences
+    ]
+    assert sentences
+    assert all(sentence.pattern is not None for sentence in sentences)
+
+
+@pytest.mark.usefixtures("init_components")
+async def test_slot_lists_patched(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test that slot lists are patched instead of rebuilt on entity changes."""
+    agent = hass.data[DATA_DEFAULT_ENTITY]
+    assert isinstance(agent, default_agent.DefaultAgent)
+
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.bedroom", "off")
+    expose_entity(hass, "light.kitchen", True)
+    expose_entity(hass, "light.bedroom", True)
+    await hass.async_block_till_done()
+
+    async def _recognize(text: str) -> RecognizeResult | None:
+        return await agent.async_recognize_intent(
+            ConversationInput(
+                text=text,
+                context=Context(),
+                conversation_id=None,
+                device_id=None,
+                language=hass.config.language,
+                agent_id=None,
+            ),
+            strict_intents_only=True,
+        )
+
+    result = await _recognize("turn on kitchen")
+    assert result is not None
+    assert result.entities["name"].text == "kitchen"
+    result = await _recognize("turn on bedroom")
+    assert result is not None
+    slot_lists = agent._slot_lists
+    bedroom_result = result
+
+    # Unexposing an entity moves its name out of the exposed names
+    expose_entity(hass, "light.kitchen", False)
+    await hass.async_block_till_done()
+    assert agent._slot_lists is slot_lists
+    assert await _recognize("turn on kitchen") is None
+    assert all(
+        value.value_out != "kitchen" for value in agent._slot_lists["name"].values
+    )
+    # Results for other names are still cached
+    assert await _recognize("turn on bedroom") is bedroom_result
+
+    # Renaming an entity replaces its names
+    hass.states.async_remove("light.bedroom")
+    hass.states.async_set(
+        "light.bedroom", "off", attributes={ATTR_FRIENDLY_NAME: "guest room"}
+    )
+    await hass.async_block_till_done()
+    assert agent._slot_lists is slot_lists
+    assert await _recognize("turn on bedroom") is None
+    result = await _recognize("turn on guest room")
+    assert result is not None
+    assert result.entities["name"].text == "guest room"
+
+    expose_entity(hass, "light.kitchen", True)
+    await hass.async_block_till_done()
+    result = await _recognize("turn on kitchen")
+    assert result is not None
+    assert result.entities["name"].text == "kitchen"
+
+    # Renaming an entity added after the slot lists were built. The registry
+    # update is seen before the entity writes its state with the new name.
+    entity = MockLight("added light", STATE_ON)
+    entity._attr_unique_id = "1234"
+    entity.entity_id = "light.added"
+    setup_test_component_platform(hass, LIGHT_DOMAIN, [entity])
+    assert await async_setup_component(
+        hass, LIGHT_DOMAIN, {LIGHT_DOMAIN: [{"platform": "test"}]}
+    )
+    await hass.async_block_till_done()
+    expose_entity(hass, "light.added", True)
+    await hass.async_block_till_done()
+    result = await _recognize("turn on added light")
+    assert result is not None
+    assert result.entities["name"].text == "added light"
+
+    entity_registry.async_update_entity("light.added", name="renamed light")
+    await hass.async_block_till_done()
+    assert agent._slot_lists is slot_lists
+    assert await _recognize("turn on added light") is None
+    result = await _recognize("turn on renamed light")
+    assert result is not None
+    assert result.entities["name"].text == "renamed light"
+
+
 @pytest.mark.usefixtures("init_components")
 async def test_entities_filtered_by_input(hass: HomeAssistant) -> None:
     """Test that entities are filtered by the input text before intent matching."""
@@ -1,13 +1,23 @@
 """Test the Energy websocket API."""
 
+from datetime import timedelta
 from typing import Any
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from homeassistant.components.energy import data, is_configured
-from homeassistant.components.recorder import Recorder
-from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.components.energy.aggregation import async_get_aggregator
+from homeassistant.components.recorder import (
+    EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
+    Recorder,
+)
+from homeassistant.components.recorder.db_schema import Statistics
+from homeassistant.components.recorder.models import StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    import_statistics,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
@@ -1159,3 +1169,162 @@ async def test_fossil_energy_consumption_check_missing_hour(
         hour3.isoformat(),
         hour4.isoformat(),
     ]
+
+
+async def test_aggregated_statistics(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test the changes are aggregated per period and updated incrementally."""
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+
+    manager = await data.async_get_manager(hass)
+    await manager.async_update(
+        {
+            "energy_sources": [
+                {
+                    "type": "solar",
+                    "stat_energy_from": statistic_id,
+                    "config_entry_solar_forecast": None,
+                }
+                for statistic_id in ("test:solar_production", "test:solar_roof")
+            ]
+        }
+    )
+
+    def metadata(statistic_id: str) -> StatisticMetaData:
+        return {
+            "has_mean": False,
+            "has_sum": True,
+            "name": None,
+            "source": "test",
+            "statistic_id": statistic_id,
+            "unit_of_measurement": "kWh",
+        }
+
+    today = dt_util.start_of_local_day()
+    hours = [
+        today - timedelta(days=40, hours=-10),
+        today - timedelta(days=12, hours=-10),
+        today - timedelta(days=2, hours=-10),
+        today - timedelta(days=2, hours=-11),
+        today - timedelta(days=1, hours=-12),
+        today,
+        today + timedelta(hours=1),
+    ]
+    async_add_external_statistics(
+        hass,
+        metadata("test:solar_production"),
+        [
+            {"start": hour, "state": 0, "sum": index * 2}
+            for index, hour in enumerate(hours)
+        ],
+    )
+    # The second source lags behind the first one
+    async_add_external_statistics(
+        hass,
+        metadata("test:solar_roof"),
+        [
+            {"start": today - timedelta(hours=1), "state": 0, "sum": 1},
+            {"start": today, "state": 0, "sum": 2},
+        ],
+    )
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    start_time = (today - timedelta(days=35)).isoformat()
+    end_time = (today + timedelta(days=1)).isoformat()
+
+    async def get_changes(period: str) -> dict[str, Any]:
+        await client.send_json_auto_id(
+            {
+                "type": "energy/aggregated_statistics",
+                "start_time": start_time,
+                "end_time": end_time,
+                "period": period,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        return response["result"]
+
+    async def get_recorder_changes(period: str) -> dict[str, Any]:
+        await client.send_json_auto_id(
+            {
+                "type": "recorder/statistics_during_period",
+                "start_time": start_time,
+                "end_time": end_time,
+                "statistic_ids": ["test:solar_production", "test:solar_roof"],
+                "period": period,
+                "types": ["change"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        return response["result"]
+
+    async def assert_changes() -> None:
+        for period in ("hour", "day", "week", "month"):
+            assert await get_changes(period) == await get_recorder_changes(period)
+
+    await assert_changes()
+
+    aggregator = await async_get_aggregator(hass)
+    queries = aggregator.queries
+
+    # Compiling new hours adds them without querying the history again,
+    # the hours of the first source since the last hour of the lagging
+    # source are fetched again and must not be counted twice
+    def compile_hours() -> None:
+        import_statistics(
+            recorder_mock,
+            metadata("test:solar_production"),
+            [{"start": today + timedelta(hours=2), "state": 0, "sum": 22}],
+            Statistics,
+        )
+        import_statistics(
+            recorder_mock,
+            metadata("test:solar_roof"),
+            [{"start": today + timedelta(hours=1), "state": 0, "sum": 5}],
+            Statistics,
+        )
+
+    await recorder_mock.async_add_executor_job(compile_hours)
+    hass.bus.async_fire(EVENT_RECORDER_HOURLY_STATISTICS_GENERATED)
+    await hass.async_block_till_done()
+    assert aggregator.queries == queries + 1
+
+    for period in ("day", "week", "month"):
+        assert await get_changes(period) == await get_recorder_changes(period)
+    assert aggregator.queries == queries + 1
+
+    hourly = await get_changes("hour")
+    assert hourly == await get_recorder_changes("hour")
+    assert hourly["test:solar_production"][-1]["change"] == 10
+    assert hourly["test:solar_roof"][-1]["change"] == 3
+    queries = aggregator.queries
+
+    # Importing statistics into the past drops the totals
+    async_add_external_statistics(
+        hass,
+        metadata("test:solar_production"),
+        [{"start": today - timedelta(days=2, hours=-11), "state": 0, "sum": 5}],
+    )
+    await async_wait_recording_done(hass)
+    await hass.async_block_till_done()
+    await assert_changes()
+    assert aggregator.queries > queries
+
+    await client.send_json_auto_id(
+        {
+            "type": "energy/aggregated_statistics",
+            "start_time": "invalid",
+            "end_time": end_time,
+            "period": "day",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
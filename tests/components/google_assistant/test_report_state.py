@@ -29,7 +29,7 @@ async def test_report_state(
 
     with (
         patch.object(
-            BASIC_CONFIG, "async_report_state_all", AsyncMock()
+            BASIC_CONFIG, "async_report_state_all", AsyncMock(return_value=[])
         ) as mock_report,
         patch.object(report_state, "INITIAL_REPORT_DELAY", 0),
     ):
@@ -51,7 +51,7 @@ async def test_report_state(
     }
 
     with patch.object(
-        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+        BASIC_CONFIG, "async_report_state_all", AsyncMock(return_value=[])
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
         await hass.async_block_till_done()
@@ -83,7 +83,7 @@ async def test_report_state(
             return_value={"same": "info"},
         ),
         patch.object(
-            BASIC_CONFIG, "async_report_state_all", AsyncMock()
+            BASIC_CONFIG, "async_report_state_all", AsyncMock(return_value=[])
         ) as mock_report,
     ):
         # New state, so reported
@@ -104,7 +104,7 @@ async def test_report_state(
 
     # Test that only significant state changes are reported
     with patch.object(
-        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+        BASIC_CONFIG, "async_report_state_all", AsyncMock(return_value=[])
     ) as mock_report:
         hass.states.async_set("switch.ac", "on", {"something": "else"})
         async_fire_time_changed(
@@ -117,7 +117,7 @@ async def test_report_state(
     # Test that entities that we can't query don't report a state
     with (
         patch.object(
-            BASIC_CONFIG, "async_report_state_all", AsyncMock()
+            BASIC_CONFIG, "async_report_state_all", AsyncMock(return_value=[])
         ) as mock_report,
         patch(
             "homeassistant.components.google_assistant.helpers.GoogleEntity.query_serialize",
@@ -136,7 +136,7 @@ async def test_report_state(
     unsub()
 
     with patch.object(
-        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+        BASIC_CONFIG, "async_report_state_all", AsyncMock(return_value=[])
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
         async_fire_time_changed(
@@ -160,7 +160,9 @@ async def test_report_notifications(
     )
 
     with (
-        patch.object(config, "async_report_state_all", AsyncMock()) as mock_report,
+        patch.object(
+            config, "async_report_state_all", AsyncMock(return_value=[])
+        ) as mock_report,
         patch.object(report_state, "INITIAL_REPORT_DELAY", 0),
     ):
         report_state.async_enable_report_state(hass, config)
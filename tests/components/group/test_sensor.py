@@ -34,7 +34,7 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, StateMachine
 from homeassistant.helpers import issue_registry as ir
 import homeassistant.helpers.entity_registry as er
 from homeassistant.setup import async_setup_component
@@ -1007,3 +1007,44 @@ async def test_sensor_different_attributes_ignore_non_numeric(
             state.attributes.get("unit_of_measurement")
             == test_case["expected_unit_of_measurement"]
         )
+
+
+async def test_sensor_incremental_update(hass: HomeAssistant) -> None:
+    """Test only the changed members are processed on updates."""
+    config = {
+        SENSOR_DOMAIN: {
+            "platform": GROUP_DOMAIN,
+            "name": "test_sum",
+            "type": "sum",
+            "ignore_non_numeric": True,
+            "entities": ["sensor.test_1", "sensor.test_2", "sensor.test_3"],
+        }
+    }
+    entity_ids = config["sensor"]["entities"]
+    for entity_id, value in zip(entity_ids, VALUES, strict=False):
+        hass.states.async_set(entity_id, value, {})
+    assert await async_setup_component(hass, "sensor", config)
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.test_sum").state == str(float(SUM_VALUE))
+
+    with patch.object(
+        StateMachine, "get", autospec=True, side_effect=StateMachine.get
+    ) as mock_get:
+        hass.states.async_set(entity_ids[0], 10, {})
+        await hass.async_block_till_done()
+    assert [
+        call[0][1] for call in mock_get.call_args_list if call[0][1] in entity_ids
+    ] == [entity_ids[0]]
+    assert hass.states.get("sensor.test_sum").state == str(float(SUM_VALUE - 7))
+
+    hass.states.async_remove(entity_ids[1])
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.test_sum").state == "25.3"
+
+    hass.states.async_set(entity_ids[1], "string", {})
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.test_sum").state == "25.3"
+
+    hass.states.async_set(entity_ids[1], 5, {})
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.test_sum").state == "30.3"
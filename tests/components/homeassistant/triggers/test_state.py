@@ -1,6 +1,7 @@
 """The test for state automation."""
 
 from datetime import timedelta
+from typing import Any
 from unittest.mock import patch
 
 from freezegun.api import FrozenDateTimeFactory
@@ -1771,3 +1772,77 @@ async def test_variables_priority(
     await hass.async_block_till_done()
     assert len(service_calls) == 2
     assert service_calls[1].data["some"] == "test.entity_2 - 0:00:10"
+
+
+async def test_triggers_share_entity_index(hass: HomeAssistant) -> None:
+    """Test state triggers for the same entity share a single decision table."""
+    calls: list[str] = []
+    unsubs = []
+    for to_state in ("on", "off", None):
+        config = await state_trigger.async_validate_trigger_config(
+            hass,
+            {"platform": "state", "entity_id": "test.entity", "to": to_state},
+        )
+        unsubs.append(
+            await state_trigger.async_attach_trigger(
+                hass,
+                config,
+                lambda run_variables, context=None, to_state=to_state: calls.append(
+                    to_state
+                ),
+                {"trigger_data": {}, "variables": None, "name": "test"},
+            )
+        )
+
+    index = hass.data[state_trigger.DATA_STATE_TRIGGER_INDEX]
+    assert list(index._entities) == ["test.entity"]
+    entry = index._entities["test.entity"]
+    assert set(entry.by_to) == {"on", "off"}
+    assert len(entry.other) == 1
+
+    hass.states.async_set("test.entity", "on")
+    await hass.async_block_till_done()
+    assert calls == ["on", None]
+
+    hass.states.async_set("test.entity", "off")
+    await hass.async_block_till_done()
+    assert calls == ["on", None, "off", None]
+
+    for unsub in unsubs:
+        unsub()
+    assert not index._entities
+
+    hass.states.async_set("test.entity", "on")
+    await hass.async_block_till_done()
+    assert calls == ["on", None, "off", None]
+
+
+@pytest.mark.parametrize(
+    ("config", "fires"),
+    [
+        # wait_for_trigger does not always validate the trigger configuration
+        ({"entity_id": "TEST.Entity"}, True),
+        ({"entity_id": "test.entity", "to": "*"}, True),
+        ({"entity_id": "test.entity", "to": ["world"]}, True),
+        ({"entity_id": "test.entity", "to": 5}, False),
+    ],
+)
+async def test_unvalidated_config(
+    hass: HomeAssistant, config: dict[str, Any], fires: bool
+) -> None:
+    """Test state triggers attached with an unvalidated configuration."""
+    calls: list[None] = []
+    unsub = await state_trigger.async_attach_trigger(
+        hass,
+        {"platform": "state", **config},
+        lambda run_variables, context=None: calls.append(None),
+        {"trigger_data": {}, "variables": None, "name": "test"},
+    )
+
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+    assert len(calls) == (1 if fires else 0)
+
+    hass.states.async_set("test.entity", "5")
+    await hass.async_block_till_done()
+    unsub()
@@ -141,6 +141,7 @@ async def test_config_entry_running(
             "version": 1,
         },
         "config_version": 2,
+        "notifications": {"accessories": {}, "coalesced": 0, "sent": 0},
         "pairing_id": ANY,
         "status": 1,
     }
@@ -290,6 +291,13 @@ async def test_config_entry_accessory(
             "version": 1,
         },
         "config_version": 2,
+        "notifications": {
+            "accessories": {
+                "1": {"coalesced": 0, "interval": 1.0, "pending": 0, "sent": 1}
+            },
+            "coalesced": 0,
+            "sent": 1,
+        },
         "pairing_id": ANY,
         "iid_storage": {
             "1": {
@@ -623,6 +631,7 @@ async def test_config_entry_with_trigger_accessory(
             "version": 1,
         },
         "config_version": 2,
+        "notifications": {"accessories": {}, "coalesced": 0, "sent": 0},
         "pairing_id": ANY,
         "status": 1,
     }
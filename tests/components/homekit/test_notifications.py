@@ -0,0 +1,98 @@
+"""Test the HomeKit notification pipeline."""
+
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+from pyhap.const import HAP_REPR_IID, HAP_REPR_VALUE
+
+from homeassistant.components.homekit.const import CONF_NOTIFY_INTERVAL
+from homeassistant.components.homekit.notifications import is_continuous
+from homeassistant.components.homekit.type_lights import Light
+from homeassistant.components.light import (
+    ATTR_BRIGHTNESS,
+    ATTR_SUPPORTED_COLOR_MODES,
+    ColorMode,
+)
+from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from tests.common import async_fire_time_changed
+
+ATTRS = {ATTR_SUPPORTED_COLOR_MODES: [ColorMode.BRIGHTNESS]}
+
+
+async def _async_setup_light(
+    hass: HomeAssistant, hk_driver, config: dict | None
+) -> Light:
+    """Set up a dimmable light accessory and flush its initial notifications."""
+    hass.states.async_set("light.demo", STATE_ON, {**ATTRS, ATTR_BRIGHTNESS: 255})
+    await hass.async_block_till_done()
+    acc = Light(hass, hk_driver, "Light", "light.demo", 1, config)
+    hk_driver.add_accessory(acc)
+    hk_driver.publish = MagicMock()
+    acc.run()
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await hass.async_block_till_done()
+    hk_driver.publish.reset_mock()
+    return acc
+
+
+def _published(hk_driver, iid: int) -> list:
+    """Return the values published for a characteristic."""
+    return [
+        call.args[0][HAP_REPR_VALUE]
+        for call in hk_driver.publish.mock_calls
+        if call.args[0][HAP_REPR_IID] == iid
+    ]
+
+
+async def test_continuous_changes_are_coalesced(hass: HomeAssistant, hk_driver) -> None:
+    """Test intermediate brightness values are dropped within the interval."""
+    acc = await _async_setup_light(hass, hk_driver, {CONF_NOTIFY_INTERVAL: 1.0})
+    char_on_iid = acc.char_on.to_HAP()[HAP_REPR_IID]
+    char_brightness_iid = acc.char_brightness.to_HAP()[HAP_REPR_IID]
+    assert is_continuous(acc.char_brightness)
+    assert not is_continuous(acc.char_on)
+    before = hk_driver.notifications.async_diagnostics()["accessories"][acc.aid]
+
+    for brightness in (102, 153, 204):
+        hass.states.async_set(
+            "light.demo", STATE_ON, {**ATTRS, ATTR_BRIGHTNESS: brightness}
+        )
+        await hass.async_block_till_done()
+    # The first change is sent right away, the others wait for the interval
+    assert acc.char_brightness.value == 80
+    assert _published(hk_driver, char_brightness_iid) == [40]
+
+    # Discrete characteristics are never delayed
+    hass.states.async_set("light.demo", STATE_OFF, ATTRS)
+    await hass.async_block_till_done()
+    assert _published(hk_driver, char_on_iid) == [False]
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert _published(hk_driver, char_brightness_iid) == [40, 80]
+
+    diagnostics = hk_driver.notifications.async_diagnostics()["accessories"][acc.aid]
+    assert diagnostics["coalesced"] == before["coalesced"] + 1
+    assert diagnostics["sent"] == before["sent"] + 3
+    assert diagnostics["pending"] == 0
+
+    acc.async_stop()
+    assert acc.aid not in hk_driver.notifications.async_diagnostics()["accessories"]
+
+
+async def test_no_interval(hass: HomeAssistant, hk_driver) -> None:
+    """Test every change is sent when the interval is disabled."""
+    acc = await _async_setup_light(hass, hk_driver, {CONF_NOTIFY_INTERVAL: 0})
+    char_brightness_iid = acc.char_brightness.to_HAP()[HAP_REPR_IID]
+
+    for brightness in (102, 153, 204):
+        hass.states.async_set(
+            "light.demo", STATE_ON, {**ATTRS, ATTR_BRIGHTNESS: brightness}
+        )
+        await hass.async_block_till_done()
+    assert _published(hk_driver, char_brightness_iid) == [40, 60, 80]
+    acc.async_stop()
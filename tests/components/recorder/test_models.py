@@ -91,6 +91,26 @@ def test_from_event_to_db_state_attributes() -> None:
     assert db_attrs.to_native() == attrs
 
 
+def test_from_event_to_db_state_attributes_reuses_state_json() -> None:
+    """Test the JSON string of the state is reused if no attribute is excluded."""
+    state = ha.State("sensor.temperature", "18", {"this_attr": True})
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+        context=state.context,
+    )
+    dialect = SupportedDialect.MYSQL
+    shared_attrs = StateAttributes.shared_attrs_bytes_from_event(event, dialect)
+    assert shared_attrs is state.attributes_json
+
+    state = ha.State(
+        "sensor.temperature", "18", {"this_attr": True, "supported_features": 1}
+    )
+    event.data["new_state"] = state
+    shared_attrs = StateAttributes.shared_attrs_bytes_from_event(event, dialect)
+    assert shared_attrs == b'{"this_attr":true}'
+
+
 def test_from_event_to_db_state_attributes_with_null() -> None:
     """Test converting a state to StateAttributes with a null with PostgreSQL."""
     attrs = {"this_attr": "withnull\0terminator"}
@@ -0,0 +1,253 @@
+"""Test the recorder table partitioning helpers."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm.session import Session
+import voluptuous as vol
+
+from homeassistant.components.recorder import CONFIG_SCHEMA, DOMAIN, Recorder
+from homeassistant.components.recorder.const import SupportedDialect
+from homeassistant.components.recorder.db_schema import (
+    TABLE_EVENTS,
+    TABLE_STATES,
+    TABLE_STATISTICS_SHORT_TERM,
+)
+from homeassistant.components.recorder.migration import migrate_to_partitioned_tables
+from homeassistant.components.recorder.partition import (
+    PARTITIONED_TABLES,
+    PARTITIONS_AHEAD,
+    PartitionInterval,
+    create_partitions,
+    drop_partitions_before,
+    get_partitioned_tables,
+    get_partitions,
+    parse_partition_bound,
+    partition_name,
+    partition_start,
+    partitioning_supported,
+)
+from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+@pytest.mark.parametrize(
+    ("interval", "when", "expected"),
+    [
+        (
+            PartitionInterval.DAY,
+            datetime(2024, 5, 8, 13, 45, tzinfo=UTC),
+            datetime(2024, 5, 8, tzinfo=UTC),
+        ),
+        (
+            PartitionInterval.WEEK,
+            datetime(2024, 5, 8, 13, 45, tzinfo=UTC),
+            datetime(2024, 5, 6, tzinfo=UTC),
+        ),
+    ],
+)
+def test_partition_start(
+    interval: PartitionInterval, when: datetime, expected: datetime
+) -> None:
+    """Test the start of the partition containing a point in time."""
+    assert partition_start(interval, when) == expected
+
+
+def test_partition_name() -> None:
+    """Test partition names."""
+    assert (
+        partition_name(TABLE_STATES, datetime(2024, 5, 6, tzinfo=UTC))
+        == "states_p20240506"
+    )
+
+
+@pytest.mark.parametrize(
+    ("bound", "expected"),
+    [
+        ("FOR VALUES FROM ('1714953600') TO ('1715040000')", (1714953600, 1715040000)),
+        ("FOR VALUES FROM (MINVALUE) TO ('1714953600')", (None, 1714953600)),
+        ("FOR VALUES FROM ('1714953600') TO (MAXVALUE)", (1714953600, None)),
+        ("DEFAULT", None),
+    ],
+)
+def test_parse_partition_bound(
+    bound: str, expected: tuple[float | None, float | None] | None
+) -> None:
+    """Test parsing PostgreSQL partition bound expressions."""
+    assert parse_partition_bound(bound) == expected
+
+
+def test_partitioning_supported() -> None:
+    """Test only PostgreSQL supports partitioning."""
+    assert partitioning_supported(SupportedDialect.POSTGRESQL)
+    assert not partitioning_supported(SupportedDialect.MYSQL)
+    assert not partitioning_supported(SupportedDialect.SQLITE)
+    assert not partitioning_supported(None)
+
+
+def test_config_schema_partition_interval() -> None:
+    """Test the partition interval is validated."""
+    config = CONFIG_SCHEMA({DOMAIN: {"db_partition_interval": "week"}})
+    assert config[DOMAIN]["db_partition_interval"] is PartitionInterval.WEEK
+    with pytest.raises(vol.Invalid):
+        CONFIG_SCHEMA({DOMAIN: {"db_partition_interval": "month"}})
+
+
+async def test_purge_drops_expired_partitions(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test purging drops the partitions older than the cutoff first."""
+    await async_wait_recording_done(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    with (
+        patch.object(recorder_mock, "partitioned_tables", {TABLE_STATES, TABLE_EVENTS}),
+        patch(
+            "homeassistant.components.recorder.purge.drop_partitions_before",
+            return_value={1, 2},
+        ) as drop_mock,
+        patch(
+            "homeassistant.components.recorder.purge._purge_unused_attributes_ids"
+        ) as purge_attributes_mock,
+        patch(
+            "homeassistant.components.recorder.purge._purge_unused_data_ids"
+        ) as purge_data_mock,
+    ):
+        assert await recorder_mock.async_add_executor_job(
+            purge_old_data, recorder_mock, purge_before, False
+        )
+
+    assert {call.args[2] for call in drop_mock.mock_calls} == {
+        TABLE_STATES,
+        TABLE_EVENTS,
+    }
+    assert all(call.args[3] == purge_before for call in drop_mock.mock_calls)
+    assert any(call.args[2] == {1, 2} for call in purge_attributes_mock.mock_calls)
+    assert any(call.args[2] == {1, 2} for call in purge_data_mock.mock_calls)
+
+
+def _insert_state(session: Session, when: datetime, old_state_id: int | None) -> int:
+    """Insert a state row and return its id."""
+    return session.execute(
+        text(
+            "INSERT INTO states (state, last_updated_ts, old_state_id) "
+            "VALUES ('on', :ts, :old_state_id) RETURNING state_id"
+        ),
+        {"ts": when.timestamp(), "old_state_id": old_state_id},
+    ).scalar_one()
+
+
+@pytest.mark.skip_on_db_engine(["mysql", "sqlite"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+async def test_convert_create_and_drop_partitions(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test converting the tables, creating and dropping partitions on PostgreSQL."""
+    hass.states.async_set("sensor.test", "1")
+    await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.test", "2")
+    await async_wait_recording_done(hass)
+    now = dt_util.utcnow()
+    today = partition_start(PartitionInterval.DAY, now)
+
+    def _convert() -> None:
+        recorder_mock.partitioned_tables = migrate_to_partitioned_tables(
+            recorder_mock, recorder_mock.get_session, PartitionInterval.DAY
+        )
+
+    await recorder_mock.async_add_executor_job(_convert)
+    assert recorder_mock.partitioned_tables == set(PARTITIONED_TABLES)
+
+    # New rows are written to the partitioned tables
+    hass.states.async_set("sensor.test", "3")
+    await async_wait_recording_done(hass)
+
+    def _check_converted() -> None:
+        with session_scope(session=recorder_mock.get_session()) as session:
+            assert get_partitioned_tables(session) == set(PARTITIONED_TABLES)
+            for table in PARTITIONED_TABLES:
+                partitions = get_partitions(session, table)
+                # The legacy partition holds the rows of today
+                assert partitions[0] == (
+                    f"{table}_legacy",
+                    None,
+                    (today + timedelta(days=1)).timestamp(),
+                )
+                assert [name for name, _, _ in partitions[1:]] == [
+                    partition_name(table, today + timedelta(days=day))
+                    for day in range(1, PARTITIONS_AHEAD + 1)
+                ]
+            states = session.execute(
+                text(
+                    "SELECT state, old_state_id IS NOT NULL FROM states "
+                    "WHERE metadata_id IS NOT NULL ORDER BY state_id"
+                )
+            ).all()
+            assert states == [("1", False), ("2", True), ("3", True)]
+            # The self reference of old_state_id was dropped from the legacy table
+            assert not session.execute(
+                text(
+                    "SELECT conname FROM pg_constraint WHERE contype = 'f' "
+                    "AND confrelid = CAST('states_legacy' AS regclass)"
+                )
+            ).all()
+
+    await recorder_mock.async_add_executor_job(_check_converted)
+
+    tomorrow = today + timedelta(days=1)
+    day_after = today + timedelta(days=2)
+
+    def _drop_partitions() -> None:
+        with session_scope(session=recorder_mock.get_session()) as session:
+            old_id = _insert_state(session, tomorrow + timedelta(hours=1), None)
+            new_id = _insert_state(session, day_after + timedelta(hours=1), old_id)
+        with session_scope(session=recorder_mock.get_session()) as session:
+            drop_partitions_before(
+                recorder_mock, session, TABLE_STATES, day_after + timedelta(hours=2)
+            )
+        with session_scope(session=recorder_mock.get_session()) as session:
+            assert [name for name, _, _ in get_partitions(session, TABLE_STATES)] == [
+                partition_name(TABLE_STATES, day_after + timedelta(days=day))
+                for day in range(PARTITIONS_AHEAD - 1)
+            ]
+            # The remaining state no longer points at the dropped state
+            assert session.execute(
+                text("SELECT state_id, old_state_id FROM states")
+            ).all() == [(new_id, None)]
+            create_partitions(
+                session, TABLE_STATES, PartitionInterval.DAY, now + timedelta(days=3)
+            )
+            assert len(get_partitions(session, TABLE_STATES)) == PARTITIONS_AHEAD + 2
+
+    await recorder_mock.async_add_executor_job(_drop_partitions)
+
+    # A follow up purge drops the expired partitions of the other tables
+    # and deletes the rows of the partition straddling the cutoff
+    assert await recorder_mock.async_add_executor_job(
+        purge_old_data, recorder_mock, day_after + timedelta(hours=2), False
+    )
+
+    def _check_purged() -> None:
+        with session_scope(session=recorder_mock.get_session()) as session:
+            assert not session.execute(text("SELECT state_id FROM states")).all()
+            for table in (TABLE_EVENTS, TABLE_STATISTICS_SHORT_TERM):
+                assert get_partitions(session, table)[0][0] == partition_name(
+                    table, day_after
+                )
+
+    await recorder_mock.async_add_executor_job(_check_purged)
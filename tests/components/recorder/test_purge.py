@@ -25,8 +25,19 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
-from homeassistant.components.recorder.queries import select_event_type_ids
+from homeassistant.components.recorder.purge import (
+    DEFAULT_EVENTS_BATCHES_PER_PURGE,
+    DEFAULT_STATES_BATCHES_PER_PURGE,
+    PURGE_BACKLOG_YIELD_THRESHOLD,
+    PURGE_MAX_BATCH_SIZE_FACTOR,
+    PURGE_TARGET_PASS_DURATION,
+    PurgeScheduler,
+    purge_old_data,
+)
+from homeassistant.components.recorder.queries import (
+    find_oldest_state,
+    select_event_type_ids,
+)
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
     SERVICE_PURGE_ENTITIES,
@@ -110,6 +121,73 @@ async def test_purge_big_database(hass: HomeAssistant, recorder_mock: Recorder)
             assert state_attributes.count() == 1
 
 
+def test_purge_scheduler_adapts_batch_sizes() -> None:
+    """Test the purge scheduler adapts batch sizes to latency and backlog."""
+    scheduler = PurgeScheduler()
+    assert scheduler.states_batch_size == DEFAULT_STATES_BATCHES_PER_PURGE
+    assert scheduler.events_batch_size == DEFAULT_EVENTS_BATCHES_PER_PURGE
+
+    scheduler.record_batches(PURGE_TARGET_PASS_DURATION * 2)
+    scheduler.finish_pass(0, False)
+    assert scheduler.states_batch_size == DEFAULT_STATES_BATCHES_PER_PURGE // 2
+    assert scheduler.events_batch_size == DEFAULT_EVENTS_BATCHES_PER_PURGE // 2
+    assert scheduler.last_pass_duration == PURGE_TARGET_PASS_DURATION * 2
+
+    scheduler.record_batches(0)
+    scheduler.finish_pass(PURGE_BACKLOG_YIELD_THRESHOLD, False)
+    assert scheduler.states_batch_size == 1
+    assert scheduler.events_batch_size == 1
+
+    # A pass failing before the batches were purged keeps the batch sizes
+    scheduler.finish_pass(0, False)
+    assert scheduler.states_batch_size == 1
+    assert scheduler.events_batch_size == 1
+
+    # Fast passes grow the batch sizes above the defaults up to a bound
+    for _ in range(20):
+        scheduler.record_batches(0)
+        scheduler.finish_pass(0, False)
+    assert (
+        scheduler.states_batch_size
+        == DEFAULT_STATES_BATCHES_PER_PURGE * PURGE_MAX_BATCH_SIZE_FACTOR
+    )
+    assert (
+        scheduler.events_batch_size
+        == DEFAULT_EVENTS_BATCHES_PER_PURGE * PURGE_MAX_BATCH_SIZE_FACTOR
+    )
+    assert scheduler.passes == 23
+
+
+async def test_purge_scheduler_progress(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the purge scheduler tracks progress across passes."""
+    await _add_test_states(hass)
+    scheduler = recorder_mock.purge_scheduler
+    assert not scheduler.in_progress
+    assert scheduler.progress is None
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    def _start_pass() -> None:
+        with session_scope(hass=hass, read_only=True) as session:
+            scheduler.start_pass(session, purge_before)
+
+    await recorder_mock.async_add_executor_job(_start_pass)
+    assert scheduler.in_progress
+    assert scheduler.progress == 0.0
+    assert scheduler.estimated_time_remaining is None
+
+    await hass.services.async_call(RECORDER_DOMAIN, SERVICE_PURGE, {"keep_days": 4})
+    await async_recorder_block_till_done(hass)
+    await async_wait_purge_done(hass)
+
+    assert not scheduler.in_progress
+    assert scheduler.passes >= 1
+    assert scheduler.last_pass_duration is not None
+    assert scheduler.as_dict()["in_progress"] is False
+
+
 async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) -> None:
     """Test deleting old states."""
     assert recorder_mock.states_manager.oldest_ts is None
@@ -289,6 +367,57 @@ async def test_purge_old_states_encounters_temporary_mysql_error(
     assert sleep_mock.called
 
 
+async def test_purge_progress_encounters_temporary_mysql_error(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test finding the oldest state for the purge progress is retried."""
+    await _add_test_states(hass)
+    await async_wait_recording_done(hass)
+
+    mysql_exception = OperationalError("statement", {}, [])
+    mysql_exception.orig = Exception(1205, "retryable")
+
+    with (
+        patch("homeassistant.components.recorder.util.time.sleep") as sleep_mock,
+        patch(
+            "homeassistant.components.recorder.purge.find_oldest_state",
+            side_effect=[mysql_exception, find_oldest_state()],
+        ),
+        patch.object(recorder_mock.engine.dialect, "name", "mysql"),
+    ):
+        await hass.services.async_call(RECORDER_DOMAIN, SERVICE_PURGE, {"keep_days": 0})
+        await hass.async_block_till_done()
+        await async_wait_recording_done(hass)
+        await async_wait_recording_done(hass)
+
+    assert "retrying" in caplog.text
+    assert sleep_mock.called
+    assert recorder_mock.purge_scheduler.passes == 2
+    assert not recorder_mock.purge_scheduler.in_progress
+
+
+async def test_purge_progress_finished_on_unexpected_error(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the purge progress is finished when the purge raises."""
+    await _add_test_states(hass)
+    await async_wait_recording_done(hass)
+
+    with patch(
+        "homeassistant.components.recorder.purge._purge_old_recorder_runs",
+        side_effect=ValueError("boom"),
+    ):
+        await hass.services.async_call(RECORDER_DOMAIN, SERVICE_PURGE, {"keep_days": 0})
+        await hass.async_block_till_done()
+        await async_wait_recording_done(hass)
+        await async_wait_recording_done(hass)
+
+    assert recorder_mock.purge_scheduler.passes == 1
+    assert not recorder_mock.purge_scheduler.in_progress
+
+
 @pytest.mark.usefixtures("recorder_mock")
 async def test_purge_old_states_encounters_operational_error(
     hass: HomeAssistant,
@@ -2560,6 +2560,15 @@ async def test_recorder_info(
         "max_backlog": 65000,
         "migration_in_progress": False,
         "migration_is_live": False,
+        "purge": {
+            "estimated_time_remaining": None,
+            "events_batch_size": 15,
+            "in_progress": False,
+            "last_pass_duration": None,
+            "passes": 0,
+            "progress": None,
+            "states_batch_size": 20,
+        },
         "recording": True,
         "thread_running": True,
     }
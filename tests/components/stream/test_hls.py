@@ -2,6 +2,7 @@
 
 from datetime import timedelta
 from http import HTTPStatus
+from io import SEEK_END
 from unittest.mock import patch
 from urllib.parse import urlparse
 
@@ -432,6 +433,43 @@ async def test_hls_max_segments(
     await stream.stop()
 
 
+async def test_hls_segment_from_parts(
+    hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
+) -> None:
+    """Test segments are served from their parts and released on stop."""
+    stream = create_stream(hass, STREAM_SOURCE, {}, dynamic_stream_settings())
+    stream_worker_sync.pause()
+    hls = stream.add_provider(HLS_PROVIDER)
+
+    hls_client = await hls_stream(stream)
+
+    segment = Segment(sequence=0, init=INIT_BYTES, duration=SEGMENT_DURATION)
+    segment.parts = [
+        Part(duration=SEGMENT_DURATION / 2, has_keyframe=True, data=FAKE_PAYLOAD),
+        Part(duration=SEGMENT_DURATION / 2, has_keyframe=False, data=b"-more"),
+    ]
+    hls.put(segment)
+    await hass.async_block_till_done()
+
+    segment_response = await hls_client.get("/segment/0.m4s")
+    assert segment_response.status == HTTPStatus.OK
+    assert await segment_response.read() == FAKE_PAYLOAD + b"-more"
+
+    with segment.get_reader() as reader:
+        assert reader.read() == INIT_BYTES + FAKE_PAYLOAD + b"-more"
+        assert reader.seek(-len(b"-more"), SEEK_END) == len(INIT_BYTES + FAKE_PAYLOAD)
+        assert reader.read(3) == b"-mo"
+
+    assert stream.get_diagnostics()["buffer_size"] == len(
+        INIT_BYTES + FAKE_PAYLOAD + b"-more"
+    )
+
+    stream_worker_sync.resume()
+    await stream.stop()
+    assert not hls.get_segments()
+    assert "buffer_size" not in stream.get_diagnostics()
+
+
 async def test_hls_playlist_view_discontinuity(
     hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
 ) -> None:
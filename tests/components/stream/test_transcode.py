@@ -0,0 +1,157 @@
+"""The tests for the low resolution HLS rendition."""
+
+from http import HTTPStatus
+import io
+from unittest.mock import patch
+from urllib.parse import urlparse
+
+import av
+import pytest
+import voluptuous as vol
+
+from homeassistant.components.stream import CONFIG_SCHEMA, create_stream
+from homeassistant.components.stream.const import (
+    HLS_LOW_PROVIDER,
+    HLS_PROVIDER,
+    TRANSCODE_CODEC,
+)
+from homeassistant.components.stream.fmp4utils import read_init
+from homeassistant.components.stream.transcode import Transcoder, transcode_segment
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from .common import dynamic_stream_settings, generate_h264_video, remux_with_audio
+from .test_hls import HlsClient
+
+from tests.typing import ClientSessionGenerator
+
+TRANSCODE_CONFIG = {
+    "stream": {
+        "ll_hls": False,
+        "transcode": {"height": 160, "bitrate": 200000},
+    }
+}
+
+
+@pytest.fixture
+def hls_stream(hass: HomeAssistant, hass_client: ClientSessionGenerator):
+    """Create test fixture for creating an HLS client for a stream."""
+
+    async def create_client_for_stream(stream):
+        http_client = await hass_client()
+        parsed_url = urlparse(stream.endpoint_url(HLS_PROVIDER))
+        return HlsClient(http_client, parsed_url)
+
+    return create_client_for_stream
+
+
+def _fragment(source: io.BytesIO) -> tuple[bytes, bytes]:
+    """Remux a video to fragmented mp4 and split off the init."""
+    output = io.BytesIO()
+    with (
+        av.open(source) as input_container,
+        av.open(
+            output,
+            mode="w",
+            format="mp4",
+            container_options={
+                "movflags": "empty_moov+default_base_moof+frag_keyframe+skip_trailer"
+            },
+        ) as output_container,
+    ):
+        streams = {
+            stream: output_container.add_stream(template=stream)
+            for stream in input_container.streams
+        }
+        for packet in input_container.demux():
+            if packet.dts is None:
+                continue
+            packet.stream = streams[packet.stream]
+            output_container.mux(packet)
+    output.seek(0)
+    init = read_init(output)
+    output.seek(len(init))
+    return init, output.read()
+
+
+async def _async_transcode_in_executor(
+    self: Transcoder, init: bytes, data: bytes
+) -> tuple[bytes, bytes, float]:
+    """Transcode in the executor instead of a worker process."""
+    return await self._hass.async_add_executor_job(
+        transcode_segment, init, data, self.settings.height, self.settings.bitrate
+    )
+
+
+def test_transcode_segment() -> None:
+    """Test a segment is scaled down and keeps its timestamps and audio."""
+    init, data = _fragment(remux_with_audio(generate_h264_video(), "mp4", "aac"))
+
+    output_init, output_data, cpu_time = transcode_segment(init, data, 160, 200000)
+    assert cpu_time > 0
+
+    with (
+        av.open(io.BytesIO(init + data)) as source,
+        av.open(io.BytesIO(output_init + output_data)) as output,
+    ):
+        video = output.streams.video[0]
+        assert video.codec_context.name == "h264"
+        assert (video.codec_context.width, video.codec_context.height) == (240, 160)
+        assert output.streams.audio[0].codec_context.name == "aac"
+        assert output.duration == pytest.approx(source.duration, rel=0.05)
+
+
+def test_transcode_config() -> None:
+    """Test the transcode settings are validated."""
+    config = CONFIG_SCHEMA({"stream": {"transcode": {}}})
+    assert config["stream"]["transcode"] == {
+        "height": 360,
+        "bitrate": 500000,
+        "max_encoders": 2,
+    }
+    with pytest.raises(vol.Invalid):
+        CONFIG_SCHEMA({"stream": {"transcode": {"height": 1080}}})
+
+
+async def test_hls_low_rendition(
+    hass: HomeAssistant, hls_stream, stream_worker_sync, h264_video
+) -> None:
+    """Test the low resolution rendition is transcoded while it is watched."""
+    await async_setup_component(hass, "stream", TRANSCODE_CONFIG)
+    stream_worker_sync.pause()
+    stream = create_stream(hass, h264_video, {}, dynamic_stream_settings())
+
+    with patch.object(Transcoder, "async_transcode", _async_transcode_in_executor):
+        stream.add_provider(HLS_PROVIDER)
+        low = stream.add_provider(HLS_LOW_PROVIDER)
+        await stream.start()
+        hls_client = await hls_stream(stream)
+
+        master_playlist_response = await hls_client.get()
+        assert master_playlist_response.status == HTTPStatus.OK
+        master_playlist = (await master_playlist_response.text()).splitlines()
+        assert master_playlist[1] == (
+            f'#EXT-X-STREAM-INF:BANDWIDTH=240000,CODECS="{TRANSCODE_CODEC}"'
+        )
+        assert master_playlist[2] == "low/playlist.m3u8"
+        assert master_playlist[-1] == "playlist.m3u8"
+
+        playlist_response = await hls_client.get("/low/playlist.m3u8")
+        assert playlist_response.status == HTTPStatus.OK
+        playlist = await playlist_response.text()
+        segment_url = "/low/" + [line for line in playlist.splitlines() if line][-1]
+
+        init_response = await hls_client.get("/low/init.mp4")
+        assert init_response.status == HTTPStatus.OK
+        segment_response = await hls_client.get(segment_url)
+        assert segment_response.status == HTTPStatus.OK
+
+        init = await init_response.read()
+        with av.open(io.BytesIO(init + await segment_response.read())) as output:
+            assert output.streams.video[0].codec_context.height == 160
+
+        assert stream.get_diagnostics()["transcode"]["segments_transcoded"] >= 2
+
+        stream_worker_sync.resume()
+        await stream.stop()
+        assert not low.get_segments()
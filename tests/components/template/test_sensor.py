@@ -2,6 +2,7 @@
 
 from asyncio import Event
 from datetime import datetime, timedelta
+import logging
 from unittest.mock import ANY, patch
 
 import pytest
@@ -1274,6 +1275,48 @@ async def test_trigger_conditional_entity(hass: HomeAssistant) -> None:
     assert state.state == "You had enough Beer."
 
 
+@pytest.mark.parametrize(("count", "domain"), [(1, template.DOMAIN)])
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            "template": [
+                {
+                    "unique_id": "listening-test-event",
+                    "trigger": {"platform": "event", "event_type": "test_event"},
+                    "condition": [
+                        {
+                            "condition": "template",
+                            "value_template": "{{ trigger.event.data.beer >= 42 }}",
+                        }
+                    ],
+                    "sensor": [
+                        {
+                            "name": "Enough Name",
+                            "unique_id": "enough-id",
+                            "state": "You had enough Beer.",
+                        }
+                    ],
+                },
+            ],
+        },
+    ],
+)
+@pytest.mark.usefixtures("start_ha")
+async def test_trigger_conditional_entity_condition_summary(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the conditions which were not met are logged."""
+    caplog.set_level(logging.DEBUG, logger="homeassistant.components.template")
+
+    hass.bus.async_fire("test_event", {"beer": 2})
+    await hass.async_block_till_done()
+
+    assert "Conditions not met" in caplog.text
+    assert "Condition summary: None" not in caplog.text
+    assert "'result': False" in caplog.text
+
+
 @pytest.mark.parametrize(("count", "domain"), [(1, template.DOMAIN)])
 @pytest.mark.parametrize(
     "config",
@@ -9,7 +9,8 @@ from unittest.mock import patch
 import pytest
 from pytest_unordered import unordered
 
-from homeassistant.components.trace.const import DEFAULT_STORED_TRACES
+from homeassistant.components.trace.const import DATA_TRACE, DEFAULT_STORED_TRACES
+from homeassistant.components.trace.util import async_enforce_memory_budget
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import Context, CoreState, HomeAssistant, callback
 from homeassistant.helpers.typing import UNDEFINED
@@ -602,6 +603,56 @@ async def test_trace_overflow(
     assert len(_find_traces(response["result"], domain, "sun")) == 1
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_memory_budget(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, domain: str
+) -> None:
+    """Test finished traces are compressed and evicted over the memory budget."""
+    sun_config = {
+        "id": "sun",
+        "triggers": {"platform": "event", "event_type": "test_event"},
+        "actions": {"event": "some_event"},
+    }
+    moon_config = {
+        "id": "moon",
+        "triggers": {"platform": "event", "event_type": "test_event2"},
+        "actions": {"event": "another_event"},
+    }
+    await _setup_automation_or_script(hass, domain, [sun_config, moon_config])
+    client = await hass_ws_client()
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    for _ in range(3):
+        await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+    await hass.async_block_till_done()
+
+    traces = hass.data[DATA_TRACE]
+    moon_traces = traces[f"{domain}.moon"]
+    sun_traces = traces[f"{domain}.sun"]
+    assert all(trace.compressed_size for trace in moon_traces.values())
+    newest_run_id = next(reversed(moon_traces))
+
+    # Expanding a compressed trace returns the regular extended dict
+    await client.send_json_auto_id(
+        {
+            "type": "trace/get",
+            "domain": domain,
+            "item_id": "moon",
+            "run_id": newest_run_id,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["run_id"] == newest_run_id
+    assert response["result"]["state"] == "stopped"
+    assert response["result"]["trace"]
+
+    # The largest user is evicted first, the newest trace is always kept
+    async_enforce_memory_budget(hass, budget=0)
+    assert list(moon_traces) == [newest_run_id]
+    assert len(sun_traces) == 1
+
+
 @pytest.mark.parametrize(
     ("domain", "num_restored_moon_traces"), [("automation", 3), ("script", 1)]
 )
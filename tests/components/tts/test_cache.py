@@ -0,0 +1,46 @@
+"""The tests for the TTS caches."""
+
+from unittest.mock import MagicMock
+
+from homeassistant.components.tts.cache import FileCache, MemoryCache
+
+
+def test_memory_cache_evicts_least_recently_used() -> None:
+    """Test the memory cache evicts the least recently used audio over its size."""
+    cache = MemoryCache(10)
+    cache.set("a", {"filename": "a.mp3", "voice": b"aaaa", "pending": None})
+    cache.set("b", {"filename": "b.mp3", "voice": b"bbbb", "pending": None})
+    assert cache.get("a") is not None
+
+    cache.set("c", {"filename": "c.mp3", "voice": b"cccc", "pending": None})
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.size == 8
+
+    # Pending entries and the newest entry are kept
+    cache.set("d", {"filename": "d.mp3", "voice": b"", "pending": MagicMock()})
+    cache.set("e", {"filename": "e.mp3", "voice": b"e" * 20, "pending": None})
+    assert len(cache) == 2
+    assert "d" in cache
+    assert cache.size == 20
+
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_file_cache_evicts_least_recently_used() -> None:
+    """Test the file cache returns the oldest files to remove over its size."""
+    cache = FileCache(10)
+    assert cache.add("a", "a.mp3", 4) == []
+    assert cache.add("b", "b.mp3", 4) == []
+    assert cache.get("a") == "a.mp3"
+
+    assert cache.add("c", "c.mp3", 4) == ["b.mp3"]
+    assert cache.as_list() == [["a", "a.mp3", 4], ["c", "c.mp3", 4]]
+    assert cache.add("d", "d.mp3", 20) == ["a.mp3", "c.mp3"]
+    assert cache.filenames() == ["d.mp3"]
+
+    unbounded = FileCache(None)
+    unbounded.add("a", "a.mp3", 20)
+    assert unbounded.add("b", "b.mp3", 20) == []
+    assert unbounded.size == 40
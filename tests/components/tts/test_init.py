@@ -41,6 +41,7 @@ from .common import (
 
 from tests.common import (
     MockModule,
+    async_fire_time_changed,
     async_mock_service,
     mock_integration,
     mock_platform,
@@ -1134,6 +1135,201 @@ async def test_setup_cache_dir(
         await hass.async_block_till_done()
 
 
+@pytest.mark.parametrize("mock_provider", [MockProviderBoom(DEFAULT_LANG)])
+async def test_setup_cache_index(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_tts_cache_dir: Path,
+    mock_provider: MockTTSProvider,
+) -> None:
+    """Test the stored index is used for the files in the cache dir."""
+    calls = async_mock_service(hass, DOMAIN_MP, SERVICE_PLAY_MEDIA)
+
+    cache_key = "42f18378fd4393d18c8dd11d03fa9563c1e54491_en-us_-_test"
+    filename = f"{cache_key}.mp3"
+    await hass.async_add_executor_job(
+        (mock_tts_cache_dir / filename).write_bytes, b"voice"
+    )
+    hass_storage[tts.STORAGE_KEY] = {
+        "version": tts.STORAGE_VERSION,
+        "minor_version": 1,
+        "key": tts.STORAGE_KEY,
+        "data": {
+            "cache_dir": str(mock_tts_cache_dir),
+            "files": [[cache_key, filename, 5]],
+        },
+    }
+    await mock_setup(hass, mock_provider)
+
+    await hass.services.async_call(
+        tts.DOMAIN,
+        "test_say",
+        {
+            ATTR_ENTITY_ID: "media_player.something",
+            tts.ATTR_MESSAGE: "There is someone at the door.",
+        },
+        blocking=True,
+    )
+    assert len(calls) == 1
+    await get_media_source_url(hass, calls[0].data[ATTR_MEDIA_CONTENT_ID])
+    await hass.async_block_till_done()
+
+    manager = hass.data[tts.DATA_TTS_MANAGER]
+    assert manager.mem_cache.get(cache_key)["voice"] == b"voice"
+
+
+async def test_setup_cache_index_checked(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+    mock_tts_cache_dir: Path,
+    mock_provider: MockTTSProvider,
+) -> None:
+    """Test the stored index is checked against the files in the cache dir."""
+    indexed_key = f"{'1' * 40}_en-us_-_test"
+    added_key = f"{'2' * 40}_en-us_-_test"
+    removed_key = f"{'3' * 40}_en-us_-_test"
+    await hass.async_add_executor_job(
+        (mock_tts_cache_dir / f"{indexed_key}.mp3").write_bytes, b"indexed"
+    )
+    await hass.async_add_executor_job(
+        (mock_tts_cache_dir / f"{added_key}.mp3").write_bytes, b"added"
+    )
+    hass_storage[tts.STORAGE_KEY] = {
+        "version": tts.STORAGE_VERSION,
+        "minor_version": 1,
+        "key": tts.STORAGE_KEY,
+        "data": {
+            "cache_dir": str(mock_tts_cache_dir),
+            "files": [
+                [removed_key, f"{removed_key}.mp3", 7],
+                [indexed_key, f"{indexed_key}.mp3", 7],
+            ],
+        },
+    }
+    await mock_setup(hass, mock_provider)
+
+    manager = hass.data[tts.DATA_TTS_MANAGER]
+    assert removed_key not in manager.file_cache
+    assert indexed_key in manager.file_cache
+    assert added_key in manager.file_cache
+    assert manager.file_cache.size == 12
+
+    freezer.tick(tts.STORAGE_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    # Files which were not in the index are the least recently used
+    assert hass_storage[tts.STORAGE_KEY]["data"] == {
+        "cache_dir": str(mock_tts_cache_dir),
+        "files": [
+            [added_key, f"{added_key}.mp3", 5],
+            [indexed_key, f"{indexed_key}.mp3", 7],
+        ],
+    }
+
+
+async def test_missing_cache_file_generated(
+    hass: HomeAssistant,
+    mock_tts_cache_dir: Path,
+    mock_provider: MockTTSProvider,
+) -> None:
+    """Test the speech is generated again when its cached file is gone."""
+    cache_key = "42f18378fd4393d18c8dd11d03fa9563c1e54491_en-us_-_test"
+    cache_file = mock_tts_cache_dir / f"{cache_key}.mp3"
+    await hass.async_add_executor_job(cache_file.write_bytes, b"voice")
+    await mock_setup(hass, mock_provider)
+    manager = hass.data[tts.DATA_TTS_MANAGER]
+    assert cache_key in manager.file_cache
+
+    await hass.async_add_executor_job(cache_file.unlink)
+    assert await manager.async_get_tts_audio(
+        "test", "There is someone at the door."
+    ) == ("mp3", b"")
+    await hass.async_block_till_done()
+    assert await hass.async_add_executor_job(cache_file.read_bytes) == b""
+
+
+async def test_cache_index_saved(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+    mock_tts_cache_dir: Path,
+    mock_provider: MockTTSProvider,
+) -> None:
+    """Test the index of the cache dir is stored after files are added."""
+    calls = async_mock_service(hass, DOMAIN_MP, SERVICE_PLAY_MEDIA)
+    await mock_setup(hass, mock_provider)
+
+    await hass.services.async_call(
+        tts.DOMAIN,
+        "test_say",
+        {
+            ATTR_ENTITY_ID: "media_player.something",
+            tts.ATTR_MESSAGE: "There is someone at the door.",
+        },
+        blocking=True,
+    )
+    await get_media_source_url(hass, calls[0].data[ATTR_MEDIA_CONTENT_ID])
+    await hass.async_block_till_done()
+
+    freezer.tick(tts.STORAGE_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert hass_storage[tts.STORAGE_KEY]["data"] == {
+        "cache_dir": str(mock_tts_cache_dir),
+        "files": [
+            [
+                "42f18378fd4393d18c8dd11d03fa9563c1e54491_en-us_-_test",
+                "42f18378fd4393d18c8dd11d03fa9563c1e54491_en-us_-_test.mp3",
+                0,
+            ]
+        ],
+    }
+
+
+async def test_cache_max_size(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_tts_cache_dir: Path,
+    mock_provider: MockTTSProvider,
+) -> None:
+    """Test the least recently used files are removed over the maximum size."""
+    old_key = f"{'1' * 40}_en-us_-_test"
+    new_key = f"{'2' * 40}_en-us_-_test"
+    old_file = mock_tts_cache_dir / f"{old_key}.mp3"
+    new_file = mock_tts_cache_dir / f"{new_key}.mp3"
+    await hass.async_add_executor_job(old_file.write_bytes, b"old")
+    await hass.async_add_executor_job(new_file.write_bytes, b"new")
+    hass_storage[tts.STORAGE_KEY] = {
+        "version": tts.STORAGE_VERSION,
+        "minor_version": 1,
+        "key": tts.STORAGE_KEY,
+        "data": {
+            "cache_dir": str(mock_tts_cache_dir),
+            "files": [
+                [old_key, old_file.name, 1024 * 1024],
+                [new_key, new_file.name, 3],
+            ],
+        },
+    }
+    mock_integration(hass, MockModule(domain=TEST_DOMAIN))
+    mock_platform(hass, f"{TEST_DOMAIN}.{tts.DOMAIN}", MockTTS(mock_provider))
+    await async_setup_component(
+        hass,
+        tts.DOMAIN,
+        {tts.DOMAIN: {"platform": TEST_DOMAIN, tts.CONF_CACHE_MAX_SIZE: 1}},
+    )
+    await hass.async_block_till_done()
+
+    assert not await hass.async_add_executor_job(old_file.exists)
+    assert await hass.async_add_executor_job(new_file.exists)
+    manager = hass.data[tts.DATA_TTS_MANAGER]
+    assert old_key not in manager.file_cache
+    assert manager.file_cache.size == 3
+
+
 class MockProviderEmpty(MockTTSProvider):
     """Mock provider with empty get_tts_audio."""
 
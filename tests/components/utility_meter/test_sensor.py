@@ -1,6 +1,6 @@
 """The tests for the utility_meter sensor platform."""
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 
 from freezegun import freeze_time
 import pytest
@@ -24,6 +24,7 @@ from homeassistant.components.utility_meter.const import (
     SERVICE_CALIBRATE_METER,
     SERVICE_RESET,
 )
+from homeassistant.components.utility_meter.engine import async_get_engine
 from homeassistant.components.utility_meter.sensor import (
     ATTR_LAST_RESET,
     ATTR_STATUS,
@@ -1862,6 +1863,107 @@ async def test_no_reset_yearly_offset(hass: HomeAssistant) -> None:
     )
 
 
+async def test_shared_source_and_reset(hass: HomeAssistant) -> None:
+    """Test meters of the same source and cycle share a listener and a timer."""
+    config = {
+        "utility_meter": {
+            "energy_bill": {"source": "sensor.energy", "cycle": "daily"},
+            "energy_bill_tariffs": {
+                "source": "sensor.energy",
+                "cycle": "daily",
+                "tariffs": ["peak", "offpeak"],
+            },
+            "energy_monthly": {"source": "sensor.energy", "cycle": "monthly"},
+        }
+    }
+    now = dt_util.parse_datetime("2017-12-31T23:59:00.000000+00:00")
+    with freeze_time(now):
+        assert await async_setup_component(hass, DOMAIN, config)
+        await hass.async_block_till_done()
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        hass.states.async_set(
+            "sensor.energy", 1, {ATTR_UNIT_OF_MEASUREMENT: UnitOfEnergy.KILO_WATT_HOUR}
+        )
+        await hass.async_block_till_done()
+        hass.states.async_set(
+            "sensor.energy", 3, {ATTR_UNIT_OF_MEASUREMENT: UnitOfEnergy.KILO_WATT_HOUR}
+        )
+        await hass.async_block_till_done()
+
+    engine = async_get_engine(hass)
+    # The paused offpeak tariff does not collect the source
+    assert len(engine._trackers["sensor.energy"]._callbacks) == 3
+    assert len(engine._reset_groups) == 2
+    for entity_id in (
+        "sensor.energy_bill",
+        "sensor.energy_bill_tariffs_peak",
+        "sensor.energy_monthly",
+    ):
+        assert hass.states.get(entity_id).state == "2"
+
+    now += timedelta(minutes=1)
+    with freeze_time(now):
+        async_fire_time_changed(hass, now)
+        await hass.async_block_till_done()
+
+    for entity_id in (
+        "sensor.energy_bill",
+        "sensor.energy_bill_tariffs_peak",
+        "sensor.energy_monthly",
+    ):
+        state = hass.states.get(entity_id)
+        assert state.state == "0"
+        assert state.attributes["last_period"] == "2"
+    assert (
+        hass.states.get("sensor.energy_bill").attributes["next_reset"]
+        == hass.states.get("sensor.energy_bill_tariffs_peak").attributes["next_reset"]
+    )
+
+
+async def test_failing_reset_does_not_skip_other_meters(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a meter failing to reset does not keep the others from resetting."""
+    engine = async_get_engine(hass)
+    resets = []
+
+    async def _failing_reset(next_reset: datetime) -> None:
+        raise ValueError("boom")
+
+    async def _reset(next_reset: datetime) -> None:
+        resets.append(next_reset)
+
+    now = dt_util.parse_datetime("2017-12-31T23:59:00.000000+00:00")
+    with freeze_time(now):
+        next_reset, unsub_failing = engine.async_schedule_reset(
+            "0 0 * * *", _failing_reset
+        )
+        _, unsub = engine.async_schedule_reset("0 0 * * *", _reset)
+
+    with freeze_time(next_reset):
+        async_fire_time_changed(hass, next_reset)
+        await hass.async_block_till_done()
+
+    assert resets == [next_reset + timedelta(days=1)]
+    assert "Error resetting utility meter" in caplog.text
+
+    unsub_failing()
+    unsub()
+    assert not engine._reset_groups
+
+
+async def test_unused_source_tracker_is_removed(hass: HomeAssistant) -> None:
+    """Test the tracker of a source is dropped with its last meter."""
+    engine = async_get_engine(hass)
+    unsub_first = engine.async_track_source("sensor.energy", lambda *_: None)
+    unsub_second = engine.async_track_source("sensor.energy", lambda *_: None)
+
+    unsub_first()
+    assert "sensor.energy" in engine._trackers
+    unsub_second()
+    assert "sensor.energy" not in engine._trackers
+
+
 async def test_bad_offset(hass: HomeAssistant) -> None:
     """Test bad offset of meter."""
     assert not await async_setup_component(
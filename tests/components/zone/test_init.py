@@ -151,6 +151,27 @@ async def test_active_zone_skips_passive_zones_2(hass: HomeAssistant) -> None:
     assert active.entity_id == "zone.active_zone"
 
 
+async def test_active_zone_follows_zone_changes(hass: HomeAssistant) -> None:
+    """Test zones are found after they are added, moved or removed."""
+    assert await setup.async_setup_component(hass, zone.DOMAIN, {"zone": []})
+    await hass.async_block_till_done()
+    attributes = {"latitude": 32.880800, "longitude": -117.237561, "radius": 250}
+
+    hass.states.async_set("zone.moving", "0", attributes)
+    active = zone.async_active_zone(hass, 32.880800, -117.237561)
+    assert active.entity_id == "zone.moving"
+
+    hass.states.async_set(
+        "zone.moving", "0", {**attributes, "latitude": 52.370216, "longitude": 4.895168}
+    )
+    assert zone.async_active_zone(hass, 32.880800, -117.237561) is None
+    active = zone.async_active_zone(hass, 52.370216, 4.895168)
+    assert active.entity_id == "zone.moving"
+
+    hass.states.async_remove("zone.moving")
+    assert zone.async_active_zone(hass, 52.370216, 4.895168) is None
+
+
 async def test_active_zone_prefers_smaller_zone_if_same_distance(
     hass: HomeAssistant,
 ) -> None:
@@ -0,0 +1,52 @@
+"""Test the zone spatial index."""
+
+from homeassistant.components.zone.spatial_index import ZoneSpatialIndex
+from homeassistant.core import State
+
+
+def _zone(entity_id: str, latitude: float, longitude: float, radius: float) -> State:
+    return State(
+        entity_id,
+        "0",
+        {"latitude": latitude, "longitude": longitude, "radius": radius},
+    )
+
+
+def test_candidates() -> None:
+    """Test only the zones near a location are candidates."""
+    index = ZoneSpatialIndex()
+    index.async_update(_zone("zone.home", 32.87, -117.22, 100))
+    index.async_update(_zone("zone.work", 32.9, -117.2, 500))
+    index.async_update(_zone("zone.far", 52.0, 4.0, 100))
+    index.async_update(_zone("zone.world", 0.0, 0.0, 10_000_000))
+    index.async_update(_zone("zone.polar", 89.0, 0.0, 100))
+    index.async_update(State("zone.invalid", "0", {"latitude": "abc"}))
+
+    unindexed = ["zone.invalid", "zone.polar", "zone.world"]
+    assert index.async_candidates(32.87, -117.22, 0) == sorted(
+        ["zone.home", "zone.work", *unindexed]
+    )
+    assert index.async_candidates(52.0, 4.0, 10) == sorted(["zone.far", *unindexed])
+    assert index.async_candidates(10.0, 10.0, 10) == unindexed
+    # Searches which are too large return all zones
+    assert len(index.async_candidates(10.0, 10.0, 10_000_000)) == 6
+
+    # Zones are reindexed when they move
+    index.async_update(_zone("zone.far", 10.0, 10.0, 100))
+    assert index.async_candidates(52.0, 4.0, 10) == unindexed
+    assert index.async_candidates(10.0, 10.0, 10) == sorted(["zone.far", *unindexed])
+
+    for entity_id in ("zone.home", "zone.work", "zone.far", *unindexed):
+        index.async_remove(entity_id)
+    index.async_remove("zone.home")
+    assert index.async_candidates(10.0, 10.0, 10) == []
+    assert index._cells == {}
+
+
+def test_antimeridian() -> None:
+    """Test zones crossing the antimeridian are found from both sides."""
+    index = ZoneSpatialIndex()
+    index.async_update(_zone("zone.fiji", -17.0, 179.999, 1000))
+
+    assert index.async_candidates(-17.0, -179.999, 0) == ["zone.fiji"]
+    assert index.async_candidates(-17.0, 179.99, 0) == ["zone.fiji"]
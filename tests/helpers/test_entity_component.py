@@ -138,14 +138,16 @@ async def test_set_scan_interval_via_config(hass: HomeAssistant) -> None:
 
     component = EntityComponent(_LOGGER, DOMAIN, hass)
 
-    with patch.object(hass.loop, "call_later") as mock_track:
+    with patch(
+        "homeassistant.helpers.polling.PollingScheduler.async_schedule"
+    ) as mock_track:
         component.setup(
             {DOMAIN: {"platform": "platform", "scan_interval": timedelta(seconds=30)}}
         )
 
         await hass.async_block_till_done()
     assert mock_track.called
-    assert mock_track.call_args[0][0] == 30.0
+    assert mock_track.call_args[0][1] == 30.0
 
 
 async def test_set_entity_namespace_via_config(hass: HomeAssistant) -> None:
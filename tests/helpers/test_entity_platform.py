@@ -236,12 +236,14 @@ async def test_set_scan_interval_via_platform(hass: HomeAssistant) -> None:
 
     component = EntityComponent(_LOGGER, DOMAIN, hass)
 
-    with patch.object(hass.loop, "call_later") as mock_track:
+    with patch(
+        "homeassistant.helpers.polling.PollingScheduler.async_schedule"
+    ) as mock_track:
         await component.async_setup({DOMAIN: {"platform": "platform"}})
 
         await hass.async_block_till_done()
     assert mock_track.called
-    assert mock_track.call_args[0][0] == 30.0
+    assert mock_track.call_args[0][1] == 30.0
 
 
 async def test_adding_entities_with_generator_and_thread_callback(
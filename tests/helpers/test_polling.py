@@ -0,0 +1,123 @@
+"""Test the polling scheduler helper."""
+
+from datetime import timedelta
+from unittest.mock import Mock
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.polling import (
+    MAX_STRETCH,
+    STRETCH_FACTOR,
+    SUSTAINED_LAG_POLLS,
+    async_get_polling_scheduler,
+    async_get_polling_stats,
+)
+import homeassistant.util.dt as dt_util
+
+from tests.common import async_fire_time_changed
+
+
+async def test_polls_are_spread(hass: HomeAssistant) -> None:
+    """Test platforms with the same interval poll at a stable phase."""
+    scheduler = async_get_polling_scheduler(hass)
+    assert async_get_polling_scheduler(hass) is scheduler
+    now = hass.loop.time()
+
+    jobs = [scheduler.async_schedule(f"sensor.{i}", 30, Mock()) for i in range(10)]
+    first_polls = [job._handle.when() - now for job in jobs]
+    assert all(0 < delay <= 30 for delay in first_polls)
+    assert len({round(delay, 3) for delay in first_polls}) > 1
+
+    # The phase only depends on the key
+    again = scheduler.async_schedule("sensor.0", 30, Mock())
+    assert (again._handle.when() - jobs[0]._handle.when()) % 30 < 0.01
+    assert len(scheduler.async_get_stats()) == 11
+
+    for job in (*jobs, again):
+        job.cancel()
+    assert scheduler.async_get_stats() == []
+
+
+async def test_poll_and_stats(hass: HomeAssistant) -> None:
+    """Test the callback is called every interval and the stats."""
+    scheduler = async_get_polling_scheduler(hass)
+    poll = Mock()
+    job = scheduler.async_schedule("light.test", 10, poll)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    assert len(poll.mock_calls) == 1
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    assert len(poll.mock_calls) == 2
+
+    job.async_record_poll(0.5)
+    job.async_record_poll(0.2)
+    job.async_record_overrun()
+    assert scheduler.async_get_stats() == [
+        {
+            "platform": "light.test",
+            "interval": 10,
+            "polls": 2,
+            "overruns": 1,
+            "last_duration": 0.2,
+            "max_duration": 0.5,
+        }
+    ]
+
+    job.cancel()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=30))
+    assert len(poll.mock_calls) == 2
+
+
+async def test_stretch_on_lag(hass: HomeAssistant) -> None:
+    """Test the intervals are stretched while polls keep starting late."""
+    scheduler = async_get_polling_scheduler(hass)
+
+    scheduler.async_record_lag(0.1)
+    assert scheduler.stretch == 1.0
+    # A single late poll does not stretch the intervals
+    scheduler.async_record_lag(30)
+    scheduler.async_record_lag(0.1)
+    assert scheduler.stretch == 1.0
+    for _ in range(SUSTAINED_LAG_POLLS - 1):
+        scheduler.async_record_lag(5)
+    assert scheduler.stretch == 1.0
+    scheduler.async_record_lag(5)
+    assert scheduler.stretch == STRETCH_FACTOR
+    for _ in range(10 * SUSTAINED_LAG_POLLS):
+        scheduler.async_record_lag(5)
+    assert scheduler.stretch == MAX_STRETCH
+
+    job = scheduler.async_schedule("switch.test", 10, Mock())
+    when = job._handle.when()
+    job._handle.cancel()
+    job._async_run(when)
+    # A single poll on time does not restore the intervals
+    assert scheduler.stretch == MAX_STRETCH
+    assert job._handle.when() == when + 10 * MAX_STRETCH
+    job.cancel()
+    assert job._handle is None
+
+    for _ in range(SUSTAINED_LAG_POLLS - 1):
+        scheduler.async_record_lag(0)
+    assert scheduler.stretch == MAX_STRETCH / STRETCH_FACTOR
+    for _ in range(10 * SUSTAINED_LAG_POLLS):
+        scheduler.async_record_lag(0)
+    assert scheduler.stretch == 1.0
+
+
+async def test_polling_stats(hass: HomeAssistant) -> None:
+    """Test getting the poll statistics."""
+    assert async_get_polling_stats(hass) is None
+
+    job = async_get_polling_scheduler(hass).async_schedule("light.test", 10, Mock())
+    assert async_get_polling_stats(hass) == [
+        {
+            "platform": "light.test",
+            "interval": 10,
+            "polls": 0,
+            "overruns": 0,
+            "last_duration": 0.0,
+            "max_duration": 0.0,
+        }
+    ]
+    job.cancel()
+    assert async_get_polling_stats(hass) == []
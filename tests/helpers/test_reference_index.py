@@ -0,0 +1,32 @@
+"""Test the reference index helper."""
+
+from homeassistant.helpers.reference_index import ReferenceIndex
+
+
+def test_reference_index() -> None:
+    """Test items are indexed and removed per kind of reference."""
+    index: ReferenceIndex[str] = ReferenceIndex()
+
+    index.async_add(
+        "automation.a",
+        {"entities": {"light.a", "light.b"}, "blueprint": (None,), "areas": set()},
+    )
+    index.async_add("automation.b", {"entities": ["light.b"], "blueprint": ("x",)})
+
+    assert index.async_get("entities", "light.a") == ["automation.a"]
+    assert index.async_get("entities", "light.b") == ["automation.a", "automation.b"]
+    assert index.async_get("blueprint", "x") == ["automation.b"]
+    assert index.async_get("areas", "kitchen") == []
+    assert index.async_get("devices", "abc") == []
+
+    # Adding an item again replaces its references
+    index.async_add("automation.a", {"entities": {"light.c"}})
+    assert index.async_get("entities", "light.a") == []
+    assert index.async_get("entities", "light.b") == ["automation.b"]
+    assert index.async_get("entities", "light.c") == ["automation.a"]
+
+    index.async_remove("automation.b")
+    index.async_remove("automation.b")
+    assert index.async_get("entities", "light.b") == []
+    assert index.async_get("blueprint", "x") == []
+    assert index._index == {"entities": {"light.c": {"automation.a": None}}}
@@ -41,11 +41,12 @@ from homeassistant.helpers import (
     service,
 )
 import homeassistant.helpers.config_validation as cv
-from homeassistant.loader import async_get_integration
+from homeassistant.loader import DATA_COMPONENTS, async_get_integration
 from homeassistant.setup import async_setup_component
 from homeassistant.util.yaml.loader import parse_yaml
 
 from tests.common import (
+    MockConfigEntry,
     MockEntity,
     MockModule,
     MockUser,
@@ -1277,6 +1278,73 @@ async def test_register_with_mixed_case(hass: HomeAssistant) -> None:
     assert descriptions[DOMAIN_LOGGER]["new_service"]["description"] == "new service"
 
 
+async def test_call_grouped_by_platform(hass: HomeAssistant) -> None:
+    """Test polling entities are refreshed when the calls of their platform are done."""
+    slow = MockEntity(entity_id="light.slow", available=True, should_poll=False)
+    fast = MockEntity(entity_id="light.fast", available=True, should_poll=True)
+    slow.platform = Mock()
+    fast.platform = Mock()
+    refreshed = asyncio.Event()
+    fast.async_update_ha_state = AsyncMock(side_effect=lambda _: refreshed.set())
+    release = asyncio.Event()
+
+    async def mock_service(entity: MockEntity, call: ServiceCall) -> None:
+        if entity is slow:
+            await release.wait()
+
+    task = hass.async_create_task(
+        service.entity_service_call(
+            hass,
+            {"light.slow": slow, "light.fast": fast},
+            HassJob(mock_service),
+            ServiceCall(hass, "test_domain", "test_service", {"entity_id": "all"}),
+        )
+    )
+    async with asyncio.timeout(1):
+        await refreshed.wait()
+    assert not task.done()
+
+    release.set()
+    assert await task is None
+
+
+async def test_call_limited_per_hub(hass: HomeAssistant) -> None:
+    """Test the parallel service calls of a hub are limited across platforms."""
+    entry = MockConfigEntry(domain="test_hub")
+    hass.data[DATA_COMPONENTS]["test_hub"] = Mock(PARALLEL_SERVICE_CALLS=2)
+    entities = {}
+    for domain in ("light", "switch"):
+        platform = Mock(config_entry=entry)
+        for idx in range(3):
+            entity = MockEntity(
+                entity_id=f"{domain}.hub_{idx}", available=True, should_poll=False
+            )
+            entity.platform = platform
+            entities[entity.entity_id] = entity
+    running = 0
+    max_running = 0
+
+    async def mock_service(entity: MockEntity, call: ServiceCall) -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+
+    await service.entity_service_call(
+        hass,
+        entities,
+        HassJob(mock_service),
+        ServiceCall(hass, "test_domain", "test_service", {"entity_id": "all"}),
+    )
+    assert max_running == 2
+
+    # The semaphore is removed when the hub is unloaded
+    assert entry.entry_id in hass.data[service.HUB_SERVICE_CALL_SEMAPHORES]
+    await entry._async_process_on_unload(hass)
+    assert entry.entry_id not in hass.data[service.HUB_SERVICE_CALL_SEMAPHORES]
+
+
 async def test_call_with_required_features(hass: HomeAssistant, mock_entities) -> None:
     """Test service calls invoked only if entity has required features."""
     # Set up homeassistant component to fetch the translations
@@ -0,0 +1,131 @@
+"""Test the state reporter helper."""
+
+from datetime import timedelta
+import logging
+from unittest.mock import AsyncMock
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.state_reporter import MAX_ATTEMPTS, StateReporter
+import homeassistant.util.dt as dt_util
+
+from tests.common import async_fire_time_changed
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _sent(send: AsyncMock) -> list[dict[str, set]]:
+    """Return the changed properties of each batch sent."""
+    return [
+        {entity_id: report.changed for entity_id, report in call.args[0].items()}
+        for call in send.mock_calls
+    ]
+
+
+async def test_batch_and_delta(hass: HomeAssistant) -> None:
+    """Test changes are batched per window and only changed properties marked."""
+    send = AsyncMock(return_value=set())
+    reporter: StateReporter[str] = StateReporter(
+        hass, _LOGGER, name="test", window=1, send=send
+    )
+
+    assert reporter.async_report("light.a", "a1", {"on": True, "brightness": 10})
+    assert reporter.async_report("light.b", "b1", {"on": False})
+    await hass.async_block_till_done()
+    assert send.mock_calls == []
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert _sent(send) == [{"light.a": {"on", "brightness"}, "light.b": {"on"}}]
+
+    send.reset_mock()
+    assert reporter.async_report("light.a", "a2", {"on": True, "brightness": 20})
+    assert reporter.async_report("light.a", "a3", {"on": True, "brightness": 30})
+    # Unchanged since the last report
+    assert not reporter.async_report("light.b", "b2", {"on": False})
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert _sent(send) == [{"light.a": {"brightness"}}]
+    assert send.mock_calls[0].args[0]["light.a"].data == "a3"
+
+    assert not reporter.async_report("light.a", "a4", {"on": True, "brightness": 30})
+    assert reporter.async_report(
+        "light.a", "a5", {"on": True, "brightness": 30}, force=True
+    )
+    reporter.async_shutdown()
+    assert not reporter.async_report("light.a", "a6", {"on": False, "brightness": 0})
+    assert reporter.async_diagnostics() == {
+        "batches_sent": 2,
+        "reports_sent": 3,
+        "skipped": 2,
+        "undelivered": 0,
+        "dropped": 0,
+        "backoff": 0,
+        "pending": 0,
+    }
+
+
+async def test_undelivered_retried(hass: HomeAssistant) -> None:
+    """Test reports which were not delivered are retried with a growing delay."""
+    send = AsyncMock(side_effect=[{"sensor.a"}, {"sensor.a", "sensor.b"}, set()])
+    reporter: StateReporter[str] = StateReporter(
+        hass, _LOGGER, name="test", window=1, send=send
+    )
+
+    reporter.async_report("sensor.a", "a1", {"value": 1})
+    reporter.async_report("sensor.c", "c1", {"value": 1})
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert _sent(send) == [{"sensor.a": {"value"}, "sensor.c": {"value"}}]
+    assert reporter.backoff == 1
+
+    # A newer state is merged with the one which was not delivered
+    reporter.async_report("sensor.b", "b1", {"value": 1})
+    # The delivered state is not sent again
+    assert not reporter.async_report("sensor.c", "c2", {"value": 1})
+    await hass.async_block_till_done()
+    assert len(send.mock_calls) == 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await hass.async_block_till_done()
+    assert _sent(send)[-1] == {"sensor.a": {"value"}, "sensor.b": {"value"}}
+    assert reporter.backoff == 2
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=15))
+    await hass.async_block_till_done()
+    assert _sent(send)[-1] == {"sensor.a": {"value"}, "sensor.b": {"value"}}
+    assert reporter.backoff == 0
+    assert reporter.async_diagnostics() == {
+        "batches_sent": 3,
+        "reports_sent": 3,
+        "skipped": 1,
+        "undelivered": 3,
+        "dropped": 0,
+        "backoff": 0,
+        "pending": 0,
+    }
+
+    # Delivered states are not reported again
+    assert not reporter.async_report("sensor.a", "a2", {"value": 1})
+    assert not reporter.async_report("sensor.b", "b2", {"value": 1})
+
+
+async def test_undelivered_dropped(hass: HomeAssistant) -> None:
+    """Test a report is dropped when it keeps failing."""
+    send = AsyncMock(return_value={"sensor.a"})
+    reporter: StateReporter[str] = StateReporter(
+        hass, _LOGGER, name="test", window=0, send=send
+    )
+
+    reporter.async_report("sensor.a", "a1", {"value": 1})
+    await hass.async_block_till_done()
+    for _ in range(MAX_ATTEMPTS):
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=300))
+        await hass.async_block_till_done()
+
+    assert len(send.mock_calls) == MAX_ATTEMPTS
+    assert reporter.async_diagnostics()["dropped"] == 1
+    assert reporter.async_diagnostics()["pending"] == 0
+    # The state was never reported so it is reported again
+    assert reporter.async_report("sensor.a", "a2", {"value": 1})
+    reporter.async_shutdown()
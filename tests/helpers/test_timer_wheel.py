@@ -0,0 +1,136 @@
+"""Test the timer wheel helper."""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from homeassistant.components.homeassistant import system_health
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.timer_wheel import (
+    async_enable_timer_wheel,
+    async_get_pending_timers,
+    integration_for_target,
+)
+import homeassistant.util.dt as dt_util
+
+from tests.common import async_fire_time_changed
+
+
+def _fire_until(hass: HomeAssistant, seconds: float) -> None:
+    """Fire the slots that are due, the wheel arms one slot at a time."""
+    for _ in range(5):
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=seconds))
+
+
+async def test_timers_fire_in_order(hass: HomeAssistant) -> None:
+    """Test timers scheduled on the wheel fire once due and can be cancelled."""
+    wheel = async_enable_timer_wheel(hass, 0.1)
+    fired: list[float] = []
+
+    for delay in (300, 0.5, 30, 5, 1.25):
+
+        @callback
+        def _fired(now: datetime, delay: float = delay) -> None:
+            fired.append(delay)
+
+        cancel = async_call_later(hass, delay, _fired)
+        if delay == 30:
+            cancel_30 = cancel
+
+    assert async_get_pending_timers(hass) == {"homeassistant": 5}
+
+    cancel_30()
+    cancel_30()
+    assert wheel.async_pending_by_integration() == {"homeassistant": 4}
+
+    _fire_until(hass, 2)
+    assert fired == [0.5, 1.25]
+
+    _fire_until(hass, 10)
+    assert fired == [0.5, 1.25, 5]
+
+    # Far away timers are moved to the finer levels before firing
+    _fire_until(hass, 310)
+    assert fired == [0.5, 1.25, 5, 300]
+    assert async_get_pending_timers(hass) == {}
+
+
+async def test_cancel_timer_due_in_same_pass(hass: HomeAssistant) -> None:
+    """Test a timer cancelled by a timer of the same slot does not fire."""
+    wheel = async_enable_timer_wheel(hass, 1)
+    fired: list[str] = []
+    now = hass.loop.time()
+
+    def _first() -> None:
+        fired.append("first")
+        second.cancel()
+
+    def _second() -> None:
+        fired.append("second")
+
+    first = wheel.async_call_at(now + 0.5, "homeassistant", _first)
+    second = wheel.async_call_at(now + 0.6, "homeassistant", _second)
+
+    _fire_until(hass, 2)
+    assert fired == ["first"]
+    assert not first.cancelled()
+    assert second.cancelled()
+    assert async_get_pending_timers(hass) == {}
+
+
+async def test_timer_exception_goes_to_loop_handler(hass: HomeAssistant) -> None:
+    """Test an error of a timer is reported to the loop exception handler."""
+    wheel = async_enable_timer_wheel(hass, 1)
+    fired: list[str] = []
+
+    def _fail() -> None:
+        raise ValueError("boom")
+
+    wheel.async_call_at(hass.loop.time() + 0.5, "homeassistant", _fail)
+    wheel.async_call_at(hass.loop.time() + 0.6, "homeassistant", fired.append, "ok")
+
+    with patch.object(hass.loop, "call_exception_handler") as exception_handler:
+        _fire_until(hass, 2)
+
+    assert fired == ["ok"]
+    assert len(exception_handler.mock_calls) == 1
+    context = exception_handler.mock_calls[0].args[0]
+    assert isinstance(context["exception"], ValueError)
+    assert "Exception in callback" in context["message"]
+
+
+async def test_time_interval_on_wheel(hass: HomeAssistant) -> None:
+    """Test an interval keeps rescheduling itself on the wheel."""
+    async_enable_timer_wheel(hass)
+    calls: list[datetime] = []
+
+    @callback
+    def _interval(now: datetime) -> None:
+        calls.append(now)
+
+    unsub = async_track_time_interval(
+        hass, _interval, timedelta(seconds=10), cancel_on_shutdown=True
+    )
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    assert len(calls) == 1
+    assert async_get_pending_timers(hass) == {"homeassistant": 1}
+
+    unsub()
+    assert async_get_pending_timers(hass) == {}
+
+
+async def test_pending_timers_not_enabled(hass: HomeAssistant) -> None:
+    """Test pending timers are only tracked with the wheel enabled."""
+    assert async_get_pending_timers(hass) is None
+
+
+def test_integration_for_target() -> None:
+    """Test timers are attributed to the integration of their callback."""
+    assert integration_for_target(system_health.system_health_info) == "homeassistant"
+    assert integration_for_target(dt_util.utcnow) == "homeassistant"
+    assert integration_for_target(print) == "homeassistant"
+
+    class Custom:
+        __module__ = "custom_components.my_integration.sensor"
+
+    assert integration_for_target(Custom) == "my_integration"
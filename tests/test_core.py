@@ -61,6 +61,7 @@ from homeassistant.helpers.json import json_dumps
 from homeassistant.setup import async_setup_component
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from .common import (
@@ -1117,6 +1118,23 @@ def test_state_as_compressed_state_json() -> None:
     assert state.as_compressed_state_json is as_compressed_state
 
 
+async def test_state_attributes_json_reused(hass: HomeAssistant) -> None:
+    """Test the JSON string of unchanged attributes is reused by the next state."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    state = hass.states.get("light.bowl")
+    attributes_json = state.attributes_json
+    assert attributes_json == b'{"brightness":100}'
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    new_state = hass.states.get("light.bowl")
+    assert new_state.attributes_json is attributes_json
+    assert json_loads(new_state.as_dict_json)["attributes"] == {"brightness": 100}
+    assert b'"a":{"brightness":100}' in new_state.as_compressed_state_json
+
+    hass.states.async_set("light.bowl", "on", {"brightness": 50})
+    assert hass.states.get("light.bowl").attributes_json == b'{"brightness":50}'
+
+
 async def test_eventbus_add_remove_listener(hass: HomeAssistant) -> None:
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
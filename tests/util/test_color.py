@@ -314,6 +314,37 @@ def test_gamut() -> None:
     assert not color_util.check_valid_gamut(GAMUT_INVALID_4)
 
 
+def test_cached_conversions() -> None:
+    """Test the cached conversions return the results of the conversions."""
+    for hue in range(0, 360, 15):
+        for saturation in (0, 33.3, 100):
+            rgb = color_util.color_hsv_to_RGB(hue, saturation, 100)
+            assert rgb == color_util.color_hsv_to_RGB.__wrapped__(hue, saturation, 100)
+            assert color_util.color_hsv_to_RGB(hue, saturation, 100) is rgb
+            assert color_util.color_RGB_to_hsv(
+                *rgb
+            ) == color_util.color_RGB_to_hsv.__wrapped__(*rgb)
+            xy_brightness = color_util.color_RGB_to_xy_brightness(*rgb, GAMUT)
+            assert xy_brightness == color_util.color_RGB_to_xy_brightness.__wrapped__(
+                *rgb, GAMUT
+            )
+            # Gamuts are hashable, so conversions with a gamut are cached too
+            assert color_util.color_RGB_to_xy_brightness(*rgb, GAMUT) is xy_brightness
+            assert color_util.color_rgb_to_rgbww(
+                *rgb, 2000, 6500
+            ) == color_util.color_rgb_to_rgbww.__wrapped__(*rgb, 2000, 6500)
+
+    for kelvin in range(1000, 10000, 500):
+        assert color_util.color_temperature_to_rgb(
+            kelvin
+        ) == color_util.color_temperature_to_rgb.__wrapped__(kelvin)
+
+    # Unhashable arguments are converted without the cache
+    assert color_util.color_xy_brightness_to_RGB(
+        0.5, 0.5, 255, None
+    ) == color_util.color_xy_brightness_to_RGB(0.5, 0.5, 255, [])
+
+
 def test_color_temperature_mired_to_kelvin() -> None:
     """Test color_temperature_mired_to_kelvin."""
     assert color_util.color_temperature_mired_to_kelvin(40) == 25000
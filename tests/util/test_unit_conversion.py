@@ -961,6 +961,52 @@ def test_unit_conversion_factory_allow_none(
     ) == pytest.approx(expected)
 
 
+@pytest.mark.parametrize(
+    ("converter", "value", "from_unit", "expected", "to_unit"),
+    [
+        # Process all items in _CONVERTED_VALUE
+        (converter, value, from_unit, expected, to_unit)
+        for converter, item in _CONVERTED_VALUE.items()
+        for value, from_unit, expected, to_unit in item
+    ],
+)
+def test_unit_conversion_factory_sequence(
+    converter: type[BaseUnitConverter],
+    value: float,
+    from_unit: str,
+    expected: float,
+    to_unit: str,
+) -> None:
+    """Test conversion of sequences to other units."""
+    convert = converter.converter_factory_allow_none(from_unit, to_unit)
+    values = [value, None, value * 2, 0]
+    assert converter.converter_factory_sequence(from_unit, to_unit)(values) == [
+        convert(value) for value in values
+    ]
+    assert converter.converter_factory_sequence(from_unit, to_unit)(
+        iter((value, None))
+    ) == [pytest.approx(expected), None]
+    assert converter.converter_factory_sequence(from_unit, from_unit)(values) == values
+
+
+@pytest.mark.parametrize(
+    ("converter", "valid_unit"),
+    [
+        (converter, next(iter(valid_units)))
+        for converter, valid_units in _ALL_CONVERTERS.items()
+    ],
+)
+def test_unit_conversion_factory_sequence_invalid_unit(
+    converter: type[BaseUnitConverter], valid_unit: str
+) -> None:
+    """Test exception is thrown for invalid units when converting sequences."""
+    with pytest.raises(HomeAssistantError, match="is not a recognized .* unit"):
+        converter.converter_factory_sequence(INVALID_SYMBOL, valid_unit)
+
+    with pytest.raises(HomeAssistantError, match="is not a recognized .* unit"):
+        converter.converter_factory_sequence(valid_unit, INVALID_SYMBOL)
+
+
 @pytest.mark.parametrize(
     ("value", "from_unit", "expected", "to_unit"),
     [